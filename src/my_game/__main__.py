@@ -16,13 +16,20 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from .game import Game
+import argparse
+
+from .game import Game, GameConfig
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the game.")
+    parser.add_argument("--record", help="write the session's input to a log")
+    parser.add_argument("--replay", help="replay a recorded input log headless")
+    args = parser.parse_args()
+
     try:
         game = Game()
-        game.init()
+        game.init(GameConfig(record_path=args.record, replay_path=args.replay))
         game.run()
 
     finally:
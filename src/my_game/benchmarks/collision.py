@@ -0,0 +1,147 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+
+from typing import Dict, List
+
+import pygame
+
+from ..spatial_hash import SpatialHash
+
+
+DEFAULT_COUNTS: List[int] = [1_000, 10_000, 100_000]
+DEFAULT_OUTPUT: str = "collision_benchmark_results.json"
+OBJECT_SIZE: int = 16
+# average area per object, so every run has the same density of overlaps
+AREA_PER_OBJECT: int = 40 * 40
+# above this many objects, naive checks are timed on a sample of rows and
+# extrapolated, as the full O(n^2) run would take minutes
+NAIVE_LIMIT: int = 10_000
+NAIVE_SAMPLE: int = 2_000
+
+
+def make_rects(count: int, seed: int = 0) -> List[pygame.Rect]:
+    """Scatter rects randomly over a square world.
+
+    Args:
+        count (int): Number of rects.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[pygame.Rect]: The rects.
+    """
+    rng = random.Random(seed)
+    side = int(math.sqrt(count * AREA_PER_OBJECT))
+    return [
+        pygame.Rect(rng.randrange(side), rng.randrange(side), OBJECT_SIZE, OBJECT_SIZE)
+        for _ in range(count)
+    ]
+
+
+def time_naive(rects: List[pygame.Rect]) -> Dict[str, float | bool]:
+    """Time checking every rect against every other rect.
+
+    Args:
+        rects (List[pygame.Rect]): Rects to check.
+
+    Returns:
+        Dict[str, float | bool]: Elapsed milliseconds, and whether they were
+        extrapolated from a sample of rows.
+    """
+    count = len(rects)
+    rows = count if count <= NAIVE_LIMIT else NAIVE_SAMPLE
+
+    start = time.perf_counter()
+    for i in range(rows):
+        rects[i].collidelistall(rects[i + 1 :])
+    elapsed = time.perf_counter() - start
+
+    total_checks = count * (count - 1) / 2
+    sampled_checks = sum(count - 1 - i for i in range(rows))
+    return {
+        "ms": elapsed * 1000.0 * total_checks / sampled_checks,
+        "estimated": rows < count,
+    }
+
+
+def time_spatial_hash(rects: List[pygame.Rect]) -> Dict[str, float | int]:
+    """Time building a spatial hash, enumerating overlapping pairs and moving
+    every item.
+
+    Args:
+        rects (List[pygame.Rect]): Rects to check.
+
+    Returns:
+        Dict[str, float | int]: Elapsed milliseconds per operation, and the
+        number of overlapping pairs.
+    """
+    spatial_hash = SpatialHash(cell_size=OBJECT_SIZE * 2)
+
+    start = time.perf_counter()
+    for item, rect in enumerate(rects):
+        spatial_hash.insert(item, rect)
+    built = time.perf_counter()
+    pairs = spatial_hash.pairs()
+    paired = time.perf_counter()
+    for item, rect in enumerate(rects):
+        spatial_hash.move(item, rect.move(3, 3))
+    moved = time.perf_counter()
+
+    return {
+        "build_ms": (built - start) * 1000.0,
+        "pairs_ms": (paired - built) * 1000.0,
+        "move_ms": (moved - paired) * 1000.0,
+        "pairs": len(pairs),
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line and write the results as JSON."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark spatial hash collision detection against naive checks."
+    )
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    report = {}
+    for count in args.counts:
+        rects = make_rects(count)
+        naive = time_naive(rects)
+        spatial = time_spatial_hash(rects)
+        report[count] = {"naive": naive, "spatial_hash": spatial}
+
+        estimated = " (estimated)" if naive["estimated"] else ""
+        print(
+            f"{count:>7} objects: naive {naive['ms']:.1f}ms{estimated}, "
+            f"spatial hash pairs {spatial['pairs_ms']:.1f}ms "
+            f"(build {spatial['build_ms']:.1f}ms, move {spatial['move_ms']:.1f}ms)"
+        )
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+
+from dataclasses import asdict
+from typing import Dict, List, Tuple
+
+import pygame
+
+from ..events import (
+    GAMEPLAY_PAUSE,
+    MAIN_MENU_PLAY,
+    PAUSE_MENU_GOTO_MAIN_MENU,
+    PAUSE_MENU_RESUME,
+)
+from ..game import Game, GameConfig
+from ..game_states import GameStates
+
+
+DEFAULT_FRAMES: int = 3000
+DEFAULT_OUTPUT: str = "benchmark_results.json"
+DELTA_TIME: float = 1.0 / 60.0
+PERCENTILES: Tuple[int, ...] = (50, 90, 99)
+
+# phases of the benchmark, with the event posted when the phase starts
+SCENARIO: List[Tuple[str, int | None]] = [
+    ("main_menu", None),
+    ("gameplay", MAIN_MENU_PLAY),
+    ("pause_menu", GAMEPLAY_PAUSE),
+    ("gameplay_resumed", PAUSE_MENU_RESUME),
+    ("pause_menu_again", GAMEPLAY_PAUSE),
+    ("back_to_main_menu", PAUSE_MENU_GOTO_MAIN_MENU),
+]
+
+Timings = Dict[str, List[float]]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize frame timings.
+
+    Args:
+        samples (List[float]): Timings, in milliseconds.
+
+    Returns:
+        Dict[str, float]: Mean, max and percentiles of the timings.
+    """
+    summary = {"mean": statistics.fmean(samples), "max": max(samples)}
+    if len(samples) > 1:
+        quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}"] = quantiles[percentile - 1]
+    else:
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}"] = samples[0]
+    return summary
+
+
+def run_benchmark(
+    frames: int, config: GameConfig, balls: int = 0
+) -> Dict[str, Timings]:
+    """Drive the game through `SCENARIO` without any frame cap, timing every
+    frame's update, draw and flip.
+
+    Args:
+        frames (int): Total number of frames, split evenly across the phases.
+        config (GameConfig): Options for the game. Always run headless.
+        balls (int, optional): Extra balls spawned in gameplay. Defaults to 0.
+
+    Returns:
+        Dict[str, Timings]: Timings in milliseconds, per phase.
+    """
+    config.headless = True
+
+    game = Game()
+    try:
+        game.init(config)
+        while game.state_manager.get_state() == GameStates.LOADING:
+            game.handle_events()
+            game.update(DELTA_TIME)
+        game.state_manager.get(GameStates.GAMEPLAY).spawn_balls(balls)
+
+        frames_per_phase = max(1, frames // len(SCENARIO))
+        results = {}
+        for phase, event_type in SCENARIO:
+            if event_type is not None:
+                pygame.event.post(pygame.event.Event(event_type))
+
+            timings = results[phase] = {"update": [], "draw": [], "flip": []}
+            for _ in range(frames_per_phase):
+                start = time.perf_counter()
+                game.handle_events()
+                if config.simulation_rate is None:
+                    game.update(DELTA_TIME)
+                    alpha = 1.0
+                else:
+                    alpha = game.step_simulation(DELTA_TIME)
+                updated = time.perf_counter()
+                rects = game.draw(alpha=alpha)
+                drawn = time.perf_counter()
+                game.present(rects)
+                flipped = time.perf_counter()
+
+                timings["update"].append((updated - start) * 1000.0)
+                timings["draw"].append((drawn - updated) * 1000.0)
+                timings["flip"].append((flipped - drawn) * 1000.0)
+
+        return results
+
+    finally:
+        game.deinit()
+
+
+def run_replay(config: GameConfig) -> Dict[str, Timings]:
+    """Replay a recorded input log as fast as possible, timing every frame's
+    update, draw and flip past loading.
+
+    Args:
+        config (GameConfig): Options for the game, with `replay_path` set.
+
+    Returns:
+        Dict[str, Timings]: Timings in milliseconds, under "replay".
+    """
+    game = Game()
+    try:
+        game.init(config)
+        timings = {"update": [], "draw": [], "flip": []}
+        while True:
+            is_loading = game.state_manager.get_state() == GameStates.LOADING
+            delta_time = game.tick()
+            if delta_time is None:
+                break
+
+            start = time.perf_counter()
+            game.handle_events(delta_time)
+            if config.simulation_rate is None:
+                game.update(delta_time)
+                alpha = 1.0
+            else:
+                alpha = game.step_simulation(delta_time)
+            updated = time.perf_counter()
+            rects = game.draw(alpha=alpha)
+            drawn = time.perf_counter()
+            game.present(rects)
+            flipped = time.perf_counter()
+
+            if not is_loading:
+                timings["update"].append((updated - start) * 1000.0)
+                timings["draw"].append((drawn - updated) * 1000.0)
+                timings["flip"].append((flipped - drawn) * 1000.0)
+
+        return {"replay": timings}
+
+    finally:
+        game.deinit()
+
+
+def main() -> None:
+    """Run the benchmark from the command line and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the game loop.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--simulation-rate", type=int, default=None)
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument("--balls", type=int, default=0)
+    parser.add_argument("--replay", help="time a recorded input log instead")
+    args = parser.parse_args()
+
+    config = GameConfig(
+        simulation_rate=args.simulation_rate,
+        dirty_rects=args.dirty_rects,
+        replay_path=args.replay,
+    )
+    if args.replay is not None:
+        results = run_replay(config)
+    else:
+        results = run_benchmark(args.frames, config, balls=args.balls)
+
+    total = {
+        metric: [sample for timings in results.values() for sample in timings[metric]]
+        for metric in ("update", "draw", "flip")
+    }
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "frames": sum(len(timings["update"]) for timings in results.values()),
+        "delta_time": DELTA_TIME,
+        "balls": args.balls,
+        "config": asdict(config),
+        "total": {metric: summarize(samples) for metric, samples in total.items()},
+        "phases": {
+            phase: {metric: summarize(samples) for metric, samples in timings.items()}
+            for phase, timings in results.items()
+        },
+    }
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    for metric, summary in report["total"].items():
+        print(
+            f"{metric:>6}: "
+            + " ".join(f"{key}={value:.3f}ms" for key, value in summary.items())
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import gc
+import json
+import os
+import time
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+import pygame
+
+from ..game_objects import Ball, ObjectPool
+from ..rendering import LOGICAL_SIZE, DirtyGroup
+
+
+DEFAULT_SPAWNS: int = 200
+DEFAULT_LIFETIME: int = 30
+DEFAULT_FRAMES: int = 600
+DEFAULT_OUTPUT: str = "object_pool_benchmark_results.json"
+DELTA_TIME: float = 1.0 / 60.0
+
+
+class GCTimer:
+    """Times garbage collections through `gc.callbacks`."""
+
+    pauses: List[float]
+    start: float
+
+    def __init__(self) -> None:
+        self.pauses = []
+        self.start = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self.start = time.perf_counter()
+        else:
+            self.pauses.append((time.perf_counter() - self.start) * 1000.0)
+
+
+def spawn_position(i: int) -> Tuple[int, int]:
+    """Get a spawn position spread over the window.
+
+    Args:
+        i (int): Index of the spawn.
+
+    Returns:
+        Tuple[int, int]: The position.
+    """
+    return (i * 7 % (LOGICAL_SIZE[0] - 40), i * 13 % (LOGICAL_SIZE[1] - 40))
+
+
+def run_churn(
+    spawn: Callable[[int], Ball],
+    despawn: Callable[[Ball], None],
+    group: DirtyGroup,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """Spawn balls every frame, step them, and despawn them once they've lived
+    for `args.lifetime` frames.
+
+    Args:
+        spawn (Callable[[int], Ball]): Spawns the ball with an index.
+        despawn (Callable[[Ball], None]): Despawns a ball.
+        group (DirtyGroup): Group holding the balls.
+        args (argparse.Namespace): Command line arguments.
+
+    Returns:
+        Dict[str, Any]: Frame time, and count and duration of collections.
+    """
+    alive: Deque[List[Ball]] = deque()
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    try:
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            if len(alive) == args.lifetime:
+                for ball in alive.popleft():
+                    despawn(ball)
+            alive.append([spawn(frame * args.spawns + i) for i in range(args.spawns)])
+            group.update(DELTA_TIME)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(timer)
+
+    return {
+        "frame_ms": elapsed * 1000.0 / args.frames,
+        "gc_collections": len(timer.pauses),
+        "gc_total_ms": sum(timer.pauses),
+        "gc_max_ms": max(timer.pauses, default=0.0),
+    }
+
+
+def run_construct(image: pygame.Surface, args: argparse.Namespace) -> Dict[str, Any]:
+    """Spawn by constructing balls and adding them to the group, and despawn
+    by removing them.
+
+    Args:
+        image (pygame.Surface): Image shared by the balls.
+        args (argparse.Namespace): Command line arguments.
+
+    Returns:
+        Dict[str, Any]: Results of `run_churn`.
+    """
+    group = DirtyGroup()
+
+    def spawn(i: int) -> Ball:
+        ball = Ball(image)
+        ball.reset_position(spawn_position(i))
+        group.add(ball)
+        return ball
+
+    return run_churn(spawn, group.remove, group, args)
+
+
+def run_pool(image: pygame.Surface, args: argparse.Namespace) -> Dict[str, Any]:
+    """Spawn and despawn balls through an `ObjectPool`, preallocated for the
+    balls alive at once.
+
+    Args:
+        image (pygame.Surface): Image shared by the balls.
+        args (argparse.Namespace): Command line arguments.
+
+    Returns:
+        Dict[str, Any]: Results of `run_churn` and statistics of the pool.
+    """
+    group = DirtyGroup()
+    pool = ObjectPool(lambda: Ball(image), args.spawns * args.lifetime, group)
+
+    def spawn(i: int) -> Ball:
+        ball = pool.acquire()
+        ball.reset_position(spawn_position(i))
+        return ball
+
+    result = run_churn(spawn, pool.release, group, args)
+    result["pool"] = pool.get_stats()
+    return result
+
+
+def main() -> None:
+    """Run the benchmark from the command line and write the results as JSON."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark spawning balls through a pool against "
+        "constructing them."
+    )
+    parser.add_argument("--spawns", type=int, default=DEFAULT_SPAWNS)
+    parser.add_argument("--lifetime", type=int, default=DEFAULT_LIFETIME)
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode(LOGICAL_SIZE)
+    image = Ball().image
+
+    report = {}
+    for name, run in (("construct", run_construct), ("pool", run_pool)):
+        result = report[name] = run(image, args)
+        print(
+            f"{name:>9}: {result['frame_ms']:.3f}ms/frame, "
+            f"{result['gc_collections']} collections taking "
+            f"{result['gc_total_ms']:.2f}ms (max {result['gc_max_ms']:.2f}ms)"
+        )
+    print(f"pool hit rate {report['pool']['pool']['hit_rate']:.1%}")
+
+    pygame.quit()
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from typing import List, Tuple, Type
+
+import pygame
+
+from ..game_objects import Ball
+from ..rendering import LOGICAL_SIZE
+
+
+DEFAULT_BALLS: int = 1_000
+DEFAULT_FRAMES: int = 600
+DEFAULT_OUTPUT: str = "transform_benchmark_results.json"
+DELTA_TIME: float = 1.0 / 60.0
+# frame rate at which sub-pixel movement is checked, where a ball moves less
+# than a pixel per step
+HIGH_FPS: int = 1000
+
+
+class RectBall(Ball):
+    """Ball stepped as before positions were kept as floats: every position
+    assignment allocates a new rect, truncating to whole pixels.
+    """
+
+    __slots__ = ()
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return (self.rect.x, self.rect.y)
+
+    @position.setter
+    def position(self, value: Tuple[float, float]) -> None:
+        self.rect = pygame.Rect(value, self.rect.size)
+
+    def update(self, delta_time: float) -> None:
+        self.position = (
+            self.position[0] + self.velocity[0] * delta_time,
+            self.position[1] + self.velocity[1] * delta_time,
+        )
+
+        bounds = pygame.display.get_window_size()
+
+        if self.position[0] < 0:
+            self.velocity = (-self.velocity[0], self.velocity[1])
+            self.position = (self.position[0] + 1, self.position[1])
+
+        if self.position[0] > bounds[0] - self.rect.size[0]:
+            self.velocity = (-self.velocity[0], self.velocity[1])
+            self.position = (self.position[0] - 1, self.position[1])
+
+        if self.position[1] < 0:
+            self.velocity = (self.velocity[0], -self.velocity[1])
+            self.position = (self.position[0], self.position[1] + 1)
+
+        if self.position[1] > bounds[1] - self.rect.size[1]:
+            self.velocity = (self.velocity[0], -self.velocity[1])
+            self.position = (self.position[0], self.position[1] - 1)
+
+
+class CountingRect(pygame.Rect):
+    """Rect counting how many times it's constructed."""
+
+    count: int = 0
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        CountingRect.count += 1
+
+
+def make_balls(ball_type: Type[Ball], count: int) -> List[Ball]:
+    """Create balls spread over the window.
+
+    Args:
+        ball_type (Type[Ball]): Class of the balls.
+        count (int): Number of balls.
+
+    Returns:
+        List[Ball]: The balls.
+    """
+    balls = []
+    for i in range(count):
+        ball = ball_type()
+        ball.position = (
+            i * 7 % (LOGICAL_SIZE[0] - 40),
+            i * 13 % (LOGICAL_SIZE[1] - 40),
+        )
+        balls.append(ball)
+    return balls
+
+
+def time_updates(balls: List[Ball], frames: int) -> float:
+    """Time stepping every ball.
+
+    Args:
+        balls (List[Ball]): Balls to step.
+        frames (int): Number of steps.
+
+    Returns:
+        float: Mean milliseconds per frame.
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        for ball in balls:
+            ball.update(DELTA_TIME)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def count_rects(balls: List[Ball], frames: int) -> float:
+    """Count the rects constructed while stepping every ball.
+
+    Args:
+        balls (List[Ball]): Balls to step.
+        frames (int): Number of steps.
+
+    Returns:
+        float: Rects constructed per frame.
+    """
+    rect_type = pygame.Rect
+    pygame.Rect = CountingRect
+    CountingRect.count = 0
+    try:
+        for _ in range(frames):
+            for ball in balls:
+                ball.update(DELTA_TIME)
+    finally:
+        pygame.Rect = rect_type
+    return CountingRect.count / frames
+
+
+def get_distance(ball_type: Type[Ball], fps: int) -> float:
+    """Step a ball for one second at a frame rate and measure how far it
+    went.
+
+    Args:
+        ball_type (Type[Ball]): Class of the ball.
+        fps (int): Steps per second.
+
+    Returns:
+        float: Horizontal distance moved, in pixels. Should be the ball's
+        speed.
+    """
+    ball = ball_type()
+    ball.position = (100, 100)
+    for _ in range(fps):
+        ball.update(1.0 / fps)
+    return ball.position[0] - 100
+
+
+def get_instance_size(ball: Ball) -> int:
+    """Get the memory held by a ball itself, without its image and rect.
+
+    Args:
+        ball (Ball): The ball.
+
+    Returns:
+        int: Size in bytes.
+    """
+    size = sys.getsizeof(ball)
+    if hasattr(ball, "__dict__"):
+        size += sys.getsizeof(ball.__dict__)
+    return size
+
+
+def main() -> None:
+    """Run the benchmark from the command line and write the results as JSON."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Ball.update with float positions against rects."
+    )
+    parser.add_argument("--balls", type=int, default=DEFAULT_BALLS)
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode(LOGICAL_SIZE)
+
+    report = {}
+    for name, ball_type in (("rect", RectBall), ("float", Ball)):
+        balls = make_balls(ball_type, args.balls)
+        result = report[name] = {
+            "update_ms": time_updates(balls, args.frames),
+            "rects_per_frame": count_rects(balls, args.frames),
+            "instance_bytes": get_instance_size(balls[0]),
+            "distance_at_60fps": get_distance(ball_type, 60),
+            f"distance_at_{HIGH_FPS}fps": get_distance(ball_type, HIGH_FPS),
+        }
+        print(
+            f"{name:>5}: update {result['update_ms']:.3f}ms/frame, "
+            f"{result['rects_per_frame']:.0f} rects/frame, "
+            f"moved {result['distance_at_60fps']:.1f}px at 60fps and "
+            f"{result[f'distance_at_{HIGH_FPS}fps']:.1f}px at {HIGH_FPS}fps "
+            f"(expected {Ball().speed}px)"
+        )
+
+    pygame.quit()
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
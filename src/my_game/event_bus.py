@@ -0,0 +1,158 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import pygame
+
+from .game_states import GameStates
+
+
+EventHandlerFn = Callable[[pygame.event.Event], None]
+DispatchTable = Dict[int, List[EventHandlerFn]]
+
+# window events after which the window must be redrawn in full, e.g. once it's
+# uncovered or restored. Never blocked, even without subscribers.
+WINDOW_EVENT_TYPES: Tuple[int, ...] = (
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWMAXIMIZED,
+    pygame.WINDOWSIZECHANGED,
+)
+
+
+class EventBus:
+    """Routes pygame events to subscribed handlers through dispatch tables
+    keyed by event type, so the cost of an event doesn't depend on how many
+    event types exist.
+
+    Handlers are either global or registered for a `GameStates`, in which case
+    they only receive events while it's the current state. With `filter_events`,
+    event types nobody subscribed to are blocked by SDL and never queued,
+    except for `WINDOW_EVENT_TYPES`.
+    """
+
+    get_state: Callable[[], GameStates | None]
+    handlers: DispatchTable
+    state_handlers: Dict[GameStates, DispatchTable]
+    is_filtering: bool
+
+    def __init__(self, get_state: Callable[[], GameStates | None]) -> None:
+        self.get_state = get_state
+        self.handlers = {}
+        self.state_handlers = {}
+        self.is_filtering = False
+
+    def subscribe(
+        self,
+        event_type: int,
+        handler: EventHandlerFn,
+        state: GameStates | None = None,
+    ) -> None:
+        """Call `handler` with every event of `event_type`.
+
+        Args:
+            event_type (int): Type of the events, e.g. `pygame.QUIT`.
+            handler (EventHandlerFn): Function to call.
+            state (GameStates | None, optional): Only deliver events while this
+            is the current state. Defaults to None, delivering in every state.
+        """
+        if state is None:
+            table = self.handlers
+        else:
+            table = self.state_handlers.setdefault(state, {})
+        table.setdefault(event_type, []).append(handler)
+        if self.is_filtering:
+            pygame.event.set_allowed(event_type)
+
+    def unsubscribe(
+        self,
+        event_type: int,
+        handler: EventHandlerFn,
+        state: GameStates | None = None,
+    ) -> None:
+        """Stop calling a handler added by `subscribe`.
+
+        Args:
+            event_type (int): Type of the events.
+            handler (EventHandlerFn): Function to stop calling.
+            state (GameStates | None, optional): State it was subscribed for.
+            Defaults to None.
+        """
+        table = self.handlers if state is None else self.state_handlers[state]
+        table[event_type].remove(handler)
+        if not table[event_type]:
+            del table[event_type]
+        if (
+            self.is_filtering
+            and event_type not in self.get_event_types()
+            and event_type not in WINDOW_EVENT_TYPES
+        ):
+            pygame.event.set_blocked(event_type)
+
+    def get_event_types(self) -> Set[int]:
+        """Get the event types with at least one subscriber.
+
+        Returns:
+            Set[int]: The event types.
+        """
+        event_types = set(self.handlers)
+        for table in self.state_handlers.values():
+            event_types.update(table)
+        return event_types
+
+    def filter_events(self) -> None:
+        """Block every event type without subscribers at the SDL level, so
+        they're never queued. Types subscribed to later are allowed again.
+        `WINDOW_EVENT_TYPES` are always allowed.
+        """
+        self.is_filtering = True
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.get_event_types()))
+        pygame.event.set_allowed(list(WINDOW_EVENT_TYPES))
+
+    def dispatch(self, event: pygame.event.Event) -> None:
+        """Deliver an event to the handlers of the current state, then to the
+        global handlers.
+
+        Args:
+            event (pygame.event.Event): The event.
+        """
+        table = self.state_handlers.get(self.get_state())
+        if table is not None:
+            for handler in table.get(event.type, ()):
+                handler(event)
+
+        for handler in self.handlers.get(event.type, ()):
+            handler(event)
+
+    def process(self, events: Iterable[pygame.event.Event] | None = None) -> None:
+        """Deliver a batch of events, once per frame. Each event goes to the
+        handlers of the state current when it's reached.
+
+        Args:
+            events (Iterable[pygame.event.Event] | None, optional): Events to
+            deliver. Defaults to None, draining the events queued since the
+            last call.
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            self.dispatch(event)
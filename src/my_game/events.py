@@ -19,6 +19,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import pygame
 
 
+LOADING_COMPLETE: int = pygame.event.custom_type()
+
 MAIN_MENU_PLAY: int = pygame.event.custom_type()
 MAIN_MENU_OPTIONS: int = pygame.event.custom_type()
 
@@ -16,17 +16,27 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import functools
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
 import pygame
 
 from . import __window_caption__
+from .event_bus import WINDOW_EVENT_TYPES, EventBus
 from .managers import (
     AssetManager,
     FontManager,
     StateManager,
+    TextStyle,
 )
 
 from .events import (
     GAMEPLAY_PAUSE,
+    LOADING_COMPLETE,
     MAIN_MENU_OPTIONS,
     MAIN_MENU_PLAY,
     OPTIONS_MENU_GO_BACK,
@@ -36,120 +46,475 @@ from .events import (
 )
 from .gameplay import Gameplay
 from .game_states import GameStates
-from .ui.menus import MainMenu, OptionsMenu, PauseMenu
+from .input_log import InputRecorder, InputReplay
+from .input_state import InputState
+from .profiling import DEFAULT_TRACE_PATH, Profiler, ProfilerHUD, TraceRecorder
+from .rendering import LOGICAL_SIZE, RenderTarget, ScaleMode
+from .timing import FramePacer, FramePacingMode, Scheduler, create_frame_pacer
+from .ui.menus import LoadingScreen, MainMenu, OptionsMenu, PauseMenu
+from .ui.widgets import clear_render_cache
 
 
 MAX_FPS: int = 250
 MAX_FPS_IN_MENU: int = 60
+MAX_UPDATES_PER_FRAME: int = 5
+CLEAR_COLOR: str = "#000000"
+LOADER_THREADS: int = 4
+# seconds between refreshes of the window caption and profiler HUD text
+STATS_INTERVAL: float = 0.25
+PROFILER_HUD_KEY: int = pygame.K_F3
+PROFILER_HUD_TEXT_STYLE: TextStyle = TextStyle(
+    "#ffffff", size=16, background=ProfilerHUD.BACKGROUND
+)
+WRITE_TRACE_KEY: int = pygame.K_F4
+# delta time of frames spent loading while replaying, which aren't recorded
+# as loading takes a varying number of frames
+REPLAY_LOADING_DELTA: float = 1.0 / 60.0
+MOUSE_EVENT_TYPES: Tuple[int, ...] = (
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+)
+
 
+@dataclass
+class GameConfig:  # pylint: disable=R0902
+    """Data structure for holding options of the main loop.
+
+    Attributes:
+        simulation_rate (int | None): Updates per second for the fixed-step
+        simulation. When None, the game is updated once per frame with a
+        variable delta time.
+        max_updates_per_frame (int): Upper bound on fixed-step updates run in a
+        single frame. Time beyond that is dropped so a slow frame can't snowball
+        into slower ones.
+        frame_pacing (FramePacingMode): How the frame rate is limited. Falls
+        back to `FramePacingMode.HYBRID` if vsync isn't available.
+        dirty_rects (bool): Only redraw and present the regions of the window
+        that changed, instead of the whole window every frame.
+        headless (bool): Use SDL's dummy video driver so no real window is
+        opened, e.g. for benchmarks.
+        trace_path (str | None): Where to write the trace of the last frames
+        when the game exits. When None, it's only written on demand, by
+        pressing `WRITE_TRACE_KEY`, to `DEFAULT_TRACE_PATH`.
+        scale_mode (ScaleMode): How the logical frame is scaled to fit the
+        window, e.g. when fullscreen.
+        record_path (str | None): Where to write the input and delta time of
+        every frame past loading when the game exits, for replaying.
+        replay_path (str | None): Input log to replay instead of reading input.
+        Replays run headless, as fast as possible, and stop at the end of the
+        log.
+    """
 
-class Game:
+    simulation_rate: int | None = None
+    max_updates_per_frame: int = MAX_UPDATES_PER_FRAME
+    frame_pacing: FramePacingMode = FramePacingMode.HYBRID
+    dirty_rects: bool = False
+    headless: bool = False
+    trace_path: str | None = None
+    scale_mode: ScaleMode = ScaleMode.NEAREST
+    record_path: str | None = None
+    replay_path: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.simulation_rate is not None and self.simulation_rate <= 0:
+            raise ValueError(
+                f"simulation_rate must be positive, got {self.simulation_rate}"
+            )
+        if self.max_updates_per_frame < 1:
+            raise ValueError(
+                "max_updates_per_frame must be at least 1, "
+                f"got {self.max_updates_per_frame}"
+            )
+
+
+class Game:  # pylint: disable=R0902
     """Represents the game. Initializes the main window and controls the main
     game loop.
     """
 
     is_running: bool
-    clock: pygame.time.Clock
+    config: GameConfig
+    frame_pacer: FramePacer
     window: pygame.Surface
+    render_target: RenderTarget
+    executor: ThreadPoolExecutor
     asset_manager: AssetManager
     font_manager: FontManager
     state_manager: StateManager
+    scheduler: Scheduler
+    event_bus: EventBus
+    input_state: InputState
+    input_recorder: InputRecorder | None
+    input_replay: InputReplay | None
+    tracer: TraceRecorder
+    profiler: Profiler
+    profiler_hud: ProfilerHUD
     max_fps: int
+    accumulator: float
+
+    def init(self, config: GameConfig | None = None) -> None:
+        """Initialize the main systems.
+
+        Args:
+            config (GameConfig | None, optional): Options for the main loop.
+            Defaults to `GameConfig()`.
+        """
+        self.config = config if config is not None else GameConfig()
+        if self.config.replay_path is not None:
+            self.config.headless = True
+        if self.config.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
 
-    def init(self) -> None:
-        """Initialize the main systems."""
         pygame.init()
         self.is_running = False
+        self.executor = ThreadPoolExecutor(max_workers=LOADER_THREADS)
+        self.tracer = TraceRecorder()
+
+        # initialize simulation
+        self.accumulator = 0.0
 
         # initialize window
         self.max_fps = MAX_FPS_IN_MENU
-        self.clock = pygame.time.Clock()
-        self.window = pygame.display.set_mode((800, 600))
+        self.frame_pacer = create_frame_pacer(self.config.frame_pacing)
+        self.window = None
+        if self.frame_pacer.vsync:
+            try:
+                self.window = pygame.display.set_mode(
+                    LOGICAL_SIZE, pygame.SCALED, vsync=1
+                )
+            except pygame.error:
+                self.frame_pacer = create_frame_pacer(FramePacingMode.HYBRID)
+        if self.window is None:
+            self.window = pygame.display.set_mode(LOGICAL_SIZE)
         pygame.display.set_caption(__window_caption__)
+        self.render_target = RenderTarget(LOGICAL_SIZE, self.config.scale_mode)
 
         # initialize managers
-        self.asset_manager = AssetManager()
-        self.font_manager = FontManager()
-        self.state_manager = StateManager()
+        self.asset_manager = AssetManager(executor=self.executor, tracer=self.tracer)
+        self.font_manager = FontManager(executor=self.executor, tracer=self.tracer)
+        self.font_manager.on_evict = clear_render_cache
+        self.state_manager = StateManager(tracer=self.tracer)
+        self.scheduler = Scheduler()
+        self.profiler = Profiler(tracer=self.tracer)
+        self.profiler_hud = ProfilerHUD(self.profiler)
+        self.scheduler.call_every(STATS_INTERVAL, self.update_stats, catch_up=False)
+        self.event_bus = EventBus(self.state_manager.get_state)
+        self.input_state = InputState()
+        self.input_recorder = None
+        self.input_replay = None
+        if self.config.replay_path is not None:
+            self.input_replay = InputReplay(self.config.replay_path)
+        elif self.config.record_path is not None:
+            self.input_recorder = InputRecorder(self.config.record_path)
+        self.init_events()
 
         # intialize game components
         self.init_game()
 
     def init_game(self) -> None:
-        """Construct and load the actual game."""
+        """Construct and load the actual game. Only the splash screen is loaded
+        up front, everything else streams in while it's shown.
+        """
+        # show the loading screen first
+        self.state_manager.add(
+            GameStates.LOADING,
+            LoadingScreen(
+                splash=pygame.image.load("data/img/splashscreen.png").convert(),
+                get_progress=self.get_loading_progress,
+            ),
+        )
+
         # load fonts
-        self.font_manager.add("data/fonts/Rijusans-Regular.ttf")
+        self.font_manager.add_async("data/fonts/Rijusans-Regular.ttf")
 
         # load assets
-        self.asset_manager.load_spritesheet("data/spritesheets/playingCards.xml")
+        self.asset_manager.load_spritesheet_async("data/spritesheets/playingCards.xml")
+        self.asset_manager.load_spritesheet_async(
+            "data/spritesheets/playingCardBacks.xml"
+        )
 
-        # add states to state machine
-        self.state_manager.add(
-            GameStates.MAIN_MENU, MainMenu(font=self.font_manager.get())
+    def init_states(self) -> None:
+        """Register the states which depend on loaded assets. Each is only
+        constructed when first entered.
+        """
+        self.state_manager.register(
+            GameStates.MAIN_MENU,
+            lambda: MainMenu(font=self.font_manager.get(), scheduler=self.scheduler),
         )
-        self.state_manager.add(
-            GameStates.OPTIONS_MENU, OptionsMenu(font=self.font_manager.get())
+        self.state_manager.register(
+            GameStates.OPTIONS_MENU,
+            lambda: OptionsMenu(font=self.font_manager.get(), scheduler=self.scheduler),
         )
-        self.state_manager.add(GameStates.GAMEPLAY, Gameplay(self.asset_manager))
-        self.state_manager.add(
-            GameStates.PAUSE_MENU, PauseMenu(font=self.font_manager.get())
+        self.state_manager.register(
+            GameStates.GAMEPLAY, lambda: Gameplay(self.asset_manager, self.input_state)
+        )
+        self.state_manager.register(
+            GameStates.PAUSE_MENU,
+            lambda: PauseMenu(font=self.font_manager.get(), scheduler=self.scheduler),
+            is_overlay=True,
         )
 
+    def get_loading_progress(self) -> float:
+        """Get how much of the queued assets are loaded.
+
+        Returns:
+            float: Progress from 0 to 1.
+        """
+        managers = (self.asset_manager, self.font_manager)
+        queued = sum(manager.queued_count for manager in managers)
+        if not queued:
+            return 1.0
+        return sum(manager.loaded_count for manager in managers) / queued
+
     def run(self) -> None:
         """Run the game."""
         self.is_running = True
         while self.is_running:
-            delta_time: float = self.clock.tick_busy_loop(self.max_fps) / 1000.0
-            self.handle_events()
-            self.update(delta_time)
-            self.render()
+            with self.profiler.scope("wait"):
+                delta_time = self.tick()
+            if delta_time is None:
+                break
+            with self.profiler.scope("events"):
+                self.handle_events(delta_time)
+
+            if self.config.simulation_rate is None:
+                self.update(delta_time)
+                self.render()
+            else:
+                self.render(alpha=self.step_simulation(delta_time))
+            self.profiler.end_frame()
+
+    def tick(self) -> float | None:
+        """Wait for the next frame. When replaying, frames aren't waited for,
+        and the recorded delta times are used instead.
+
+        Returns:
+            float | None: Delta since the previous frame, in seconds. None once
+            the replay is over.
+        """
+        if self.input_replay is None:
+            return self.frame_pacer.tick(self.max_fps) / 1000.0
+
+        if self.state_manager.get_state() == GameStates.LOADING and not (
+            pygame.event.peek(LOADING_COMPLETE)
+        ):
+            return REPLAY_LOADING_DELTA
+        return self.input_replay.next_frame()
 
-    def handle_user_event(self, event: pygame.event.Event) -> None:
-        """Handles custom events. Used to manage game state.
+    def step_simulation(self, delta_time: float) -> float:
+        """Advance the game in fixed steps of `1 / config.simulation_rate` seconds.
+
+        Frame time is accumulated and consumed one step at a time, so the
+        simulation advances identically regardless of the render rate. At most
+        `config.max_updates_per_frame` steps are run; any backlog past that is dropped.
 
         Args:
-            event (pygame.event.Event): The custom event.
+            delta_time (float): Delta between frames, in seconds.
+
+        Returns:
+            float: Interpolation factor in [0, 1) between the previous and the
+            current simulation step, used when rendering.
         """
-        if event.type == MAIN_MENU_PLAY:
-            self.max_fps = MAX_FPS
-            self.state_manager.change_state(GameStates.GAMEPLAY)
+        step = 1.0 / self.config.simulation_rate
+        self.accumulator += delta_time
 
-        elif event.type == MAIN_MENU_OPTIONS:
-            self.state_manager.change_state(GameStates.OPTIONS_MENU)
-            self.max_fps = MAX_FPS_IN_MENU
+        updates = 0
+        while self.accumulator >= step:
+            if updates >= self.config.max_updates_per_frame:
+                self.accumulator %= step
+                break
 
-        elif event.type == OPTIONS_MENU_TOGGLE_FULLSCREEN:
-            self.max_fps = MAX_FPS_IN_MENU
-            pygame.display.toggle_fullscreen()
+            self.update(step)
+            self.accumulator -= step
+            updates += 1
 
-        elif event.type == OPTIONS_MENU_GO_BACK:
-            self.max_fps = MAX_FPS_IN_MENU
-            self.state_manager.go_back()
+        return self.accumulator / step
 
-        elif event.type == GAMEPLAY_PAUSE:
-            self.max_fps = MAX_FPS_IN_MENU
-            self.state_manager.change_state(GameStates.PAUSE_MENU)
+    def init_events(self) -> None:
+        """Subscribe to the events the game handles. Any other event type is
+        blocked, so it's never queued.
+        """
+        bus = self.event_bus
+        bus.subscribe(pygame.QUIT, self.on_quit)
+        for event_type in InputState.EVENT_TYPES:
+            bus.subscribe(event_type, self.input_state.handle_event)
+        bus.subscribe(pygame.KEYDOWN, self.on_key_down)
+        for event_type in WINDOW_EVENT_TYPES:
+            bus.subscribe(event_type, self._on_window_exposed)
+        bus.subscribe(LOADING_COMPLETE, self.on_loading_complete, GameStates.LOADING)
+
+        for state in (
+            GameStates.MAIN_MENU,
+            GameStates.OPTIONS_MENU,
+            GameStates.PAUSE_MENU,
+        ):
+            for event_type in MOUSE_EVENT_TYPES:
+                bus.subscribe(event_type, self.state_manager.handle_event, state)
+
+        # event type: (state it's handled in, transition, max fps)
+        states = self.state_manager
+        transitions = {
+            MAIN_MENU_PLAY: (
+                GameStates.MAIN_MENU,
+                functools.partial(states.change_state, GameStates.GAMEPLAY),
+                MAX_FPS,
+            ),
+            MAIN_MENU_OPTIONS: (
+                GameStates.MAIN_MENU,
+                functools.partial(states.push, GameStates.OPTIONS_MENU),
+                MAX_FPS_IN_MENU,
+            ),
+            OPTIONS_MENU_GO_BACK: (
+                GameStates.OPTIONS_MENU,
+                states.pop,
+                MAX_FPS_IN_MENU,
+            ),
+            GAMEPLAY_PAUSE: (
+                GameStates.GAMEPLAY,
+                functools.partial(states.push, GameStates.PAUSE_MENU),
+                MAX_FPS_IN_MENU,
+            ),
+            PAUSE_MENU_RESUME: (GameStates.PAUSE_MENU, states.pop, MAX_FPS),
+            PAUSE_MENU_GOTO_MAIN_MENU: (
+                GameStates.PAUSE_MENU,
+                functools.partial(states.change_state, GameStates.MAIN_MENU),
+                MAX_FPS_IN_MENU,
+            ),
+        }
+        for event_type, (state, transition, max_fps) in transitions.items():
+            bus.subscribe(
+                event_type,
+                functools.partial(self.on_transition, transition, max_fps),
+                state,
+            )
+
+        bus.subscribe(
+            OPTIONS_MENU_TOGGLE_FULLSCREEN,
+            self.on_toggle_fullscreen,
+            GameStates.OPTIONS_MENU,
+        )
+        bus.filter_events()
 
-        elif event.type == PAUSE_MENU_RESUME:
-            self.max_fps = MAX_FPS
-            self.state_manager.change_state(GameStates.GAMEPLAY)
+    def on_quit(self, event: pygame.event.Event) -> None:
+        """Stop the game.
 
-        elif event.type == PAUSE_MENU_GOTO_MAIN_MENU:
-            self.max_fps = MAX_FPS_IN_MENU
-            self.state_manager.change_state(GameStates.MAIN_MENU)
+        Args:
+            event (pygame.event.Event): The `pygame.QUIT` event.
+        """
+        _ = event
+        self.is_running = False
+
+    def on_key_down(self, event: pygame.event.Event) -> None:
+        """Handle global shortcuts.
 
-    def handle_events(self) -> None:
-        """Handle system and game events."""
-        for event in pygame.event.get():
-            match event.type:
-                case pygame.QUIT:
-                    self.is_running = False
+        Args:
+            event (pygame.event.Event): The `pygame.KEYDOWN` event.
+        """
+        if event.key == PROFILER_HUD_KEY:
+            self.profiler_hud.toggle()
+            if not self.profiler_hud.is_visible:
+                self.state_manager.invalidate()
 
-                case _ if event.type >= pygame.USEREVENT:
-                    self.handle_user_event(event)
+        elif event.key == WRITE_TRACE_KEY:
+            self.tracer.write(self.config.trace_path or DEFAULT_TRACE_PATH)
 
-                case _:
-                    pass
+    def on_loading_complete(self, event: pygame.event.Event) -> None:
+        """Construct the loaded states and show the main menu.
+
+        Args:
+            event (pygame.event.Event): The `LOADING_COMPLETE` event.
+        """
+        _ = event
+        # start the simulation afresh, so replays step it exactly as recorded
+        self.accumulator = 0.0
+        self.profiler_hud.glyph_atlas = self.font_manager.get_glyph_atlas(
+            PROFILER_HUD_TEXT_STYLE
+        )
+        self.init_states()
+        self.state_manager.change_state(GameStates.MAIN_MENU)
+        self.state_manager.unload(GameStates.LOADING)
+
+        # menus only render text, so they're safe to construct in the background
+        self.state_manager.preload(GameStates.OPTIONS_MENU, self.executor)
+        self.state_manager.preload(GameStates.PAUSE_MENU, self.executor)
+
+    def on_transition(
+        self,
+        transition: Callable[[], None],
+        max_fps: int,
+        event: pygame.event.Event,
+    ) -> None:
+        """Transition to another state.
+
+        Args:
+            transition (Callable[[], None]): Changes the state, e.g.
+            `StateManager.push`.
+            max_fps (int): Frame rate limit in the next state.
+            event (pygame.event.Event): The event causing the transition.
+        """
+        _ = event
+        self.max_fps = max_fps
+        transition()
+
+    def on_toggle_fullscreen(self, event: pygame.event.Event) -> None:
+        """Toggle fullscreen. Nothing is laid out again, the logical frame is
+        only redrawn and scaled differently.
+
+        Args:
+            event (pygame.event.Event): The `OPTIONS_MENU_TOGGLE_FULLSCREEN` event.
+        """
+        _ = event
+        self.max_fps = MAX_FPS_IN_MENU
+        if self.frame_pacer.vsync:
+            # SCALED windows are scaled by SDL itself
+            pygame.display.toggle_fullscreen()
+        elif pygame.display.is_fullscreen():
+            pygame.display.set_mode(LOGICAL_SIZE)
+        else:
+            pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.window = pygame.display.get_surface()
+        self.render_target.invalidate()
+        self.state_manager.invalidate()
+
+    def _on_window_exposed(self, event: pygame.event.Event) -> None:
+        """Redraw the whole window on the next frame, as it may have been
+        uncovered, restored or resized, so presenting only changed regions
+        would leave the rest stale. Used internally.
+
+        Args:
+            event (pygame.event.Event): One of `WINDOW_EVENT_TYPES`.
+        """
+        _ = event
+        self.render_target.invalidate()
+        self.state_manager.invalidate()
+
+    def handle_events(self, delta_time: float = 0.0) -> None:
+        """Handle system and game events. Mouse positions are mapped to
+        logical coordinates first.
+
+        Input is replayed from, or recorded to, the input log when one is
+        configured. Frames spent loading aren't recorded.
+
+        Args:
+            delta_time (float, optional): Delta of the frame, in seconds,
+            recorded along with its input. Defaults to 0.0.
+        """
+        events = pygame.event.get()
+        if self.input_replay is not None:
+            events = self.input_replay.get_events(events)
+        else:
+            for event in events:
+                if event.type in MOUSE_EVENT_TYPES:
+                    event.pos = self.render_target.to_logical(event.pos)
+
+        self.event_bus.process(events)
+
+        if (
+            self.input_recorder is not None
+            and self.state_manager.get_state() != GameStates.LOADING
+        ):
+            self.input_recorder.record_frame(delta_time, events)
 
     def update(self, delta_time: float) -> None:
         """Update the game.
@@ -157,17 +522,80 @@ class Game:
         Args:
             delta_time (float): Delta between frames, in milliseconds.
         """
+        self.asset_manager.process_loaded()
+        self.font_manager.process_loaded()
+        self.scheduler.update(delta_time)
+        with self.profiler.scope(f"update/{self.state_manager.get_state()}"):
+            self.state_manager.update(delta_time=delta_time)
+
+    def update_stats(self) -> None:
+        """Show the frame rate in the window caption and refresh the profiler
+        HUD. Runs a few times per second rather than every frame, as setting
+        the caption goes through the window manager.
+        """
         pygame.display.set_caption(
-            f"{__window_caption__} FPS: {self.clock.get_fps():.0f}"
+            f"{__window_caption__} FPS: {self.frame_pacer.get_fps():.0f}"
+            f" Jitter: {self.frame_pacer.get_jitter():.2f}ms"
         )
-        self.state_manager.update(delta_time=delta_time)
+        if self.profiler_hud.is_visible:
+            self.profiler_hud.refresh()
+
+    def render(self, alpha: float = 1.0) -> None:
+        """Render the game.
+
+        Args:
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+        """
+        with self.profiler.scope(f"draw/{self.state_manager.get_state()}"):
+            rects = self.draw(alpha=alpha)
+            if self.profiler_hud.is_visible:
+                hud_rect = self.profiler_hud.draw(self.render_target.surface)
+                if rects is not None:
+                    rects.append(hud_rect)
+
+        with self.profiler.scope("present"):
+            self.present(rects)
 
-    def render(self) -> None:
-        """Render the game."""
-        self.window.fill("#000000")
-        self.state_manager.draw(surface=self.window)
-        pygame.display.flip()
+    def draw(self, alpha: float = 1.0) -> List[pygame.Rect] | None:
+        """Draw the current state into the logical render target.
+
+        Args:
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+
+        Returns:
+            List[pygame.Rect] | None: Regions that changed when drawing dirty
+            rects, None when the whole frame was redrawn.
+        """
+        surface = self.render_target.surface
+        if self.config.dirty_rects:
+            return self.state_manager.draw_dirty(
+                surface=surface, background=CLEAR_COLOR, alpha=alpha
+            )
+
+        surface.fill(CLEAR_COLOR)
+        self.state_manager.draw(surface=surface, alpha=alpha)
+        return None
+
+    def present(self, rects: List[pygame.Rect] | None) -> None:
+        """Scale what was drawn into the window, and show it on the display.
+
+        Args:
+            rects (List[pygame.Rect] | None): Logical regions to update, or
+            None to update the whole window.
+        """
+        rects = self.render_target.present(self.window, rects)
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
 
     def deinit(self) -> None:
         """Safely close the main systems."""
+        self.executor.shutdown(cancel_futures=True)
+        if self.input_recorder is not None:
+            self.input_recorder.write()
+        if self.config.trace_path is not None:
+            self.tracer.write(self.config.trace_path)
         pygame.quit()
@@ -17,3 +17,5 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from .ball import Ball
+from .entity_store import EntityStore
+from .object_pool import ObjectPool
@@ -21,49 +21,71 @@ from typing import Tuple
 import pygame
 
 from .game_object import GameObject
+from ..rendering import LOGICAL_SIZE
 
 
 class Ball(GameObject):
-    """A bouncing ball."""
+    """A bouncing ball. A given sprite should already be scaled by `SCALE`,
+    e.g. through `AssetManager.get_transformed_texture`, so balls share it.
+    """
+
+    SCALE: float = 0.5
+
+    __slots__ = ("speed", "velocity")
 
     speed: float
     velocity: Tuple[float, float]
 
     def __init__(self, sprite: pygame.Surface | None = None) -> None:
         if sprite is None:
-            size = (24, 24)
-            half_size = (12, 12)
-            sprite = pygame.Surface(size)
-            pygame.draw.circle(sprite, "red", half_size, half_size[0])
+            sprite = Ball.create_sprite()
 
         super().__init__(sprite)
 
-        self.scale_by(0.5)
-
         self.speed = 400
         self.velocity = (self.speed, self.speed)
 
-    def update(self, delta_time: int) -> None:
-        """Moves ball and bounces ball as needed."""
-        self.position = (
-            self.position[0] + self.velocity[0] * delta_time,
-            self.position[1] + self.velocity[1] * delta_time,
-        )
-
-        bounds = pygame.display.get_window_size()
-
-        if self.position[0] < 0:
-            self.velocity = (-self.velocity[0], self.velocity[1])
-            self.position = (self.position[0] + 1, self.position[1])
-
-        if self.position[0] > bounds[0] - self.rect.size[0]:
-            self.velocity = (-self.velocity[0], self.velocity[1])
-            self.position = (self.position[0] - 1, self.position[1])
-
-        if self.position[1] < 0:
-            self.velocity = (self.velocity[0], -self.velocity[1])
-            self.position = (self.position[0], self.position[1] + 1)
-
-        if self.position[1] > bounds[1] - self.rect.size[1]:
-            self.velocity = (self.velocity[0], -self.velocity[1])
-            self.position = (self.position[0], self.position[1] - 1)
+    @staticmethod
+    def create_sprite() -> pygame.Surface:
+        """Draw the default ball sprite, a small red circle.
+
+        Returns:
+            pygame.Surface: The sprite, already scaled by `SCALE`.
+        """
+        size = (24, 24)
+        half_size = (12, 12)
+        sprite = pygame.Surface(size)
+        pygame.draw.circle(sprite, "red", half_size, half_size[0])
+        return pygame.transform.scale_by(sprite, Ball.SCALE)
+
+    def update(self, delta_time: float) -> None:
+        """Moves ball and bounces ball as needed.
+
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+        """
+        velocity_x, velocity_y = self.velocity
+        x = self.x + velocity_x * delta_time
+        y = self.y + velocity_y * delta_time
+
+        bounds = LOGICAL_SIZE
+        rect = self.rect
+
+        # the velocity tuple is only replaced on a bounce, so a step doesn't
+        # allocate anything besides the floats
+        if x < 0:
+            self.velocity = (-velocity_x, velocity_y)
+            x += 1
+        elif x > bounds[0] - rect.width:
+            self.velocity = (-velocity_x, velocity_y)
+            x -= 1
+
+        if y < 0:
+            self.velocity = (self.velocity[0], -velocity_y)
+            y += 1
+        elif y > bounds[1] - rect.height:
+            self.velocity = (self.velocity[0], -velocity_y)
+            y -= 1
+
+        self.x = x
+        self.y = y
@@ -0,0 +1,156 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from itertools import repeat
+from typing import Iterator, Tuple
+
+import numpy
+import pygame
+
+from ..rendering import BatchRenderer
+
+
+class EntityStore:
+    """Stores many bouncing entities sharing one image. Positions, velocities
+    and sizes live in contiguous NumPy arrays so the whole batch is moved and
+    bounced with a handful of vectorized operations per frame, instead of one
+    `pygame.sprite.Sprite` update per entity.
+    """
+
+    image: pygame.Surface
+    count: int
+    positions: numpy.ndarray
+    previous_positions: numpy.ndarray
+    velocities: numpy.ndarray
+    sizes: numpy.ndarray
+
+    def __init__(self, image: pygame.Surface, capacity: int = 1024) -> None:
+        self.image = image
+        self.count = 0
+        self.positions = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.previous_positions = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.velocities = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.sizes = numpy.zeros((capacity, 2), dtype=numpy.float32)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the arrays to hold at least `capacity` entities. Used internally.
+
+        Args:
+            capacity (int): Required number of entities.
+        """
+        if capacity <= len(self.positions):
+            return
+
+        new_capacity = max(capacity, 2 * len(self.positions))
+        for name in ("positions", "previous_positions", "velocities", "sizes"):
+            array = getattr(self, name)
+            grown = numpy.zeros((new_capacity, 2), dtype=array.dtype)
+            grown[: self.count] = array[: self.count]
+            setattr(self, name, grown)
+
+    def spawn(self, positions: numpy.ndarray, velocities: numpy.ndarray) -> None:
+        """Add entities.
+
+        Args:
+            positions (numpy.ndarray): Top left positions, shaped (n, 2).
+            velocities (numpy.ndarray): Velocities in pixels per second, shaped
+            (n, 2).
+        """
+        start = self.count
+        end = start + len(positions)
+        self._reserve(end)
+
+        self.positions[start:end] = positions
+        self.previous_positions[start:end] = positions
+        self.velocities[start:end] = velocities
+        self.sizes[start:end] = self.image.get_size()
+        self.count = end
+
+    def clear(self) -> None:
+        """Remove every entity."""
+        self.count = 0
+
+    def update(self, delta_time: float, bounds: Tuple[int, int]) -> None:
+        """Move every entity and bounce it off the edges of `bounds`.
+
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+            bounds (Tuple[int, int]): Size of the area to bounce within.
+        """
+        positions = self.positions[: self.count]
+        velocities = self.velocities[: self.count]
+        limits = numpy.subtract(bounds, self.sizes[: self.count])
+
+        self.previous_positions[: self.count] = positions
+        positions += velocities * delta_time
+
+        low = positions < 0
+        high = positions > limits
+        velocities[low] = numpy.abs(velocities[low])
+        velocities[high] = -numpy.abs(velocities[high])
+        numpy.clip(positions, 0, limits, out=positions)
+
+    def get_blits(
+        self, alpha: float = 1.0
+    ) -> Iterator[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the image and position of every entity, ready to blit.
+
+        Args:
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+
+        Returns:
+            Iterator[Tuple[pygame.Surface, Tuple[int, int]]]: Image and top
+            left position of each entity.
+        """
+        positions = self.positions[: self.count]
+        if alpha < 1.0:
+            previous = self.previous_positions[: self.count]
+            positions = previous + (positions - previous) * alpha
+        # one flat list per axis is much cheaper to convert than a list per
+        # entity
+        xs, ys = positions.astype(numpy.int32).T.tolist()
+        return zip(repeat(self.image), zip(xs, ys))
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw every entity.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+        """
+        if self.count:
+            surface.blits(self.get_blits(alpha), doreturn=False)
+
+    def submit(
+        self, renderer: BatchRenderer, alpha: float = 1.0, layer: int = 0
+    ) -> None:
+        """Queue every entity on a renderer.
+
+        Args:
+            renderer (BatchRenderer): Renderer to queue blits on.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+            layer (int, optional): Layer to draw on. Defaults to 0.
+        """
+        if self.count:
+            renderer.add_many(self.get_blits(alpha), layer, self.image)
@@ -20,38 +20,130 @@ from typing import Tuple
 
 import pygame
 
+from ..spatial_hash import SpatialHash
 
-class GameObject(pygame.sprite.Sprite):
-    """Base class for visible game objects."""
+
+class GameObject(pygame.sprite.Sprite):  # pylint: disable=R0902
+    """Base class for visible game objects.
+
+    The position is kept as floats in `x` and `y`, so movement smaller than a
+    pixel per step accumulates instead of being truncated. `rect` follows it
+    only when `sync_rect` is called, which `Gameplay` does at the end of each
+    update and again before drawing, so collision queries see current rects
+    while moving an object doesn't allocate.
+
+    Objects which aren't `active` stay in their groups but are neither updated
+    nor drawn, so pooled objects can be reused without leaving their groups.
+    """
+
+    __slots__ = (
+        "image",
+        "rect",
+        "x",
+        "y",
+        "previous_x",
+        "previous_y",
+        "dirty",
+        "active",
+        "spatial_hash",
+    )
 
     image: pygame.Surface
     rect: pygame.Rect
+    x: float
+    y: float
+    previous_x: float
+    previous_y: float
+    dirty: bool
+    active: bool
+    spatial_hash: SpatialHash | None
 
     def __init__(self, sprite: pygame.Surface):
         super().__init__()
         self.image = sprite
         self.rect = self.image.get_rect()
+        self.x = self.previous_x = 0.0
+        self.y = self.previous_y = 0.0
+        self.dirty = True
+        self.active = True
+        self.spatial_hash = None
 
     def scale_by(self, factor: float) -> None:
-        """Scale by a factor.
+        """Scale by a factor. This makes a copy of the image for this object
+        alone, prefer `AssetManager.get_transformed_texture` for shared images.
 
         Args:
             factor (float): The factor to scale by. Can pass multiple axes
             through a sequence.
         """
         self.image = pygame.transform.scale_by(self.image, factor)
-        self.rect = self.image.get_rect()
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
+        self.dirty = True
+        if self.spatial_hash is not None:
+            self.spatial_hash.move(self, self.rect)
 
     @property
-    def position(self) -> Tuple[int, int]:
+    def position(self) -> Tuple[float, float]:
         """Get the GameObject's position."""
-        return (self.rect.x, self.rect.y)
+        return (self.x, self.y)
 
     @position.setter
-    def position(self, value: Tuple[int, int]) -> None:
-        """Set the GameObject's position.
+    def position(self, value: Tuple[float, float]) -> None:
+        """Set the GameObject's position. `rect` follows on the next
+        `sync_rect`.
+
+        Args:
+            value (Tuple[float, float]): New position.
+        """
+        self.x, self.y = value
+
+    def sync_rect(self) -> None:
+        """Move `rect` to the current position, truncated to whole pixels, and
+        keep the spatial hash in sync. Does nothing if the pixel position
+        didn't change.
+        """
+        rect = self.rect
+        x = int(self.x)
+        y = int(self.y)
+        if x != rect.x or y != rect.y:
+            rect.x = x
+            rect.y = y
+            if self.spatial_hash is not None:
+                self.spatial_hash.move(self, rect)
+
+    def reset_position(self, value: Tuple[float, float]) -> None:
+        """Set the GameObject's position without interpolating from where it
+        was, e.g. when it's spawned.
+
+        Args:
+            value (Tuple[float, float]): New position.
+        """
+        self.x, self.y = value
+        self.previous_x, self.previous_y = value
+
+    @property
+    def previous_position(self) -> Tuple[float, float]:
+        """Get the position at the previous simulation step."""
+        return (self.previous_x, self.previous_y)
+
+    def store_previous_position(self) -> None:
+        """Remember the current position as the previous simulation step's
+        position. Called before each update so rendering can interpolate.
+        """
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    def interpolate(self, alpha: float) -> Tuple[float, float]:
+        """Get the position blended between the previous and current step.
 
         Args:
-            value (Tuple[int, int]): New position.
+            alpha (float): Interpolation factor. 0 is the previous position,
+            1 is the current position.
+
+        Returns:
+            Tuple[float, float]: The interpolated position.
         """
-        self.rect = pygame.Rect(value, self.rect.size)
+        return (
+            self.previous_x + (self.x - self.previous_x) * alpha,
+            self.previous_y + (self.y - self.previous_y) * alpha,
+        )
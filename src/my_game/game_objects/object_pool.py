@@ -0,0 +1,144 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable, Dict, Generic, List, TypeVar
+
+from .game_object import GameObject
+from ..rendering import DirtyGroup
+
+
+T = TypeVar("T", bound=GameObject)
+
+
+class ObjectPool(Generic[T]):
+    """Keeps released game objects around for reuse, so spawning one doesn't
+    allocate a new object, image and rect, and objects don't churn the
+    garbage collector.
+
+    Pooled objects join `group` once, when they're created. Releasing and
+    acquiring them only toggles whether they're active in it.
+    """
+
+    factory: Callable[[], T]
+    group: DirtyGroup | None
+    free: List[T]
+    size: int
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        preallocate: int = 0,
+        group: DirtyGroup | None = None,
+    ) -> None:
+        self.factory = factory
+        self.group = group
+        self.free = []
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        for _ in range(preallocate):
+            item = self._create()
+            self._set_active(item, False)
+            self.free.append(item)
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def _create(self) -> T:
+        """Create an object and add it to the group. Used internally.
+
+        Returns:
+            T: The object.
+        """
+        item = self.factory()
+        self.size += 1
+        if self.group is not None:
+            self.group.add(item)
+        return item
+
+    def _set_active(self, item: T, active: bool) -> None:
+        """Activate or deactivate an object, through the group if there is
+        one. Used internally.
+
+        Args:
+            item (T): The object.
+            active (bool): Whether it's updated and drawn.
+        """
+        if self.group is not None:
+            self.group.set_active(item, active)
+        else:
+            item.active = active
+
+    def acquire(self) -> T:
+        """Get an object, reusing a released one if there is one. It should be
+        placed with `GameObject.reset_position`.
+
+        Returns:
+            T: The active object.
+        """
+        if self.free:
+            self.hits += 1
+            item = self.free.pop()
+        else:
+            self.misses += 1
+            return self._create()
+
+        self._set_active(item, True)
+        item.dirty = True
+        return item
+
+    def release(self, item: T) -> None:
+        """Deactivate an object and keep it for reuse.
+
+        Args:
+            item (T): An active object acquired from this pool.
+
+        Raises:
+            ValueError: If the object was already released.
+        """
+        if not item.active:
+            raise ValueError("object was already released")
+        self._set_active(item, False)
+        self.free.append(item)
+
+    def get_hit_rate(self) -> float:
+        """Get how often `acquire` reused an object.
+
+        Returns:
+            float: Share of acquisitions served by a released object, 0 before
+            any.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, int | float]:
+        """Get usage statistics, e.g. to tune how much to preallocate.
+
+        Returns:
+            Dict[str, int | float]: Objects created, free objects, hits,
+            misses and hit rate.
+        """
+        return {
+            "size": self.size,
+            "free": len(self.free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.get_hit_rate(),
+        }
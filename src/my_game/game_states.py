@@ -22,6 +22,7 @@ from enum import StrEnum
 class GameStates(StrEnum):
     """Contains ID's used to manage state of the game."""
 
+    LOADING: str = "loading"
     MAIN_MENU: str = "main_menu"
     OPTIONS_MENU: str = "options_menu"
     GAMEPLAY: str = "gameplay"
@@ -16,25 +16,174 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from typing import List, Tuple
+
+import numpy
 import pygame
 
 from .events import GAMEPLAY_PAUSE
-from .game_objects import Ball
-from .managers import AssetManager
+from .game_objects import Ball, EntityStore, ObjectPool
+from .input_state import InputState
+from .managers import AssetManager, TextureHandle
+from .rendering import LOGICAL_SIZE, BatchRenderer, DirtyGroup
+from .spatial_hash import SpatialHash
 
 
-class Gameplay(pygame.sprite.Group):
+class Gameplay(DirtyGroup):
     """Contains all gameplay related functionality."""
 
+    BALL_SPEED: float = 400
+    BALLS_LAYER: int = 1
+
     is_paused: bool
+    balls: EntityStore
+    ball_pool: ObjectPool[Ball]
+    spatial_hash: SpatialHash
+    asset_manager: AssetManager
+    input_state: InputState
+    ball_texture: TextureHandle | None
 
-    def __init__(self, asset_manager: AssetManager):
-        super().__init__([Ball(asset_manager.get_texture("cardSpadesA"))])
+    def __init__(self, asset_manager: AssetManager, input_state: InputState):
+        self.asset_manager = asset_manager
+        self.input_state = input_state
+        self.ball_texture = None
+        self.spatial_hash = SpatialHash()
+        super().__init__()
         self.is_paused = False
+        texture = asset_manager.get_transformed_texture("cardSpadesA", scale=Ball.SCALE)
+        self.ball_pool = ObjectPool(lambda: Ball(texture), group=self)
+        self.ball_pool.acquire()
+        # bulk balls use the small default sprite, as tens of thousands of
+        # full size cards take far longer to blit than to simulate
+        self.balls = EntityStore(Ball.create_sprite())
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: None = None) -> None:
+        """Add a sprite to the group and to the spatial hash."""
+        super().add_internal(sprite, layer)
+        self.spatial_hash.insert(sprite, sprite.rect)
+        sprite.spatial_hash = self.spatial_hash
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the group and from the spatial hash."""
+        super().remove_internal(sprite)
+        if sprite in self.spatial_hash:
+            self.spatial_hash.remove(sprite)
+        sprite.spatial_hash = None
+
+    def set_active(self, sprite: pygame.sprite.Sprite, active: bool) -> None:
+        """Show or hide a sprite, taking it out of the spatial hash while it's
+        hidden."""
+        super().set_active(sprite, active)
+        if active and sprite not in self.spatial_hash:
+            self.spatial_hash.insert(sprite, sprite.rect)
+            sprite.spatial_hash = self.spatial_hash
+        elif not active and sprite in self.spatial_hash:
+            self.spatial_hash.remove(sprite)
+            sprite.spatial_hash = None
+
+    def on_resume(self) -> None:
+        """Hold on to the ball texture while playing, so its spritesheet isn't
+        evicted.
+        """
+        if self.ball_texture is None:
+            self.ball_texture = self.asset_manager.acquire_texture("cardSpadesA")
+
+    def on_suspend(self) -> None:
+        """Let the ball texture's spritesheet be evicted while not playing."""
+        if self.ball_texture is not None:
+            self.ball_texture.release()
+            self.ball_texture = None
+
+    def spawn_balls(self, count: int) -> None:
+        """Spawn bouncing balls at random positions, moving in random diagonal
+        directions. These are simulated in bulk rather than as sprites.
+
+        Args:
+            count (int): Number of balls to spawn.
+        """
+        rng = numpy.random.default_rng()
+        bounds = numpy.subtract(LOGICAL_SIZE, self.balls.image.get_size())
+        positions = rng.uniform((0, 0), bounds, size=(count, 2))
+        directions = rng.choice((-1.0, 1.0), size=(count, 2))
+        self.balls.spawn(positions, directions * Gameplay.BALL_SPEED)
+
+    def update(self, delta_time: float) -> None:
+        """Update gameplay.
 
-    def update(self, *args, **kwargs) -> None:
-        """Update gameplay."""
-        super().update(*args, **kwargs)
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+        """
+        for sprite in self.sprites():
+            sprite.store_previous_position()
 
-        if pygame.key.get_pressed()[pygame.K_ESCAPE]:
+        super().update(delta_time)
+        # keep rects and the spatial hash current for collision queries
+        self.sync_rects()
+        self.balls.update(delta_time, LOGICAL_SIZE)
+
+        if self.input_state.is_key_pressed(pygame.K_ESCAPE):
             pygame.event.post(pygame.event.Event(GAMEPLAY_PAUSE))
+
+    def sync_rects(self) -> None:
+        """Move the rect of every game object to its current position. Done
+        after each update and before drawing, rather than on every step of
+        movement.
+        """
+        for sprite in self.sprites():
+            sprite.sync_rect()
+
+    def submit(self, renderer: BatchRenderer, alpha: float = 1.0) -> None:
+        """Queue the game objects, then the bulk balls on their own layer.
+
+        Args:
+            renderer (BatchRenderer): Renderer to queue blits on.
+            alpha (float, optional): Interpolation factor between the previous
+            simulation step, at `previous_x`/`previous_y`, and the current one,
+            at `x`/`y`. Defaults to 1.0.
+        """
+        self.sync_rects()
+        super().submit(renderer, alpha)
+        self.balls.submit(renderer, alpha, Gameplay.BALLS_LAYER)
+
+    def draw_dirty(
+        self,
+        surface: pygame.Surface,
+        background: pygame.Color | pygame.Surface,
+        alpha: float = 1.0,
+    ) -> List[pygame.Rect]:
+        """Redraw the regions that changed since the last call. While there
+        are bulk balls, everything is redrawn.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto. Must still contain
+            the previous frame.
+            background (pygame.Color | pygame.Surface): Color to clear regions
+            with, or a surface of the same size to restore them from.
+            alpha (float, optional): Interpolation factor between the previous
+            simulation step, at `previous_x`/`previous_y`, and the current one,
+            at `x`/`y`. Defaults to 1.0.
+
+        Returns:
+            List[pygame.Rect]: Regions of the surface that were redrawn.
+        """
+        # balls are scattered across the screen and move every frame
+        if self.balls:
+            self.invalidate()
+        self.sync_rects()
+        return super().draw_dirty(surface, background, alpha)
+
+    def _draw_position(
+        self, sprite: pygame.sprite.Sprite, alpha: float
+    ) -> Tuple[float, float]:
+        """Get where a game object should be drawn, between its previous and
+        current position. Used internally.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The game object being drawn.
+            alpha (float): Interpolation factor, from 0 at `previous_x`/
+            `previous_y` to 1 at `x`/`y`.
+
+        Returns:
+            Tuple[float, float]: Top left position to draw it at.
+        """
+        return sprite.interpolate(alpha)
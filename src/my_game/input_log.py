@@ -0,0 +1,254 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import struct
+
+from typing import Dict, List, Tuple
+
+import pygame
+
+
+MAGIC: bytes = b"MGIL"
+VERSION: int = 1
+HEADER = struct.Struct("<4sH")
+# delta time in seconds, and number of events
+FRAME = struct.Struct("<dH")
+KIND = struct.Struct("<B")
+# key and modifiers
+KEY = struct.Struct("<iH")
+# position, and pressed buttons as a bitmask
+MOTION = struct.Struct("<hhB")
+# position and button
+BUTTON = struct.Struct("<hhB")
+
+# kinds of recorded events. Events the game posts itself, e.g. when a button
+# is pressed, are regenerated when replaying, so only their place in the
+# frame's event order is recorded, as `INTERNAL`.
+INTERNAL: int = 0
+EVENT_KINDS: Dict[int, int] = {
+    pygame.QUIT: 1,
+    pygame.KEYDOWN: 2,
+    pygame.KEYUP: 3,
+    pygame.MOUSEMOTION: 4,
+    pygame.MOUSEBUTTONDOWN: 5,
+    pygame.MOUSEBUTTONUP: 6,
+}
+EVENT_TYPES: Dict[int, int] = {
+    kind: event_type for event_type, kind in EVENT_KINDS.items()
+}
+
+# recorded events of a frame, None marking where an internal event goes
+RecordedEvents = List[pygame.event.Event | None]
+
+
+def is_internal(event: pygame.event.Event) -> bool:
+    """Check whether an event was posted by the game rather than by SDL.
+
+    Args:
+        event (pygame.event.Event): The event.
+
+    Returns:
+        bool: Whether it's one of the game's own events.
+    """
+    return pygame.USEREVENT <= event.type < pygame.NUMEVENTS
+
+
+class InputRecorder:
+    """Records the input events and delta time of every frame into a compact
+    binary log, which `InputReplay` plays back.
+    """
+
+    path: str
+    buffer: bytearray
+    frame_count: int
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.buffer = bytearray(HEADER.pack(MAGIC, VERSION))
+        self.frame_count = 0
+
+    def record_frame(self, delta_time: float, events: List[pygame.event.Event]) -> None:
+        """Record a frame.
+
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+            events (List[pygame.event.Event]): Events handled in the frame, in
+            order. Events which aren't input are left out.
+        """
+        payload = bytearray()
+        count = 0
+        for event in events:
+            if is_internal(event):
+                payload += KIND.pack(INTERNAL)
+                count += 1
+                continue
+
+            kind = EVENT_KINDS.get(event.type)
+            if kind is None:
+                continue
+            payload += KIND.pack(kind)
+            count += 1
+            match event.type:
+                case pygame.KEYDOWN | pygame.KEYUP:
+                    payload += KEY.pack(event.key, event.mod)
+                case pygame.MOUSEMOTION:
+                    buttons = sum(
+                        1 << i for i, pressed in enumerate(event.buttons) if pressed
+                    )
+                    payload += MOTION.pack(*event.pos, buttons)
+                case pygame.MOUSEBUTTONDOWN | pygame.MOUSEBUTTONUP:
+                    payload += BUTTON.pack(*event.pos, event.button)
+
+        self.buffer += FRAME.pack(delta_time, count)
+        self.buffer += payload
+        self.frame_count += 1
+
+    def write(self) -> None:
+        """Write the log to `path`."""
+        with open(self.path, "wb") as file:
+            file.write(self.buffer)
+
+
+class InputReplay:
+    """Plays back a log written by `InputRecorder`, one frame at a time."""
+
+    frames: List[Tuple[float, RecordedEvents]]
+    frame_index: int
+    events: RecordedEvents
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            data = file.read()
+        self.frames = InputReplay._parse(data)
+        self.frame_index = 0
+        self.events = []
+
+    @staticmethod
+    def _parse(data: bytes) -> List[Tuple[float, RecordedEvents]]:
+        """Parse a log. Used internally.
+
+        Args:
+            data (bytes): Contents of the log.
+
+        Raises:
+            ValueError: If it's not an input log of a supported version.
+
+        Returns:
+            List[Tuple[float, RecordedEvents]]: Delta time and events of each
+            frame.
+        """
+        magic, version = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an input log, or an unsupported version")
+
+        frames = []
+        offset = HEADER.size
+        while offset < len(data):
+            delta_time, count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(count):
+                (kind,) = KIND.unpack_from(data, offset)
+                offset += KIND.size
+                if kind == INTERNAL:
+                    events.append(None)
+                    continue
+
+                event, offset = InputReplay._parse_event(data, offset, kind)
+                events.append(event)
+            frames.append((delta_time, events))
+        return frames
+
+    @staticmethod
+    def _parse_event(
+        data: bytes, offset: int, kind: int
+    ) -> Tuple[pygame.event.Event, int]:
+        """Parse the payload of a recorded event. Used internally.
+
+        Args:
+            data (bytes): Contents of the log.
+            offset (int): Offset of the payload.
+            kind (int): Kind of the event, from `EVENT_KINDS`.
+
+        Returns:
+            Tuple[pygame.event.Event, int]: The event, and the offset past its
+            payload.
+        """
+        event_type = EVENT_TYPES[kind]
+        match event_type:
+            case pygame.KEYDOWN | pygame.KEYUP:
+                key, mod = KEY.unpack_from(data, offset)
+                event = pygame.event.Event(event_type, key=key, mod=mod)
+                return event, offset + KEY.size
+
+            case pygame.MOUSEMOTION:
+                x, y, buttons = MOTION.unpack_from(data, offset)
+                event = pygame.event.Event(
+                    event_type,
+                    pos=(x, y),
+                    rel=(0, 0),
+                    buttons=tuple(bool(buttons & (1 << i)) for i in range(3)),
+                )
+                return event, offset + MOTION.size
+
+            case pygame.MOUSEBUTTONDOWN | pygame.MOUSEBUTTONUP:
+                x, y, button = BUTTON.unpack_from(data, offset)
+                event = pygame.event.Event(event_type, pos=(x, y), button=button)
+                return event, offset + BUTTON.size
+
+            case _:
+                return pygame.event.Event(event_type), offset
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def next_frame(self) -> float | None:
+        """Move on to the next recorded frame.
+
+        Returns:
+            float | None: Its delta time, in seconds. None once every frame was
+            played back.
+        """
+        if self.frame_index >= len(self.frames):
+            return None
+        delta_time, self.events = self.frames[self.frame_index]
+        self.frame_index += 1
+        return delta_time
+
+    def get_events(self, queued: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Get the events of the current frame.
+
+        Args:
+            queued (List[pygame.event.Event]): Events pygame queued this frame.
+            Only those posted by the game are kept, input comes from the log.
+
+        Returns:
+            List[pygame.event.Event]: The events, in the order they were
+            recorded in.
+        """
+        internal = iter([event for event in queued if is_internal(event)])
+        events = []
+        for event in self.events:
+            if event is None:
+                event = next(internal, None)
+                if event is None:
+                    continue
+            events.append(event)
+        # anything the game posted beyond what was recorded goes last
+        events.extend(internal)
+        return events
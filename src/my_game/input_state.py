@@ -0,0 +1,98 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Set, Tuple
+
+import pygame
+
+
+class InputState:
+    """The state of the keyboard and mouse, built from the events the game
+    receives rather than by polling pygame. Since it only depends on events,
+    recorded sessions reproduce it exactly.
+
+    Fed by `handle_event`, which should be subscribed to `KEYDOWN`, `KEYUP`,
+    `MOUSEMOTION`, `MOUSEBUTTONDOWN` and `MOUSEBUTTONUP`.
+    """
+
+    EVENT_TYPES: Tuple[int, ...] = (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+    )
+
+    pressed_keys: Set[int]
+    pressed_buttons: Set[int]
+    mouse_position: Tuple[int, int]
+
+    def __init__(self) -> None:
+        self.pressed_keys = set()
+        self.pressed_buttons = set()
+        self.mouse_position = (0, 0)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Update the state from an event.
+
+        Args:
+            event (pygame.event.Event): A keyboard or mouse event. Other events
+            are ignored.
+        """
+        match event.type:
+            case pygame.KEYDOWN:
+                self.pressed_keys.add(event.key)
+
+            case pygame.KEYUP:
+                self.pressed_keys.discard(event.key)
+
+            case pygame.MOUSEMOTION:
+                self.mouse_position = event.pos
+
+            case pygame.MOUSEBUTTONDOWN:
+                self.mouse_position = event.pos
+                self.pressed_buttons.add(event.button)
+
+            case pygame.MOUSEBUTTONUP:
+                self.mouse_position = event.pos
+                self.pressed_buttons.discard(event.button)
+
+            case _:
+                pass
+
+    def is_key_pressed(self, key: int) -> bool:
+        """Check whether a key is held down.
+
+        Args:
+            key (int): The key, e.g. `pygame.K_ESCAPE`.
+
+        Returns:
+            bool: Whether it's held down.
+        """
+        return key in self.pressed_keys
+
+    def is_button_pressed(self, button: int) -> bool:
+        """Check whether a mouse button is held down.
+
+        Args:
+            button (int): The button, e.g. `pygame.BUTTON_LEFT`.
+
+        Returns:
+            bool: Whether it's held down.
+        """
+        return button in self.pressed_buttons
@@ -17,5 +17,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from .asset_manager import AssetManager
-from .font_manager import FontManager
+from .async_loader import AsyncLoader
+from .font_manager import FontManager, TextStyle
 from .state_manager import StateManager
+from .texture_cache import TextureCache, TextureHandle
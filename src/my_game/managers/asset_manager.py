@@ -16,21 +16,57 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pathlib
-
-from typing import Dict
-from xml.etree import ElementTree
+from concurrent.futures import Executor, Future
+from typing import Dict, Tuple
 
 import pygame
 
+from .async_loader import AsyncLoader
+from ..profiling import TraceRecorder
+from .atlas_cache import (
+    DEFAULT_CACHE_DIR,
+    Atlas,
+    build_atlas_cache,
+    load_atlas_cache,
+)
+from .texture_cache import (
+    DEFAULT_TEXTURE_BUDGET,
+    TextureCache,
+    TextureHandle,
+    TransformKey,
+)
+
+
+class AssetManager(AsyncLoader):
+    """Manages assets such as texture and sounds. Spritesheets are cached in
+    `cache_dir` in a binary format which is faster to load, unless it's None.
+
+    Spritesheet textures live in a `TextureCache` limited to `texture_budget`
+    bytes. Evicted spritesheets are reloaded on the next `get_texture`.
 
-class AssetManager:
-    """Manages assets such as texture and sounds."""
+    Textures are converted to the display's pixel format once a display mode is
+    set, so blitting them doesn't convert pixels every frame.
+    """
 
     textures: Dict[str, pygame.Surface]
+    texture_transforms: Dict[TransformKey, pygame.Surface]
+    texture_atlases: Dict[str, str]
+    texture_cache: TextureCache
+    cache_dir: str | None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_dir: str | None = DEFAULT_CACHE_DIR,
+        executor: Executor | None = None,
+        texture_budget: int = DEFAULT_TEXTURE_BUDGET,
+        tracer: TraceRecorder | None = None,
+    ) -> None:
+        super().__init__(executor, tracer)
         self.textures = {}
+        self.texture_transforms = {}
+        self.texture_atlases = {}
+        self.texture_cache = TextureCache(texture_budget)
+        self.cache_dir = cache_dir
 
     def load_spritesheet(self, path: str) -> None:
         """Load textures from an XML spritesheet.
@@ -44,34 +80,90 @@ class AssetManager:
         </TextureAtlas>
         ```
 
+        When caching is enabled, a valid binary cache of the spritesheet is
+        loaded instead, skipping XML parsing and image decoding. Otherwise the
+        cache is (re)built.
+
+        Args:
+            path (str): Path to the XML spritesheet.
+        """
+        with self._trace(f"load_spritesheet {path}"):
+            self._add_spritesheet(path, self._read_spritesheet(path))
+
+    def load_spritesheet_async(self, path: str) -> Future:
+        """Load textures from an XML spritesheet on the worker thread pool. The
+        textures are added by `process_loaded` once it's done.
+
+        Args:
+            path (str): Path to the XML spritesheet.
+
+        Returns:
+            Future: Handle on the background load.
+        """
+        return self._load_async(
+            lambda: self._read_spritesheet(path),
+            lambda atlas: self._add_spritesheet(path, atlas),
+        )
+
+    def _read_spritesheet(self, path: str) -> Atlas:
+        """Read a spritesheet from its cache, or parse it and rebuild its cache.
+        Used internally, safe to call from worker threads.
+
+        Args:
+            path (str): Path to the XML spritesheet.
+
+        Returns:
+            Atlas: The atlas surface and the rect of each subtexture.
+        """
+        with self._trace(f"read_spritesheet {path}"):
+            atlas = None
+            if self.cache_dir is not None:
+                atlas = load_atlas_cache(path, self.cache_dir)
+            if atlas is None:
+                atlas = build_atlas_cache(path, self.cache_dir)
+            return atlas
+
+    def _add_spritesheet(self, path: str, atlas: Atlas) -> None:
+        """Add the textures of a loaded spritesheet to the texture cache. Used
+        internally.
+
         Args:
             path (str): Path to the XML spritesheet.
+            atlas (Atlas): The atlas surface and the rect of each subtexture.
         """
-        xml = ElementTree.parse(path)
-        root = xml.getroot()
-
-        image_path = pathlib.Path(path).parent / root.attrib["imagePath"]
-        atlas_surf = pygame.image.load(image_path)
-
-        for child in root:
-            name = child.attrib["name"]
-            rect = pygame.Rect(
-                int(child.attrib["x"]),
-                int(child.attrib["y"]),
-                int(child.attrib["width"]),
-                int(child.attrib["height"]),
-            )
-            sprite_surf = atlas_surf.subsurface(rect)
-            self.add_texture(name, sprite_surf)
+        with self._trace(f"add_spritesheet {path}"):
+            atlas_surf, rects = atlas
+            atlas_surf = self._convert(atlas_surf)
+            textures = {
+                name: atlas_surf.subsurface(rect) for name, rect in rects.items()
+            }
+            self.texture_cache.add(path, atlas_surf, textures)
+            for name in textures:
+                self.texture_atlases[name] = path
+
+    def _get_atlas_path(self, name: str) -> str:
+        """Get the spritesheet of a texture, reloading it if it was evicted.
+        Used internally.
+
+        Args:
+            name (str): Name of the texture.
+
+        Returns:
+            str: Path to the XML spritesheet.
+        """
+        path = self.texture_atlases[name]
+        if path not in self.texture_cache:
+            self.load_spritesheet(path)
+        return path
 
     def add_texture(self, name: str, surface: pygame.Surface) -> None:
-        """Add a texture to the AssetManager.
+        """Add a texture to the AssetManager. Such textures are never evicted.
 
         Args:
             name (str): Name of the texture. Used to reference the texture.
             surface (pygame.Surface): Surface containing the texture.
         """
-        self.textures[name] = surface
+        self.textures[name] = self._convert(surface)
 
     def get_texture(self, name: str) -> pygame.Surface:
         """Get a loaded texture by name.
@@ -82,4 +174,102 @@ class AssetManager:
         Returns:
             pygame.Surface: The requested texture surface.
         """
-        return self.textures[name]
+        if name in self.textures:
+            return self.textures[name]
+
+        atlas = self.texture_cache.get(self._get_atlas_path(name))
+        return atlas.textures[name]
+
+    def get_transformed_texture(
+        self,
+        name: str,
+        scale: float = 1.0,
+        rotation: float = 0.0,
+        flip: Tuple[bool, bool] = (False, False),
+    ) -> pygame.Surface:
+        """Get a flipped, rotated and scaled copy of a loaded texture. Copies
+        are cached, so objects using the same transform share one surface
+        rather than transforming the texture each.
+
+        Args:
+            name (str): Name of the texture.
+            scale (float, optional): Factor to scale by. Defaults to 1.0.
+            rotation (float, optional): Counterclockwise rotation, in degrees.
+            Defaults to 0.0.
+            flip (Tuple[bool, bool], optional): Whether to flip horizontally
+            and vertically. Defaults to (False, False).
+
+        Returns:
+            pygame.Surface: The transformed texture surface.
+        """
+        transform = (name, scale, rotation, flip[0], flip[1])
+        if name in self.textures:
+            surface = self.texture_transforms.get(transform)
+            if surface is None:
+                surface = self._transform(self.textures[name], transform)
+                self.texture_transforms[transform] = surface
+            return surface
+
+        path = self._get_atlas_path(name)
+        atlas = self.texture_cache.get(path)
+        surface = atlas.transforms.get(transform)
+        if surface is None:
+            surface = self._transform(atlas.textures[name], transform)
+            self.texture_cache.add_transform(path, transform, surface)
+        return surface
+
+    def _transform(
+        self, surface: pygame.Surface, transform: TransformKey
+    ) -> pygame.Surface:
+        """Apply a transform to a texture. Used internally.
+
+        Args:
+            surface (pygame.Surface): The texture.
+            transform (TransformKey): Texture name and transform to apply.
+
+        Returns:
+            pygame.Surface: The transformed texture, in the display's format.
+        """
+        _, scale, rotation, flip_x, flip_y = transform
+        if flip_x or flip_y:
+            surface = pygame.transform.flip(surface, flip_x, flip_y)
+        if rotation:
+            surface = pygame.transform.rotate(surface, rotation)
+        if scale != 1.0:
+            surface = pygame.transform.scale_by(surface, scale)
+        return self._convert(surface)
+
+    def _convert(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convert a surface to the display's pixel format, keeping per-pixel
+        alpha. Surfaces are returned as is until a display mode is set. Used
+        internally.
+
+        Args:
+            surface (pygame.Surface): The surface to convert.
+
+        Returns:
+            pygame.Surface: The converted surface.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
+
+    def acquire_texture(self, name: str) -> TextureHandle:
+        """Get a handle on a loaded texture by name. Its spritesheet stays
+        resident until the handle is released.
+
+        Args:
+            name (str): Name of the texture.
+
+        Returns:
+            TextureHandle: Handle on the requested texture.
+        """
+        return self.texture_cache.acquire(self._get_atlas_path(name), name)
+
+    def get_resident_bytes(self) -> int:
+        """Get how much memory the resident spritesheets use.
+
+        Returns:
+            int: Size of the resident spritesheets, in bytes.
+        """
+        return self.texture_cache.resident_bytes
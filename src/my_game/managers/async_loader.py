@@ -0,0 +1,103 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, List, Tuple
+
+from ..profiling import TraceRecorder, trace_scope
+
+
+class AsyncLoader:
+    """Base class for managers which load assets in the background.
+
+    Slow work such as decoding and parsing runs on a worker thread pool. Its
+    result is handed back to the manager on the main thread by
+    `process_loaded`, which should be called once per frame.
+
+    Loads are recorded to `tracer`, if given.
+    """
+
+    TRACE_CATEGORY: str = "assets"
+
+    executor: Executor
+    tracer: TraceRecorder | None
+    pending: List[Tuple[Future, Callable[[Any], None]]]
+    queued_count: int
+    loaded_count: int
+
+    def __init__(
+        self, executor: Executor | None = None, tracer: TraceRecorder | None = None
+    ) -> None:
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+        self.tracer = tracer
+        self.pending = []
+        self.queued_count = 0
+        self.loaded_count = 0
+
+    def _trace(self, name: str) -> ContextManager:
+        """Record the begin and end of a block to the tracer. Used internally.
+
+        Args:
+            name (str): Name of the traced event.
+
+        Returns:
+            ContextManager: Context manager wrapping the block.
+        """
+        return trace_scope(self.tracer, name, AsyncLoader.TRACE_CATEGORY)
+
+    def _load_async(
+        self, load: Callable[[], Any], finish: Callable[[Any], None]
+    ) -> Future:
+        """Run `load` on the worker thread pool. Used internally.
+
+        Args:
+            load (Callable[[], Any]): Work to run in the background.
+            finish (Callable[[Any], None]): Called on the main thread with the
+            result of `load`, from `process_loaded`.
+
+        Returns:
+            Future: Handle on the background work.
+        """
+        future = self.executor.submit(load)
+        self.pending.append((future, finish))
+        self.queued_count += 1
+        return future
+
+    def process_loaded(self) -> None:
+        """Finish the background loads which are done. Errors raised while
+        loading are re-raised here.
+        """
+        if not self.pending:
+            return
+
+        still_pending = []
+        for future, finish in self.pending:
+            if future.done():
+                finish(future.result())
+                self.loaded_count += 1
+            else:
+                still_pending.append((future, finish))
+        self.pending = still_pending
+
+    def is_loading(self) -> bool:
+        """Returns whether background loads are still pending.
+
+        Returns:
+            bool: Whether anything is still loading.
+        """
+        return bool(self.pending)
@@ -0,0 +1,285 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import mmap
+import os
+import pathlib
+import struct
+
+from typing import Dict, Tuple
+from xml.etree import ElementTree
+
+import pygame
+
+
+# Cache file layout, all little endian:
+#   header, see `HEADER`
+#   image path, utf-8, relative to the spritesheet
+#   index, one `INDEX_ENTRY` followed by the utf-8 name per subtexture
+#   padding up to `pixel_offset`
+#   raw RGBA pixels of the whole atlas
+MAGIC: bytes = b"MGAC"
+VERSION: int = 1
+# magic, version, image path length, source hash, width, height, count, pixel offset
+HEADER: struct.Struct = struct.Struct("<4sHH32sIIII")
+# x, y, width, height, name length
+INDEX_ENTRY: struct.Struct = struct.Struct("<HHHHH")
+PIXEL_ALIGNMENT: int = 16
+DEFAULT_CACHE_DIR: str = "data/cache"
+
+Atlas = Tuple[pygame.Surface, Dict[str, pygame.Rect]]
+
+
+def parse_spritesheet(path: str) -> Tuple[pathlib.Path, Dict[str, pygame.Rect]]:
+    """Parse an XML spritesheet.
+
+    Follows Kenney's assets spritesheet format:
+
+    ```xml
+    <TextureAtlas imagePath="./relative/path/to/texture.png">
+        <SubTexture name="textureID" x="0" y="0" width="100" height="200" />
+        ...
+    </TextureAtlas>
+    ```
+
+    Args:
+        path (str): Path to the XML spritesheet.
+
+    Returns:
+        Tuple[pathlib.Path, Dict[str, pygame.Rect]]: Path to the atlas image and
+        the rect of each subtexture within it.
+    """
+    xml = ElementTree.parse(path)
+    root = xml.getroot()
+
+    image_path = pathlib.Path(path).parent / root.attrib["imagePath"]
+    rects = {
+        child.attrib["name"]: pygame.Rect(
+            int(child.attrib["x"]),
+            int(child.attrib["y"]),
+            int(child.attrib["width"]),
+            int(child.attrib["height"]),
+        )
+        for child in root
+    }
+    return image_path, rects
+
+
+def hash_sources(path: str, image_path: pathlib.Path) -> bytes:
+    """Hash the spritesheet and its atlas image. The files are only read, not
+    parsed or decoded.
+
+    Args:
+        path (str): Path to the XML spritesheet.
+        image_path (pathlib.Path): Path to the atlas image.
+
+    Returns:
+        bytes: SHA-256 digest of both files.
+    """
+    digest = hashlib.sha256()
+    for source in (path, image_path):
+        with open(source, "rb") as file:
+            digest.update(file.read())
+    return digest.digest()
+
+
+def get_cache_path(path: str, cache_dir: str) -> pathlib.Path:
+    """Get where the cache of a spritesheet is stored.
+
+    Args:
+        path (str): Path to the XML spritesheet.
+        cache_dir (str): Directory holding cache files.
+
+    Returns:
+        pathlib.Path: Path to the cache file.
+    """
+    return pathlib.Path(cache_dir) / f"{pathlib.Path(path).stem}.atlas"
+
+
+def build_atlas_cache(path: str, cache_dir: str | None = DEFAULT_CACHE_DIR) -> Atlas:
+    """Parse a spritesheet, decode its image and write both to a cache file.
+
+    Args:
+        path (str): Path to the XML spritesheet.
+        cache_dir (str | None, optional): Directory holding cache files. When
+        None, the spritesheet is loaded without writing a cache. Defaults to
+        `DEFAULT_CACHE_DIR`.
+
+    Returns:
+        Atlas: The atlas surface and the rect of each subtexture.
+    """
+    image_path, rects = parse_spritesheet(path)
+    atlas_surf = pygame.image.load(image_path)
+    if cache_dir is None:
+        return atlas_surf, rects
+
+    relative_image_path = os.path.relpath(image_path, pathlib.Path(path).parent)
+    encoded_image_path = relative_image_path.encode("utf-8")
+    index = b"".join(
+        INDEX_ENTRY.pack(rect.x, rect.y, rect.w, rect.h, len(name.encode("utf-8")))
+        + name.encode("utf-8")
+        for name, rect in rects.items()
+    )
+    pixel_offset = HEADER.size + len(encoded_image_path) + len(index)
+    pixel_offset += -pixel_offset % PIXEL_ALIGNMENT
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(encoded_image_path),
+        hash_sources(path, image_path),
+        atlas_surf.get_width(),
+        atlas_surf.get_height(),
+        len(rects),
+        pixel_offset,
+    )
+    data = header + encoded_image_path + index
+    data += bytes(pixel_offset - len(data))
+
+    cache_path = get_cache_path(path, cache_dir)
+    temp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.write(pygame.image.tobytes(atlas_surf, "RGBA"))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # a missing cache only costs startup time
+        pass
+    finally:
+        with contextlib.suppress(OSError):
+            temp_path.unlink(missing_ok=True)
+
+    return atlas_surf, rects
+
+
+def load_atlas_cache(path: str, cache_dir: str = DEFAULT_CACHE_DIR) -> Atlas | None:
+    """Load a spritesheet from its cache file, without parsing XML or decoding
+    the image. The pixels are memory-mapped rather than read.
+
+    Args:
+        path (str): Path to the XML spritesheet.
+        cache_dir (str, optional): Directory holding cache files. Defaults to
+        `DEFAULT_CACHE_DIR`.
+
+    Returns:
+        Atlas | None: The atlas surface and the rect of each subtexture. None
+        if there's no cache or it is out of date.
+    """
+    try:
+        with open(get_cache_path(path, cache_dir), "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        return _read_cache(buffer, path)
+    except (ValueError, struct.error):
+        # truncated or corrupt, rebuild it
+        return None
+
+
+def _read_cache(buffer: mmap.mmap, path: str) -> Atlas | None:
+    """Read the contents of a cache file. Used internally.
+
+    Args:
+        buffer (mmap.mmap): Contents of the cache file.
+        path (str): Path to the XML spritesheet.
+
+    Returns:
+        Atlas | None: The atlas surface and the rect of each subtexture. None
+        if the cache is out of date or truncated.
+
+    Raises:
+        ValueError: If the file is corrupt.
+        struct.error: If the file is corrupt.
+    """
+    if len(buffer) < HEADER.size:
+        return None
+
+    (
+        magic,
+        version,
+        image_path_length,
+        source_hash,
+        width,
+        height,
+        count,
+        pixel_offset,
+    ) = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        return None
+    if len(buffer) < pixel_offset + width * height * 4:
+        return None
+
+    offset = HEADER.size + image_path_length
+    image_path = buffer[HEADER.size : offset].decode("utf-8")
+    try:
+        if source_hash != hash_sources(path, pathlib.Path(path).parent / image_path):
+            return None
+    except OSError:
+        return None
+
+    rects = _read_index(buffer, offset, count)
+    atlas_surf = pygame.image.frombuffer(
+        memoryview(buffer)[pixel_offset : pixel_offset + width * height * 4],
+        (width, height),
+        "RGBA",
+    )
+    return atlas_surf, rects
+
+
+def _read_index(buffer: mmap.mmap, offset: int, count: int) -> Dict[str, pygame.Rect]:
+    """Read the subtexture index of a cache file. Used internally.
+
+    Args:
+        buffer (mmap.mmap): Contents of the cache file.
+        offset (int): Offset of the index in the file.
+        count (int): Number of subtextures.
+
+    Returns:
+        Dict[str, pygame.Rect]: The rect of each subtexture.
+    """
+    rects = {}
+    for _ in range(count):
+        x, y, w, h, name_length = INDEX_ENTRY.unpack_from(buffer, offset)
+        offset += INDEX_ENTRY.size
+        name = buffer[offset : offset + name_length].decode("utf-8")
+        rects[name] = pygame.Rect(x, y, w, h)
+        offset += name_length
+    return rects
+
+
+def main() -> None:
+    """Build the cache of spritesheets from the command line."""
+    parser = argparse.ArgumentParser(description="Build binary atlas caches.")
+    parser.add_argument("spritesheets", nargs="+")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    for path in args.spritesheets:
+        build_atlas_cache(path, args.cache_dir)
+        print(f"Built {get_cache_path(path, args.cache_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,23 +16,118 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict
+import io
+
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
 
 import pygame
 
+from .async_loader import AsyncLoader
+from ..profiling import TraceRecorder
+from ..rendering.glyph_atlas import ColorValue, GlyphAtlas
+
+
+DEFAULT_FONT_SIZE: int = 12
+# sizes beyond those fonts were added with, kept before the least recently
+# used is evicted
+DEFAULT_FONT_CACHE_SIZE: int = 8
+DEFAULT_TEXT_CACHE_SIZE: int = 256
+
+# path and size of a font
+FontKey = Tuple[str, int]
+
+# font, color, antialias and background of text
+StyleKey = Tuple[FontKey, Tuple[int, ...], bool, Tuple[int, ...] | None]
+TextKey = Tuple[StyleKey, str]
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    """Data structure for holding how text is drawn by a `FontManager`.
+
+    Attributes:
+        color (ColorValue): Color of the text.
+        name (str): String name ID of the font. Defaults to "default".
+        size (int | None): Size of the font. Defaults to None, the size it was
+        added with.
+        antialias (bool): Smooth the edges of the text. Defaults to True.
+        background (ColorValue | None): Color behind the text. Defaults to
+        None, a transparent background.
+    """
+
+    color: ColorValue
+    name: str = "default"
+    size: int | None = None
+    antialias: bool = True
+    background: ColorValue | None = None
+
 
-class FontManager:
-    """Manages loaded fonts."""
+def get_color_key(color: ColorValue | None) -> Tuple[int, ...] | None:
+    """Get a hashable key for a color, which may be given as an unhashable
+    `pygame.Color`.
+
+    Args:
+        color (ColorValue | None): The color.
+
+    Returns:
+        Tuple[int, ...] | None: Its RGBA values, None for no color.
+    """
+    return None if color is None else tuple(pygame.Color(color))
+
+
+class FontManager(AsyncLoader):  # pylint: disable=R0902
+    """Manages loaded fonts, and renders text with them.
+
+    Each font file is read into memory once. Fonts are added under a name at
+    one size, and `get` creates other sizes on demand from the same bytes
+    rather than reading the file again. The least recently used of those
+    extra sizes are evicted.
+
+    Rendered strings are kept in a least recently used cache, so text which
+    rarely changes is rasterized once. Text which changes often is better
+    drawn through a `GlyphAtlas` from `get_glyph_atlas`.
+
+    When a size is evicted, its glyph atlases are dropped and `on_evict` is
+    called with the font, so caches elsewhere can let go of it too.
+    """
 
     fonts: Dict[str, pygame.font.Font]
+    font_keys: Dict[str, FontKey]
+    font_files: Dict[str, bytes]
+    sized_fonts: "OrderedDict[FontKey, pygame.font.Font]"
+    font_cache_size: int
+    text_cache: "OrderedDict[TextKey, pygame.Surface]"
+    text_cache_size: int
+    glyph_atlases: Dict[StyleKey, GlyphAtlas]
+    on_evict: Callable[[pygame.font.Font], None] | None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        tracer: TraceRecorder | None = None,
+        font_cache_size: int = DEFAULT_FONT_CACHE_SIZE,
+        text_cache_size: int = DEFAULT_TEXT_CACHE_SIZE,
+    ) -> None:
+        super().__init__(executor, tracer)
         if not pygame.font.get_init():
             pygame.font.init()
 
         self.fonts = {}
+        self.font_keys = {}
+        self.font_files = {}
+        self.sized_fonts = OrderedDict()
+        self.font_cache_size = font_cache_size
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+        self.glyph_atlases = {}
+        self.on_evict = None
 
-    def add(self, path: str, name: str = "default", size: int = 12) -> None:
+    def add(
+        self, path: str, name: str = "default", size: int = DEFAULT_FONT_SIZE
+    ) -> None:
         """Add a font to the manager.
 
         Args:
@@ -40,17 +135,204 @@ class FontManager:
             name (str, optional): String name ID of the font. Defaults to "default".
             size (int, optional): Size for the font. Defaults to 12.
         """
-        self.fonts[name] = pygame.font.Font(path, size)
+        self._add_font(path, name, size, self._load_font(path, size))
+
+    def add_async(
+        self, path: str, name: str = "default", size: int = DEFAULT_FONT_SIZE
+    ) -> Future:
+        """Add a font to the manager, reading and parsing it on the worker
+        thread pool. The font is added by `process_loaded` once it's done.
+
+        Args:
+            path (str): Path to the font file (.ttf, .otf)
+            name (str, optional): String name ID of the font. Defaults to "default".
+            size (int, optional): Size for the font. Defaults to 12.
+
+        Returns:
+            Future: Handle on the background load.
+        """
+
+        def finish(loaded: Tuple[bytes, pygame.font.Font]) -> None:
+            self._add_font(path, name, size, loaded)
+
+        return self._load_async(lambda: self._load_font(path, size), finish)
+
+    def _add_font(
+        self,
+        path: str,
+        name: str,
+        size: int,
+        loaded: Tuple[bytes, pygame.font.Font],
+    ) -> None:
+        """Store a loaded font. Used internally.
+
+        Args:
+            path (str): Path to the font file.
+            name (str): String name ID of the font.
+            size (int): Size of the font.
+            loaded (Tuple[bytes, pygame.font.Font]): Contents of the file, and
+            the font.
+        """
+        self.font_files[path], self.fonts[name] = loaded
+        self.font_keys[name] = (path, size)
+
+    def _load_font(self, path: str, size: int) -> Tuple[bytes, pygame.font.Font]:
+        """Load a font, reading its file unless it was already read. Used
+        internally, safe to call from worker threads.
+
+        Args:
+            path (str): Path to the font file (.ttf, .otf)
+            size (int): Size for the font.
+
+        Returns:
+            Tuple[bytes, pygame.font.Font]: Contents of the file, and the
+            loaded font.
+        """
+        data = self.font_files.get(path)
+        if data is None:
+            with self._trace(f"read_font {path}"):
+                with open(path, "rb") as file:
+                    data = file.read()
+        with self._trace(f"load_font {path} {size}"):
+            return data, self._create_font(data, size)
+
+    @staticmethod
+    def _create_font(data: bytes, size: int) -> pygame.font.Font:
+        """Parse a font from the contents of its file. Used internally.
+
+        Args:
+            data (bytes): Contents of the font file.
+            size (int): Size for the font.
+
+        Returns:
+            pygame.font.Font: The font.
+        """
+        # every font reads through its own file object, which shares `data`
+        # rather than copying it
+        return pygame.font.Font(io.BytesIO(data), size)
 
-    def get(self, name: str = "default") -> pygame.font.Font:
+    def get(self, name: str = "default", size: int | None = None) -> pygame.font.Font:
         """Get a loaded font.
 
         Args:
             name (str, optional): String name ID of the font. Defaults to "default".
+            size (int | None, optional): Size of the font. Defaults to None, the
+            size it was added with. Other sizes are created from the font's
+            file on first use.
 
         Returns:
             pygame.font.Font | None: The requested font. If not font is loaded, None is returned.
         """
         if name not in self.fonts:
             return None
-        return self.fonts[name]
+
+        path, added_size = self.font_keys[name]
+        if size is None or size == added_size:
+            return self.fonts[name]
+
+        key = (path, size)
+        font = self.sized_fonts.get(key)
+        if font is not None:
+            self.sized_fonts.move_to_end(key)
+            return font
+
+        with self._trace(f"load_font {path} {size}"):
+            font = self.sized_fonts[key] = self._create_font(
+                self.font_files[path], size
+            )
+        if len(self.sized_fonts) > self.font_cache_size:
+            self._evict_font(*self.sized_fonts.popitem(last=False))
+        return font
+
+    def _evict_font(self, key: FontKey, font: pygame.font.Font) -> None:
+        """Let go of an evicted font size. Used internally.
+
+        Args:
+            key (FontKey): Path and size of the font.
+            font (pygame.font.Font): The font.
+        """
+        for style_key in [
+            style_key for style_key in self.glyph_atlases if style_key[0] == key
+        ]:
+            del self.glyph_atlases[style_key]
+        if self.on_evict is not None:
+            self.on_evict(font)
+
+    def _get_style_key(self, style: TextStyle) -> StyleKey | None:
+        """Get a hashable key for a style. Used internally.
+
+        Args:
+            style (TextStyle): The style.
+
+        Returns:
+            StyleKey | None: The key, None if its font isn't loaded.
+        """
+        font_key = self.font_keys.get(style.name)
+        if font_key is None:
+            return None
+        if style.size is not None:
+            font_key = (font_key[0], style.size)
+        return (
+            font_key,
+            get_color_key(style.color),
+            style.antialias,
+            get_color_key(style.background),
+        )
+
+    def render(self, text: str, style: TextStyle) -> pygame.Surface | None:
+        """Render text, reusing the surface if the same text was rendered
+        recently. The surface is shared, so it must not be drawn onto.
+
+        Args:
+            text (str): Text to render.
+            style (TextStyle): How to draw the text.
+
+        Returns:
+            pygame.Surface | None: The rendered text. None if the font isn't
+            loaded.
+        """
+        style_key = self._get_style_key(style)
+        if style_key is None:
+            return None
+
+        key = (style_key, text)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            return surface
+
+        font = self.get(style.name, style.size)
+        surface = font.render(text, style.antialias, style.color, style.background)
+        if pygame.display.get_surface() is not None:
+            if style.background is None:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.text_cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+
+    def get_glyph_atlas(self, style: TextStyle) -> GlyphAtlas | None:
+        """Get the glyph atlas drawing text in a style, creating it on first
+        use.
+
+        Args:
+            style (TextStyle): How to draw the text.
+
+        Returns:
+            GlyphAtlas | None: The glyph atlas. None if the font isn't loaded.
+        """
+        key = self._get_style_key(style)
+        if key is None:
+            return None
+
+        atlas = self.glyph_atlases.get(key)
+        if atlas is None:
+            atlas = self.glyph_atlases[key] = GlyphAtlas(
+                self.get(style.name, style.size),
+                style.color,
+                style.antialias,
+                style.background,
+            )
+        return atlas
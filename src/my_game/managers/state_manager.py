@@ -16,52 +16,200 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Set
 
 import pygame
 
 from ..game_states import GameStates
+from ..profiling import TraceRecorder, trace_scope
 
 
-class StateManager:
+StateFactoryFn = Callable[[], pygame.sprite.Group]
+
+
+class StateManager:  # pylint: disable=R0902
     """Manages states and transitioning between them. Provides an interface to
     receive the current and previous states.
+
+    States form a stack: `push` suspends the current state to show another on
+    top of it, and `pop` returns to it. States registered through `register`
+    are only constructed when first entered, or ahead of time by `preload`.
+
+    States may define `on_suspend` and `on_resume` methods, called when they
+    stop and start being the current state, e.g. to release heavy resources
+    while suspended.
+
+    Overlay states are drawn over the state below them on the stack. That state
+    is drawn once into a snapshot, which is shown under the overlay, and isn't
+    updated until the overlay is popped.
+
+    Transitions and state construction are recorded to `tracer`, if given.
     """
 
+    TRACE_CATEGORY: str = "state"
+
     current_state: GameStates | None
     previous_state: GameStates | None
+    drawn_state: GameStates | None
+    stack: List[GameStates]
     states: Dict[GameStates, pygame.sprite.Group]
+    factories: Dict[GameStates, StateFactoryFn]
+    preloading: Dict[GameStates, Future]
+    overlays: Set[GameStates]
+    snapshot: pygame.Surface | None
+    tracer: TraceRecorder | None
 
-    def __init__(self) -> None:
+    def __init__(self, tracer: TraceRecorder | None = None) -> None:
+        self.tracer = tracer
         self.current_state = None
         self.previous_state = None
+        self.drawn_state = None
+        self.stack = []
         self.states = {}
+        self.factories = {}
+        self.preloading = {}
+        self.overlays = set()
+        self.snapshot = None
 
-    def add(self, key: GameStates, state: pygame.sprite.Group) -> None:
-        """Add a state to the state machine.
+    def add(
+        self, key: GameStates, state: pygame.sprite.Group, is_overlay: bool = False
+    ) -> None:
+        """Add a state to the state machine. The first state added becomes the
+        current state.
 
         Args:
             key (GameStates): GameState ID for the state.
             state (pygame.sprite.Group): The actual state object. Drawn when
             it's the current state.
+            is_overlay (bool, optional): Whether the state is drawn over the
+            state below it. Defaults to False.
         """
-        self.previous_state = self.current_state
+        self.states[key] = state
+        if is_overlay:
+            self.overlays.add(key)
+        if not self.stack:
+            self._set_stack([key])
 
-        if not self.current_state:
-            self.current_state = key
+    def register(
+        self, key: GameStates, factory: StateFactoryFn, is_overlay: bool = False
+    ) -> None:
+        """Add a state constructed when first needed.
 
-        self.states[key] = state
+        Args:
+            key (GameStates): GameState ID for the state.
+            factory (StateFactoryFn): Constructs the state.
+            is_overlay (bool, optional): Whether the state is drawn over the
+            state below it. Defaults to False.
+        """
+        self.factories[key] = factory
+        if is_overlay:
+            self.overlays.add(key)
+
+    def preload(self, key: GameStates, executor: Executor) -> None:
+        """Construct a registered state in the background, so entering it
+        doesn't stall. Its factory must be safe to call off the main thread.
+
+        Args:
+            key (GameStates): GameState ID for the state.
+            executor (Executor): Executor to construct the state on.
+        """
+        if key not in self.states and key not in self.preloading:
+            self.preloading[key] = executor.submit(self._construct, key)
+
+    def get(self, key: GameStates) -> pygame.sprite.Group:
+        """Get a state, constructing it if it wasn't yet.
+
+        Args:
+            key (GameStates): GameState ID for the state.
+
+        Returns:
+            pygame.sprite.Group: The state object.
+        """
+        state = self.states.get(key)
+        if state is None:
+            future = self.preloading.pop(key, None)
+            if future is not None:
+                state = future.result()
+            else:
+                state = self._construct(key)
+            self.states[key] = state
+        return state
+
+    def _construct(self, key: GameStates) -> pygame.sprite.Group:
+        """Construct a registered state. Used internally.
+
+        Args:
+            key (GameStates): GameState ID for the state.
+
+        Returns:
+            pygame.sprite.Group: The state object.
+        """
+        with trace_scope(self.tracer, f"construct {key}", StateManager.TRACE_CATEGORY):
+            return self.factories[key]()
+
+    def unload(self, key: GameStates) -> None:
+        """Drop a state which isn't on the stack, freeing it. Registered states
+        are constructed again the next time they're entered.
+
+        Args:
+            key (GameStates): GameState ID for the state.
+        """
+        if key not in self.stack:
+            self.states.pop(key, None)
 
     def change_state(self, next_state_key: GameStates) -> None:
         """Change the state to the given state with matching `next_state_key`.
+        Every state on the stack is left.
 
         Args:
             next_state_key (GameStates): GameState ID for the state.
         """
-        if not self.current_state:
+        if not self.stack:
             return
-        self.previous_state = self.current_state
-        self.current_state = next_state_key
+        self._set_stack([next_state_key])
+
+    def push(self, key: GameStates) -> None:
+        """Suspend the current state and enter another on top of it.
+
+        Args:
+            key (GameStates): GameState ID for the state.
+        """
+        self._set_stack(self.stack + [key])
+
+    def pop(self) -> None:
+        """Leave the current state and resume the one below it."""
+        if len(self.stack) > 1:
+            self._set_stack(self.stack[:-1])
+
+    def _set_stack(self, stack: List[GameStates]) -> None:
+        """Replace the state stack, suspending and resuming the current state.
+        Used internally.
+
+        Args:
+            stack (List[GameStates]): New stack, current state last.
+        """
+        current_state = self.current_state
+        next_state = stack[-1]
+        if next_state != current_state:
+            if self.tracer is not None:
+                self.tracer.instant(
+                    f"{current_state} -> {next_state}", StateManager.TRACE_CATEGORY
+                )
+
+            if current_state is not None:
+                on_suspend = getattr(self.states[current_state], "on_suspend", None)
+                if on_suspend is not None:
+                    on_suspend()
+
+            on_resume = getattr(self.get(next_state), "on_resume", None)
+            if on_resume is not None:
+                on_resume()
+
+            self.previous_state = current_state
+            self.current_state = next_state
+            self.snapshot = None
+        self.stack = stack
 
     def get_state(self) -> GameStates:
         """Get the current state.
@@ -72,15 +220,102 @@ class StateManager:
         return self.current_state
 
     def go_back(self) -> None:
-        """Transition to the previous state."""
-        if self.previous_state:
+        """Transition to the previous state. Pops the current state when
+        another is below it on the stack.
+        """
+        if len(self.stack) > 1:
+            self.pop()
+        elif self.previous_state:
             self.change_state(self.previous_state)
 
     def update(self, *args, **kwargs) -> None:
         """Update the current state."""
-        if self.states:
+        if self.stack:
             self.states[self.current_state].update(*args, **kwargs)
 
-    def draw(self, *args, **kwargs) -> None:
-        """Draw the current state."""
-        self.states[self.current_state].draw(*args, **kwargs)
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Pass an input event to the current state, if it handles events.
+
+        Args:
+            event (pygame.event.Event): The event.
+        """
+        handle_event = getattr(
+            self.states.get(self.current_state), "handle_event", None
+        )
+        if handle_event is not None:
+            handle_event(event)
+
+    def get_underlay(self) -> GameStates | None:
+        """Get the state shown under the current state.
+
+        Returns:
+            GameStates | None: The state below the current state on the stack
+            when the current state is an overlay, otherwise None.
+        """
+        if self.current_state in self.overlays and len(self.stack) > 1:
+            return self.stack[-2]
+        return None
+
+    def _draw_underlay(self, surface: pygame.Surface, alpha: float) -> None:
+        """Draw the snapshot of the state under the current overlay, taking it
+        first if needed. Used internally.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto. Must already be
+            cleared.
+            alpha (float): Interpolation factor between the previous and current
+            simulation step.
+        """
+        if self.snapshot is None:
+            self.states[self.get_underlay()].draw(surface, alpha)
+            self.snapshot = surface.copy()
+        else:
+            surface.blit(self.snapshot, (0, 0))
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw the current state, over the snapshot of the state below it if
+        it's an overlay.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto. Must already be
+            cleared.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+        """
+        if self.get_underlay() is not None:
+            self._draw_underlay(surface, alpha)
+        self.states[self.current_state].draw(surface, alpha)
+
+    def invalidate(self) -> None:
+        """Force the next `draw_dirty` to redraw the whole current state."""
+        self.drawn_state = None
+        self.snapshot = None
+
+    def draw_dirty(
+        self, surface: pygame.Surface, background: pygame.Color, alpha: float = 1.0
+    ) -> List[pygame.Rect]:
+        """Redraw only what changed in the current state since the last call.
+        The whole state is redrawn when it was just entered. Overlays restore
+        changed regions from the snapshot of the state below them.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto. Must still contain
+            the previous frame.
+            background (pygame.Color): Color to clear regions with.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+
+        Returns:
+            List[pygame.Rect]: Regions of the surface that were redrawn.
+        """
+        state = self.states[self.current_state]
+        if self.drawn_state != self.current_state:
+            self.drawn_state = self.current_state
+            state.invalidate()
+
+        if self.get_underlay() is not None:
+            if self.snapshot is None:
+                surface.fill(background)
+                self._draw_underlay(surface, alpha)
+            background = self.snapshot
+        return state.draw_dirty(surface, background, alpha)
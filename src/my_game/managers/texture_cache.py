@@ -0,0 +1,197 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import pygame
+
+
+DEFAULT_TEXTURE_BUDGET: int = 64 * 1024 * 1024
+
+# texture name, scale, rotation, flip x, flip y
+TransformKey = Tuple[str, float, float, bool, bool]
+
+
+def get_surface_size(surface: pygame.Surface) -> int:
+    """Get how much memory the pixels of a surface use.
+
+    Args:
+        surface (pygame.Surface): The surface.
+
+    Returns:
+        int: Size of the pixels, in bytes.
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+@dataclass
+class CachedAtlas:
+    """Data structure for holding a resident atlas, its textures and their
+    transformed copies.
+    """
+
+    surface: pygame.Surface
+    textures: Dict[str, pygame.Surface]
+    size: int
+    ref_count: int = 0
+    transforms: Dict[TransformKey, pygame.Surface] = field(default_factory=dict)
+
+
+class TextureHandle:
+    """Reference to a texture. Keeps its atlas resident until released."""
+
+    cache: "TextureCache"
+    key: str
+    surface: pygame.Surface
+    is_released: bool
+
+    def __init__(self, cache: "TextureCache", key: str, surface: pygame.Surface):
+        self.cache = cache
+        self.key = key
+        self.surface = surface
+        self.is_released = False
+
+    def release(self) -> None:
+        """Release the reference. Safe to call more than once."""
+        if not self.is_released:
+            self.is_released = True
+            self.cache.release(self.key)
+
+    def __enter__(self) -> "TextureHandle":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+class TextureCache:
+    """Keeps loaded atlases within a memory budget. When over budget, the least
+    recently used atlases nobody holds a handle on are evicted.
+    """
+
+    budget: int
+    atlases: "OrderedDict[str, CachedAtlas]"
+    resident_bytes: int
+
+    def __init__(self, budget: int = DEFAULT_TEXTURE_BUDGET) -> None:
+        self.budget = budget
+        self.atlases = OrderedDict()
+        self.resident_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.atlases
+
+    def add(
+        self, key: str, surface: pygame.Surface, textures: Dict[str, pygame.Surface]
+    ) -> None:
+        """Add an atlas, replacing any atlas with the same key.
+
+        Args:
+            key (str): Key of the atlas, e.g. its spritesheet path.
+            surface (pygame.Surface): The whole atlas.
+            textures (Dict[str, pygame.Surface]): Textures within the atlas.
+        """
+        ref_count = 0
+        if key in self.atlases:
+            previous = self.atlases.pop(key)
+            self.resident_bytes -= previous.size
+            ref_count = previous.ref_count
+
+        size = get_surface_size(surface)
+        self.atlases[key] = CachedAtlas(surface, textures, size, ref_count)
+        self.resident_bytes += size
+        self.evict(keep=key)
+
+    def get(self, key: str) -> CachedAtlas | None:
+        """Get a resident atlas, marking it as recently used.
+
+        Args:
+            key (str): Key of the atlas.
+
+        Returns:
+            CachedAtlas | None: The atlas, or None if it isn't resident.
+        """
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.atlases.move_to_end(key)
+        return atlas
+
+    def add_transform(
+        self, key: str, transform: TransformKey, surface: pygame.Surface
+    ) -> None:
+        """Add a transformed copy of a texture. It counts toward the budget and
+        is evicted along with its atlas.
+
+        Args:
+            key (str): Key of the resident atlas holding the texture.
+            transform (TransformKey): Texture name and transform applied.
+            surface (pygame.Surface): The transformed texture.
+        """
+        atlas = self.atlases[key]
+        atlas.transforms[transform] = surface
+        size = get_surface_size(surface)
+        atlas.size += size
+        self.resident_bytes += size
+        self.evict(keep=key)
+
+    def acquire(self, key: str, name: str) -> TextureHandle:
+        """Get a handle on a texture of a resident atlas. The atlas won't be
+        evicted until every handle on it is released.
+
+        Args:
+            key (str): Key of the atlas.
+            name (str): Name of the texture.
+
+        Returns:
+            TextureHandle: Handle on the texture.
+        """
+        atlas = self.atlases[key]
+        atlas.ref_count += 1
+        self.atlases.move_to_end(key)
+        return TextureHandle(self, key, atlas.textures[name])
+
+    def release(self, key: str) -> None:
+        """Release a reference on an atlas taken by `acquire`.
+
+        Args:
+            key (str): Key of the atlas.
+        """
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            atlas.ref_count -= 1
+        self.evict()
+
+    def evict(self, keep: str | None = None) -> None:
+        """Evict least recently used, unreferenced atlases until within budget.
+
+        Args:
+            keep (str | None, optional): Key of an atlas to never evict, e.g.
+            one about to be used. Defaults to None.
+        """
+        if self.resident_bytes <= self.budget:
+            return
+
+        for key, atlas in list(self.atlases.items()):
+            if atlas.ref_count > 0 or key == keep:
+                continue
+            del self.atlases[key]
+            self.resident_bytes -= atlas.size
+            if self.resident_bytes <= self.budget:
+                return
@@ -0,0 +1,208 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+from collections import deque
+from typing import Deque, Dict, List
+
+from .trace_recorder import TraceRecorder
+
+
+class RollingHistogram:
+    """Histogram of the most recent samples. Buckets are updated as samples
+    enter and leave the window, so reading it never rescans the samples.
+    """
+
+    samples: Deque[float]
+    buckets: List[int]
+    bucket_size: float
+    total: float
+
+    def __init__(self, sample_count: int, bucket_count: int, bucket_size: float):
+        self.samples = deque(maxlen=sample_count)
+        self.buckets = [0] * bucket_count
+        self.bucket_size = bucket_size
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def _bucket(self, sample: float) -> int:
+        """Get the bucket of a sample. Used internally.
+
+        Args:
+            sample (float): The sample.
+
+        Returns:
+            int: Index of its bucket. The last bucket holds every larger sample.
+        """
+        return min(int(sample / self.bucket_size), len(self.buckets) - 1)
+
+    def add(self, sample: float) -> None:
+        """Add a sample, dropping the oldest once the window is full.
+
+        Args:
+            sample (float): The sample.
+        """
+        if len(self.samples) == self.samples.maxlen:
+            oldest = self.samples[0]
+            self.buckets[self._bucket(oldest)] -= 1
+            self.total -= oldest
+        self.samples.append(sample)
+        self.buckets[self._bucket(sample)] += 1
+        self.total += sample
+
+    def get_mean(self) -> float:
+        """Get the mean of the samples.
+
+        Returns:
+            float: The mean, 0 without samples.
+        """
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    def get_max(self) -> float:
+        """Get the largest sample.
+
+        Returns:
+            float: The largest sample, 0 without samples.
+        """
+        return max(self.samples, default=0.0)
+
+    def get_percentile(self, percentile: float) -> float:
+        """Estimate a percentile from the buckets.
+
+        Args:
+            percentile (float): Percentile, from 0 to 100.
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile.
+        """
+        target = len(self.samples) * percentile / 100.0
+        count = 0
+        for i, bucket in enumerate(self.buckets):
+            count += bucket
+            if count >= target:
+                return (i + 1) * self.bucket_size
+        return len(self.buckets) * self.bucket_size
+
+
+class ProfileScope:
+    """Times a block of code, adding the elapsed time to its `Profiler` scope
+    for the current frame. Use as a context manager.
+    """
+
+    profiler: "Profiler"
+    name: str
+    start: float
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "ProfileScope":
+        tracer = self.profiler.tracer
+        if tracer is not None:
+            tracer.record("B", self.name, Profiler.CATEGORY)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        elapsed = (time.perf_counter() - self.start) * 1000.0
+        frame_times = self.profiler.frame_times
+        frame_times[self.name] = frame_times.get(self.name, 0.0) + elapsed
+
+        tracer = self.profiler.tracer
+        if tracer is not None:
+            tracer.record("E", self.name, Profiler.CATEGORY)
+
+
+class Profiler:
+    """Collects how long parts of each frame take, in milliseconds.
+
+    Code is timed with `scope`. Time spent in a scope is summed over the frame,
+    and `end_frame` adds the sums to a rolling histogram per scope, along with
+    the whole frame's time under `FRAME`. Scopes are also recorded to
+    `tracer`, if given.
+    """
+
+    FRAME: str = "frame"
+    CATEGORY: str = "loop"
+    SAMPLE_COUNT: int = 240
+    BUCKET_COUNT: int = 34
+    BUCKET_SIZE: float = 1.0
+
+    scopes: Dict[str, ProfileScope]
+    histograms: Dict[str, RollingHistogram]
+    frame_times: Dict[str, float]
+    last_frame_scopes: List[str]
+    frame_start: float
+    tracer: TraceRecorder | None
+
+    def __init__(self, tracer: TraceRecorder | None = None) -> None:
+        self.tracer = tracer
+        self.scopes = {}
+        self.histograms = {}
+        self.frame_times = {}
+        self.last_frame_scopes = []
+        self.frame_start = time.perf_counter()
+
+    def scope(self, name: str) -> ProfileScope:
+        """Get the timer of a scope.
+
+        Args:
+            name (str): Name of the scope, e.g. "update/gameplay".
+
+        Returns:
+            ProfileScope: Context manager timing the code it wraps.
+        """
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = ProfileScope(self, name)
+        return scope
+
+    def end_frame(self) -> None:
+        """Record the times of the frame which just ended."""
+        if self.tracer is not None:
+            self.tracer.instant(Profiler.FRAME, Profiler.CATEGORY)
+
+        now = time.perf_counter()
+        self.frame_times[Profiler.FRAME] = (now - self.frame_start) * 1000.0
+        self.frame_start = now
+
+        for name, elapsed in self.frame_times.items():
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = RollingHistogram(
+                    Profiler.SAMPLE_COUNT, Profiler.BUCKET_COUNT, Profiler.BUCKET_SIZE
+                )
+            histogram.add(elapsed)
+        self.last_frame_scopes = list(self.frame_times)
+        self.frame_times.clear()
+
+    def get_histogram(self, name: str) -> RollingHistogram | None:
+        """Get the recent times of a scope.
+
+        Args:
+            name (str): Name of the scope.
+
+        Returns:
+            RollingHistogram | None: Its histogram, None if it never ran.
+        """
+        return self.histograms.get(name)
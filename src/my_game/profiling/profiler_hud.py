@@ -0,0 +1,139 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Tuple
+
+import pygame
+
+from .profiler import Profiler
+from ..rendering import GlyphAtlas
+
+
+class ProfilerHUD:
+    """On-screen panel showing the frame time histogram and the mean time of
+    each profiled scope. The text is only composed by `refresh`, from the
+    glyphs of a `GlyphAtlas`, onto a layer which every frame's `draw` copies
+    with one blit. Until `glyph_atlas` is set, e.g. while fonts are loading,
+    only the histogram is drawn.
+    """
+
+    SIZE: Tuple[int, int] = (240, 160)
+    PADDING: int = 6
+    GRAPH_HEIGHT: int = 48
+    BACKGROUND: str = "#202020"
+    # frame time budgets drawn as lines over the histogram, in milliseconds
+    BUDGETS: Tuple[float, ...] = (1000.0 / 60.0, 1000.0 / 30.0)
+
+    profiler: Profiler
+    is_visible: bool
+    rect: pygame.Rect
+    image: pygame.Surface
+    text_image: pygame.Surface
+    glyph_atlas: GlyphAtlas | None
+
+    def __init__(self, profiler: Profiler, glyph_atlas: GlyphAtlas | None = None):
+        self.profiler = profiler
+        self.is_visible = False
+        self.rect = pygame.Rect((8, 8), ProfilerHUD.SIZE)
+        self.image = pygame.Surface(ProfilerHUD.SIZE)
+        self.text_image = pygame.Surface(ProfilerHUD.SIZE)
+        self.text_image.fill(ProfilerHUD.BACKGROUND)
+        self.glyph_atlas = glyph_atlas
+
+    def toggle(self) -> None:
+        """Show or hide the panel."""
+        self.is_visible = not self.is_visible
+        if self.is_visible:
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Compose the statistics text from the profiler."""
+        if self.glyph_atlas is None:
+            return
+
+        lines = []
+        frame = self.profiler.get_histogram(Profiler.FRAME)
+        if frame is not None:
+            lines.append(
+                f"frame {frame.get_mean():.2f}ms"
+                f"  p99 {frame.get_percentile(99):.0f}ms"
+                f"  max {frame.get_max():.1f}ms"
+            )
+        for name in self.profiler.last_frame_scopes:
+            histogram = self.profiler.get_histogram(name)
+            if name != Profiler.FRAME and histogram is not None:
+                lines.append(f"{name} {histogram.get_mean():.2f}ms")
+
+        self.text_image.fill(ProfilerHUD.BACKGROUND)
+        y = ProfilerHUD.PADDING
+        for line in lines:
+            rect = self.glyph_atlas.draw(
+                self.text_image, line, (ProfilerHUD.PADDING, y)
+            )
+            y += rect.height
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the panel.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+
+        Returns:
+            pygame.Rect: Area drawn to.
+        """
+        image = self.image
+        image.blit(self.text_image, (0, 0))
+
+        frame = self.profiler.get_histogram(Profiler.FRAME)
+        if frame is not None and len(frame):
+            self._draw_histogram(frame.buckets, frame.bucket_size, len(frame))
+
+        return surface.blit(image, self.rect)
+
+    def _draw_histogram(
+        self, buckets: List[int], bucket_size: float, sample_count: int
+    ) -> None:
+        """Draw the frame time histogram at the bottom of the panel. Used
+        internally.
+
+        Args:
+            buckets (List[int]): Sample count of each bucket.
+            bucket_size (float): Width of a bucket, in milliseconds.
+            sample_count (int): Total number of samples.
+        """
+        padding = ProfilerHUD.PADDING
+        width = self.rect.width - 2 * padding
+        bottom = self.rect.height - padding
+        bar_width = max(1, width // len(buckets))
+        for i, count in enumerate(buckets):
+            if count:
+                height = max(1, ProfilerHUD.GRAPH_HEIGHT * count // sample_count)
+                pygame.draw.rect(
+                    self.image,
+                    "#66B083",
+                    (padding + i * bar_width, bottom - height, bar_width - 1, height),
+                )
+
+        for budget in ProfilerHUD.BUDGETS:
+            x = padding + int(budget / bucket_size * bar_width)
+            pygame.draw.line(
+                self.image,
+                "#b06666",
+                (x, bottom - ProfilerHUD.GRAPH_HEIGHT),
+                (x, bottom),
+            )
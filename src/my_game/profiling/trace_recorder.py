@@ -0,0 +1,210 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+
+from typing import Any, ContextManager, Dict, Iterator, List, Tuple
+
+
+DEFAULT_TRACE_PATH: str = "trace.json"
+
+
+class TraceScope:
+    """Records a begin event on enter and an end event on exit. Use as a
+    context manager.
+    """
+
+    recorder: "TraceRecorder"
+    name: str
+    category: str
+
+    def __init__(self, recorder: "TraceRecorder", name: str, category: str):
+        self.recorder = recorder
+        self.name = name
+        self.category = category
+
+    def __enter__(self) -> "TraceScope":
+        self.recorder.record("B", self.name, self.category)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.recorder.record("E", self.name, self.category)
+
+
+class TraceRecorder:  # pylint: disable=R0902
+    """Records timestamped events into a preallocated ring buffer, and writes
+    them in the Chrome Trace Event format, which trace viewers such as
+    Perfetto or chrome://tracing open.
+
+    Recording only stores into the buffer, so it's cheap enough to leave on.
+    Once the buffer is full the oldest events are overwritten. Safe to record
+    from worker threads.
+    """
+
+    CAPACITY: int = 1 << 16
+
+    capacity: int
+    is_enabled: bool
+    sequences: List[int | None]
+    phases: List[str | None]
+    names: List[str | None]
+    categories: List[str | None]
+    timestamps: List[float]
+    thread_ids: List[int]
+    thread_names: Dict[int, str]
+    counter: Iterator[int]
+    scopes: Dict[Tuple[str, str], TraceScope]
+
+    def __init__(self, capacity: int = CAPACITY, is_enabled: bool = True) -> None:
+        self.capacity = capacity
+        self.is_enabled = is_enabled
+        self.sequences = [None] * capacity
+        self.phases = [None] * capacity
+        self.names = [None] * capacity
+        self.categories = [None] * capacity
+        self.timestamps = [0.0] * capacity
+        self.thread_ids = [0] * capacity
+        self.thread_names = {}
+        # next() on a count is atomic, so threads never share a slot
+        self.counter = itertools.count()
+        self.scopes = {}
+
+    def record(self, phase: str, name: str, category: str) -> None:
+        """Record an event.
+
+        Args:
+            phase (str): Trace Event phase, e.g. "B" for begin, "E" for end or
+            "i" for instant.
+            name (str): Name of the event.
+            category (str): Category of the event, e.g. "loop".
+        """
+        if not self.is_enabled:
+            return
+
+        timestamp = time.perf_counter()
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+
+        sequence = next(self.counter)
+        i = sequence % self.capacity
+        self.phases[i] = phase
+        self.names[i] = name
+        self.categories[i] = category
+        self.timestamps[i] = timestamp
+        self.thread_ids[i] = thread_id
+        self.sequences[i] = sequence
+
+    def scope(self, name: str, category: str) -> TraceScope:
+        """Get a context manager recording the begin and end of a block.
+
+        Args:
+            name (str): Name of the event.
+            category (str): Category of the event.
+
+        Returns:
+            TraceScope: The context manager.
+        """
+        key = (name, category)
+        scope = self.scopes.get(key)
+        if scope is None:
+            scope = self.scopes[key] = TraceScope(self, name, category)
+        return scope
+
+    def instant(self, name: str, category: str) -> None:
+        """Record an event without duration, e.g. a state transition.
+
+        Args:
+            name (str): Name of the event.
+            category (str): Category of the event.
+        """
+        self.record("i", name, category)
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        """Get the recorded events, oldest first, as Trace Events.
+
+        Returns:
+            List[Dict[str, Any]]: The events.
+        """
+        pid = os.getpid()
+        slots = sorted(
+            (i for i, sequence in enumerate(self.sequences) if sequence is not None),
+            key=self.sequences.__getitem__,
+        )
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in self.thread_names.items()
+        ]
+
+        for i in slots:
+            event = {
+                "name": self.names[i],
+                "cat": self.categories[i],
+                "ph": self.phases[i],
+                "ts": self.timestamps[i] * 1_000_000.0,
+                "pid": pid,
+                "tid": self.thread_ids[i],
+            }
+            if self.phases[i] == "i":
+                event["s"] = "t"
+            events.append(event)
+        return events
+
+    def write(self, path: str = DEFAULT_TRACE_PATH) -> None:
+        """Write the recorded events to a Chrome Trace Event JSON file.
+
+        Args:
+            path (str, optional): Path to the file. Defaults to
+            `DEFAULT_TRACE_PATH`.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.get_events(), "displayTimeUnit": "ms"}, file)
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self.sequences = [None] * self.capacity
+
+
+def trace_scope(
+    recorder: TraceRecorder | None, name: str, category: str
+) -> ContextManager:
+    """Get a context manager recording the begin and end of a block, or one
+    doing nothing without a recorder.
+
+    Args:
+        recorder (TraceRecorder | None): Recorder to record to, if any.
+        name (str): Name of the event.
+        category (str): Category of the event.
+
+    Returns:
+        ContextManager: The context manager.
+    """
+    if recorder is None:
+        return contextlib.nullcontext()
+    return recorder.scope(name, category)
@@ -0,0 +1,135 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+import pygame
+
+
+BlitPair = Tuple[pygame.Surface, Tuple]
+
+
+def get_texture_key(pair: BlitPair) -> int:
+    """Get a key grouping blits by the texture they're cut from. Subsurfaces of
+    one atlas share the key of the atlas.
+
+    Args:
+        pair (BlitPair): Surface and position of a blit.
+
+    Returns:
+        int: The key.
+    """
+    return id(pair[0].get_abs_parent())
+
+
+class BatchRenderer:
+    """Collects blits over a frame and submits them together, one `blits` call
+    per layer.
+
+    Layers are drawn from lowest to highest, and blits within a layer in the
+    order they were queued, so overlapping sprites keep their order. Layers in
+    `sorted_layers`, whose blits are known not to overlap, are instead grouped
+    by texture, so blits from the same atlas run back to back. They aren't
+    sorted when every blit shares one texture.
+    """
+
+    sorted_layers: Set[int]
+    layers: Dict[int, List[BlitPair]]
+    layer_order: List[int]
+    # texture key shared by every blit queued on a layer, None once they mix
+    layer_textures: Dict[int, int | None]
+
+    def __init__(self, sorted_layers: Iterable[int] = ()) -> None:
+        self.sorted_layers = set(sorted_layers)
+        self.layers = {}
+        self.layer_order = []
+        self.layer_textures = {}
+
+    def _get_buffer(self, layer: int) -> List[BlitPair]:
+        """Get the buffer of a layer. Buffers are kept between frames so they
+        don't need to be reallocated. Used internally.
+
+        Args:
+            layer (int): The layer.
+
+        Returns:
+            List[BlitPair]: Blits queued on the layer.
+        """
+        buffer = self.layers.get(layer)
+        if buffer is None:
+            buffer = self.layers[layer] = []
+            self.layer_order = sorted(self.layers)
+        return buffer
+
+    def _add_texture(self, layer: int, texture: int | None) -> None:
+        """Note the texture of blits queued on a layer. Used internally.
+
+        Args:
+            layer (int): The layer.
+            texture (int | None): Key of the texture, None if unknown or mixed.
+        """
+        if self.layer_textures.get(layer, texture) != texture:
+            texture = None
+        self.layer_textures[layer] = texture
+
+    def add(self, image: pygame.Surface, position: Tuple, layer: int = 0) -> None:
+        """Queue a blit.
+
+        Args:
+            image (pygame.Surface): Surface to draw.
+            position (Tuple): Top left position, or a rect, to draw at.
+            layer (int, optional): Layer to draw on. Defaults to 0.
+        """
+        pair = (image, position)
+        self._get_buffer(layer).append(pair)
+        self._add_texture(layer, get_texture_key(pair))
+
+    def add_many(
+        self,
+        blits: Iterable[BlitPair],
+        layer: int = 0,
+        image: pygame.Surface | None = None,
+    ) -> None:
+        """Queue many blits.
+
+        Args:
+            blits (Iterable[BlitPair]): Surfaces and positions to draw.
+            layer (int, optional): Layer to draw on. Defaults to 0.
+            image (pygame.Surface | None, optional): Surface shared by every
+            blit, if any, so the layer needn't be sorted. Defaults to None.
+        """
+        self._get_buffer(layer).extend(blits)
+        texture = None if image is None else get_texture_key((image, None))
+        self._add_texture(layer, texture)
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Draw every queued blit, and empty the queues.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+        """
+        for layer in self.layer_order:
+            buffer = self.layers[layer]
+            if not buffer:
+                continue
+
+            if layer in self.sorted_layers and self.layer_textures[layer] is None:
+                buffer.sort(key=get_texture_key)
+            surface.blits(buffer, doreturn=False)
+            buffer.clear()
+        self.layer_textures.clear()
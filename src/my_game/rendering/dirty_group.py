@@ -0,0 +1,199 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Tuple
+
+import pygame
+
+from .batch_renderer import BatchRenderer
+
+
+class DirtyGroup(pygame.sprite.Group):
+    """A sprite group able to redraw only the regions that changed since the
+    last frame.
+
+    Sprites mark themselves with a `dirty` attribute when their image changes.
+    Movement is detected by comparing against the rect drawn last frame, which
+    pygame already keeps in `spritedict`.
+
+    Drawing goes through a `BatchRenderer`. Sprites are drawn on the layer in
+    their `layer` attribute, 0 if they have none.
+
+    Sprites with an `active` attribute of False stay in the group but are
+    skipped by `sprites`, and so by updating, drawing and iterating. Use
+    `set_active` to toggle it, so what they drew is cleared.
+    """
+
+    needs_redraw: bool
+    renderer: BatchRenderer
+
+    def __init__(self, *sprites):
+        super().__init__(*sprites)
+        self.needs_redraw = True
+        self.renderer = BatchRenderer()
+
+    def sprites(self) -> List[pygame.sprite.Sprite]:
+        """Get the active sprites in the group.
+
+        Returns:
+            List[pygame.sprite.Sprite]: The sprites, in the order they were
+            added.
+        """
+        return [sprite for sprite in self.spritedict if getattr(sprite, "active", True)]
+
+    def set_active(self, sprite: pygame.sprite.Sprite, active: bool) -> None:
+        """Show or hide a sprite without adding it to or removing it from the
+        group.
+
+        Args:
+            sprite (pygame.sprite.Sprite): A sprite in the group.
+            active (bool): Whether it's updated and drawn.
+        """
+        sprite.active = active
+        if not active:
+            previous_rect = self.spritedict[sprite]
+            if previous_rect:
+                self.lostsprites.append(previous_rect)
+            self.spritedict[sprite] = None
+
+    def invalidate(self) -> None:
+        """Force the next `draw_dirty` to redraw everything."""
+        self.needs_redraw = True
+
+    def _draw_position(self, sprite: pygame.sprite.Sprite, alpha: float) -> Tuple:
+        """Get where a sprite should be drawn. Used internally.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite being drawn.
+            alpha (float): Interpolation factor between simulation steps.
+
+        Returns:
+            Tuple: Top left position to draw the sprite at.
+        """
+        _ = alpha
+        return sprite.rect.topleft
+
+    @staticmethod
+    def _clear(
+        surface: pygame.Surface, background: pygame.Color | pygame.Surface
+    ) -> None:
+        """Clear a surface, within its clip area. Used internally.
+
+        Args:
+            surface (pygame.Surface): Surface to clear.
+            background (pygame.Color | pygame.Surface): Color to fill with, or
+            a surface to copy.
+        """
+        if isinstance(background, pygame.Surface):
+            surface.blit(background, (0, 0))
+        else:
+            surface.fill(background)
+
+    def submit(self, renderer: BatchRenderer, alpha: float = 1.0) -> None:
+        """Queue everything the group draws.
+
+        Args:
+            renderer (BatchRenderer): Renderer to queue blits on.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+        """
+        for sprite in self.sprites():
+            renderer.add(
+                sprite.image,
+                self._draw_position(sprite, alpha),
+                getattr(sprite, "layer", 0),
+            )
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw every sprite.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+        """
+        self.submit(self.renderer, alpha)
+        self.renderer.flush(surface)
+
+    def draw_dirty(
+        self,
+        surface: pygame.Surface,
+        background: pygame.Color | pygame.Surface,
+        alpha: float = 1.0,
+    ) -> List[pygame.Rect]:
+        """Clear and redraw only the regions that changed since the last call.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto. Must still contain
+            the previous frame.
+            background (pygame.Color | pygame.Surface): Color to clear regions
+            with, or a surface of the same size to restore them from.
+            alpha (float, optional): Interpolation factor between the previous
+            and current simulation step. Defaults to 1.0.
+
+        Returns:
+            List[pygame.Rect]: Regions of the surface that were redrawn.
+        """
+        sprites = self.sprites()
+        bounds = surface.get_rect()
+
+        if self.needs_redraw:
+            self.needs_redraw = False
+            self._clear(surface, background)
+            self.draw(surface, alpha)
+            for sprite in sprites:
+                sprite.dirty = False
+                self.spritedict[sprite] = bounds.clip(
+                    pygame.Rect(
+                        self._draw_position(sprite, alpha), sprite.image.get_size()
+                    )
+                )
+            self.lostsprites.clear()
+            return [bounds]
+
+        regions = list(self.lostsprites)
+        rects = []
+        for sprite in sprites:
+            rect = pygame.Rect(
+                self._draw_position(sprite, alpha), sprite.image.get_size()
+            )
+            visible_rect = bounds.clip(rect)
+            previous_rect = self.spritedict.get(sprite)
+            if sprite.dirty or visible_rect != previous_rect:
+                sprite.dirty = False
+                if previous_rect and previous_rect != visible_rect:
+                    regions.append(previous_rect)
+                regions.append(visible_rect)
+                self.spritedict[sprite] = visible_rect
+            rects.append(rect)
+        self.lostsprites.clear()
+
+        # sprites overlapping a region are redrawn clipped to it, in the same
+        # order as a full draw, so neighbours that didn't change are restored
+        # as they were
+        renderer = self.renderer
+        for region in regions:
+            surface.set_clip(region)
+            self._clear(surface, background)
+            for sprite, rect in zip(sprites, rects):
+                if rect.colliderect(region):
+                    renderer.add(sprite.image, rect, getattr(sprite, "layer", 0))
+            renderer.flush(surface)
+        surface.set_clip(None)
+
+        return regions
@@ -0,0 +1,145 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, List, Tuple
+
+import pygame
+
+from .batch_renderer import BlitPair
+
+
+ColorValue = pygame.Color | str | Tuple[int, ...]
+
+
+class GlyphAtlas:
+    """Renders text by composing cached surfaces of single glyphs, for text
+    which changes often, like timers or statistics. Each glyph is rasterized
+    once, after which drawing a string only costs a blit per character.
+
+    Kerning between glyphs is not applied, so strings may be slightly wider
+    than `pygame.font.Font.render` would make them.
+    """
+
+    font: pygame.font.Font
+    color: ColorValue
+    antialias: bool
+    background: ColorValue | None
+    glyphs: Dict[str, pygame.Surface]
+    height: int
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        color: ColorValue,
+        antialias: bool = True,
+        background: ColorValue | None = None,
+    ) -> None:
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.background = background
+        self.glyphs = {}
+        self.height = font.get_height()
+
+    def get_glyph(self, char: str) -> pygame.Surface:
+        """Get the surface of a glyph, rendering it on first use.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            pygame.Surface: The glyph, as wide as its advance.
+        """
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, self.antialias, self.color, self.background)
+            if pygame.display.get_surface() is not None:
+                glyph = glyph.convert() if self.background else glyph.convert_alpha()
+            self.glyphs[char] = glyph
+        return glyph
+
+    def get_size(self, text: str) -> Tuple[int, int]:
+        """Get the size of a string.
+
+        Args:
+            text (str): The string.
+
+        Returns:
+            Tuple[int, int]: Width and height it's drawn with.
+        """
+        return (sum(self.get_glyph(char).get_width() for char in text), self.height)
+
+    def get_blits(
+        self, text: str, position: Tuple[int, int]
+    ) -> Tuple[List[BlitPair], int]:
+        """Get the glyph blits drawing a string, e.g. to queue on a
+        `BatchRenderer`.
+
+        Args:
+            text (str): The string.
+            position (Tuple[int, int]): Top left position of the string.
+
+        Returns:
+            Tuple[List[BlitPair], int]: Glyphs and their positions, and the
+            width of the string.
+        """
+        glyphs = self.glyphs
+        x, y = position
+        blits = []
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = self.get_glyph(char)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return blits, x - position[0]
+
+    def draw(
+        self, surface: pygame.Surface, text: str, position: Tuple[int, int]
+    ) -> pygame.Rect:
+        """Draw a string.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+            text (str): The string.
+            position (Tuple[int, int]): Top left position of the string.
+
+        Returns:
+            pygame.Rect: Area drawn to.
+        """
+        blits, width = self.get_blits(text, position)
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(position, (width, self.height))
+
+    def render(self, text: str) -> pygame.Surface:
+        """Render a string onto a new surface, like `pygame.font.Font.render`.
+
+        Args:
+            text (str): The string.
+
+        Returns:
+            pygame.Surface: The rendered string.
+        """
+        size = self.get_size(text)
+        if self.background is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface(size)
+            surface.fill(self.background)
+        self.draw(surface, text, (0, 0))
+        return surface
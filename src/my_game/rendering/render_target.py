@@ -0,0 +1,237 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from enum import StrEnum
+from typing import List, Tuple
+
+import pygame
+
+
+LOGICAL_SIZE: Tuple[int, int] = (800, 600)
+
+
+class ScaleMode(StrEnum):
+    """How the logical frame is scaled to the window."""
+
+    # scale by the largest whole factor that fits, keeping pixels square
+    INTEGER: str = "integer"
+    # scale to fit, duplicating pixels
+    NEAREST: str = "nearest"
+    # scale to fit, filtering pixels
+    SMOOTH: str = "smooth"
+
+
+class RenderTarget:  # pylint: disable=R0902
+    """A surface of fixed logical size which the game draws into, shown in the
+    window with one scaled blit, letterboxed to keep its aspect ratio.
+
+    Sprites are laid out in logical coordinates only, so resizing the window,
+    e.g. toggling fullscreen, costs nothing besides working out the new scale.
+    The scale, letterbox and scaled destination are cached until the window
+    changes. While the window is exactly the logical size, `surface` is the
+    window itself, so presenting costs nothing at all.
+    """
+
+    BAR_COLOR: str = "#000000"
+
+    size: Tuple[int, int]
+    mode: ScaleMode
+    surface: pygame.Surface
+    window: pygame.Surface | None
+    window_size: Tuple[int, int]
+    scale: float
+    dest_rect: pygame.Rect
+    dest_surface: pygame.Surface | None
+    bars: List[pygame.Rect]
+    needs_present: bool
+
+    def __init__(
+        self, size: Tuple[int, int] = LOGICAL_SIZE, mode: ScaleMode = ScaleMode.NEAREST
+    ) -> None:
+        self.size = size
+        self.mode = mode
+        self.surface = self._create_surface()
+        self.window = None
+        self.window_size = (0, 0)
+        self.scale = 1.0
+        self.dest_rect = pygame.Rect((0, 0), size)
+        self.dest_surface = None
+        self.bars = []
+        self.needs_present = True
+
+    def _create_surface(self) -> pygame.Surface:
+        """Create an offscreen surface of the logical size. Used internally.
+
+        Returns:
+            pygame.Surface: The surface, in the display's pixel format once a
+            display mode is set.
+        """
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def invalidate(self) -> None:
+        """Force the next `present` to work out the layout again and show the
+        whole frame. Must be called when the display mode is set, as pygame
+        keeps the same display surface object. What was drawn is lost if it
+        was drawn straight into the window, so the frame must be redrawn.
+        """
+        if self.surface is self.window:
+            self.surface = self._create_surface()
+        self.window = None
+        self.needs_present = True
+
+    def _update_layout(self, window: pygame.Surface) -> None:
+        """Work out the scale and letterbox for a window. Used internally.
+
+        Args:
+            window (pygame.Surface): The display surface.
+        """
+        window_size = window.get_size()
+        self.window = window
+        self.window_size = window_size
+        self.needs_present = True
+
+        if window_size == self.size:
+            # draw straight into the window from now on
+            if self.surface is not window:
+                window.blit(self.surface, (0, 0))
+                self.surface = window
+            self.scale = 1.0
+            self.dest_rect = window.get_rect()
+            self.dest_surface = None
+            self.bars = []
+            return
+
+        if self.surface is window:
+            self.surface = self._create_surface()
+
+        scale = min(window_size[0] / self.size[0], window_size[1] / self.size[1])
+        # windows smaller than the logical size can only be scaled down
+        if self.mode == ScaleMode.INTEGER and scale >= 1:
+            scale = int(scale)
+
+        self.dest_rect = pygame.Rect(
+            (0, 0), (int(self.size[0] * scale), int(self.size[1] * scale))
+        )
+        self.dest_rect.center = window.get_rect().center
+        self.scale = scale
+
+        # frames are scaled straight into the window, through a subsurface
+        # covering the destination
+        if self.dest_rect.size == self.size:
+            self.dest_surface = None
+        else:
+            self.dest_surface = window.subsurface(self.dest_rect)
+
+        dest = self.dest_rect
+        self.bars = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, window_size[0], dest.top),
+                pygame.Rect(
+                    0, dest.bottom, window_size[0], window_size[1] - dest.bottom
+                ),
+                pygame.Rect(0, dest.top, dest.left, dest.height),
+                pygame.Rect(
+                    dest.right, dest.top, window_size[0] - dest.right, dest.height
+                ),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
+    def present(
+        self, window: pygame.Surface, rects: List[pygame.Rect] | None = None
+    ) -> List[pygame.Rect] | None:
+        """Copy the logical frame into the window.
+
+        Args:
+            window (pygame.Surface): The display surface.
+            rects (List[pygame.Rect] | None, optional): Logical regions which
+            changed, or None if the whole frame did. Defaults to None.
+
+        Returns:
+            List[pygame.Rect] | None: Regions of the window which changed, or
+            None if the whole window should be updated.
+        """
+        if window is not self.window or window.get_size() != self.window_size:
+            self._update_layout(window)
+
+        if self.needs_present:
+            self.needs_present = False
+            for bar_rect in self.bars:
+                window.fill(RenderTarget.BAR_COLOR, bar_rect)
+            rects = None
+
+        if self.surface is window:
+            return rects
+
+        if self.dest_surface is None:
+            offset = self.dest_rect.topleft
+            if rects is None:
+                window.blit(self.surface, offset)
+                return None
+            window.blits(
+                [(self.surface, rect.move(offset), rect) for rect in rects],
+                doreturn=False,
+            )
+            return [rect.move(offset) for rect in rects]
+
+        if self.mode == ScaleMode.SMOOTH:
+            pygame.transform.smoothscale(
+                self.surface, self.dest_rect.size, self.dest_surface
+            )
+        else:
+            pygame.transform.scale(self.surface, self.dest_rect.size, self.dest_surface)
+        if rects is None:
+            return None
+        return [self.to_window(rect) for rect in rects]
+
+    def to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        """Map a logical rect to the window.
+
+        Args:
+            rect (pygame.Rect): Rect in logical coordinates.
+
+        Returns:
+            pygame.Rect: Rect covering it in the window. Grown by a pixel, as
+            smooth scaling blends neighbouring pixels.
+        """
+        scale = self.scale
+        return pygame.Rect(
+            self.dest_rect.x + int(rect.x * scale) - 1,
+            self.dest_rect.y + int(rect.y * scale) - 1,
+            int(rect.width * scale) + 3,
+            int(rect.height * scale) + 3,
+        ).clip(self.dest_rect)
+
+    def to_logical(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """Map a window position, e.g. of the mouse, to logical coordinates.
+
+        Args:
+            position (Tuple[int, int]): Position in the window.
+
+        Returns:
+            Tuple[int, int]: Position in the logical frame. Positions over the
+            letterbox fall outside of it.
+        """
+        return (
+            int((position[0] - self.dest_rect.x) / self.scale),
+            int((position[1] - self.dest_rect.y) / self.scale),
+        )
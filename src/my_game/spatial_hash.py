@@ -0,0 +1,194 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Hashable, Iterator, Set, Tuple
+
+import pygame
+
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """Uniform grid used as a broad phase for collision detection. Each item is
+    stored in every cell its rect overlaps, so lookups and pair enumeration only
+    compare items sharing a cell instead of every item against every other.
+    """
+
+    CELL_SIZE: int = 64
+
+    cell_size: int
+    cells: Dict[Tuple[int, int], Set[Hashable]]
+    rects: Dict[Hashable, pygame.Rect]
+    cell_ranges: Dict[Hashable, CellRange]
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells = {}
+        self.rects = {}
+        self.cell_ranges = {}
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.rects
+
+    def _cell_range(self, rect: pygame.Rect) -> CellRange:
+        """Get the range of cells a rect overlaps. Used internally.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            CellRange: First and last cell on each axis, inclusive.
+        """
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.left, rect.right - 1) // size,
+            max(rect.top, rect.bottom - 1) // size,
+        )
+
+    @staticmethod
+    def _cells_in(cell_range: CellRange) -> Iterator[Tuple[int, int]]:
+        """Iterate over the cell keys in a range. Used internally.
+
+        Args:
+            cell_range (CellRange): First and last cell on each axis, inclusive.
+
+        Yields:
+            Tuple[int, int]: Cell keys.
+        """
+        for x in range(cell_range[0], cell_range[2] + 1):
+            for y in range(cell_range[1], cell_range[3] + 1):
+                yield (x, y)
+
+    def insert(self, item: Hashable, rect: pygame.Rect) -> None:
+        """Add an item.
+
+        Args:
+            item (Hashable): The item, e.g. a sprite.
+            rect (pygame.Rect): Area covered by the item.
+        """
+        cell_range = self._cell_range(rect)
+        self.rects[item] = pygame.Rect(rect)
+        self.cell_ranges[item] = cell_range
+        for key in self._cells_in(cell_range):
+            self.cells.setdefault(key, set()).add(item)
+
+    def remove(self, item: Hashable) -> None:
+        """Remove an item.
+
+        Args:
+            item (Hashable): The item to remove.
+        """
+        for key in self._cells_in(self.cell_ranges.pop(item)):
+            cell = self.cells[key]
+            cell.discard(item)
+            if not cell:
+                del self.cells[key]
+        del self.rects[item]
+
+    def move(self, item: Hashable, rect: pygame.Rect) -> None:
+        """Update the area covered by an item. Cells are only touched when the
+        item crosses into different cells.
+
+        Args:
+            item (Hashable): The item to move.
+            rect (pygame.Rect): New area covered by the item.
+        """
+        self.rects[item].update(rect)
+
+        cell_range = self._cell_range(rect)
+        previous_range = self.cell_ranges[item]
+        if cell_range == previous_range:
+            return
+
+        for key in self._cells_in(previous_range):
+            cell = self.cells[key]
+            cell.discard(item)
+            if not cell:
+                del self.cells[key]
+        for key in self._cells_in(cell_range):
+            self.cells.setdefault(key, set()).add(item)
+        self.cell_ranges[item] = cell_range
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self.cells.clear()
+        self.rects.clear()
+        self.cell_ranges.clear()
+
+    def query_rect(self, rect: pygame.Rect) -> Set[Hashable]:
+        """Find the items overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): Area to look in.
+
+        Returns:
+            Set[Hashable]: Items whose rect overlaps `rect`.
+        """
+        rect = pygame.Rect(rect)
+        found = set()
+        for key in self._cells_in(self._cell_range(rect)):
+            cell = self.cells.get(key)
+            if cell:
+                found.update(
+                    item for item in cell if rect.colliderect(self.rects[item])
+                )
+        return found
+
+    def query_point(self, point: Tuple[int, int]) -> Set[Hashable]:
+        """Find the items containing a point.
+
+        Args:
+            point (Tuple[int, int]): The point to look at.
+
+        Returns:
+            Set[Hashable]: Items whose rect contains `point`.
+        """
+        cell = self.cells.get(
+            (int(point[0]) // self.cell_size, int(point[1]) // self.cell_size)
+        )
+        if not cell:
+            return set()
+        return {item for item in cell if self.rects[item].collidepoint(point)}
+
+    def pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """Find every pair of overlapping items.
+
+        Returns:
+            Set[Tuple[Hashable, Hashable]]: Overlapping pairs, each reported
+            once.
+        """
+        found = set()
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+
+            items = list(cell)
+            rects = [self.rects[item] for item in items]
+            for i, rect in enumerate(rects[:-1]):
+                for j in rect.collidelistall(rects[i + 1 :]):
+                    first, second = items[i], items[i + 1 + j]
+                    found.add(
+                        (first, second) if id(first) < id(second) else (second, first)
+                    )
+        return found
@@ -0,0 +1,158 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import statistics
+import time
+
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import StrEnum
+from typing import Deque, Dict, Type
+
+
+class FramePacingMode(StrEnum):
+    """Strategies available to limit the frame rate."""
+
+    HYBRID: str = "hybrid"
+    SLEEP: str = "sleep"
+    VSYNC: str = "vsync"
+
+
+class FramePacer(ABC):
+    """Base class for frame rate limiters. Keeps track of recent frame times to
+    report the frame rate and how steady it is.
+    """
+
+    SAMPLE_COUNT: int = 120
+
+    vsync: bool = False
+    frame_times: Deque[float]
+    last_tick: float
+
+    def __init__(self) -> None:
+        self.frame_times = deque(maxlen=FramePacer.SAMPLE_COUNT)
+        self.last_tick = time.perf_counter()
+
+    def tick(self, max_fps: int) -> float:
+        """Wait for the next frame, limiting the frame rate to `max_fps`.
+
+        Args:
+            max_fps (int): Maximum frames per second. 0 disables the limit.
+
+        Returns:
+            float: Time since the previous tick, in milliseconds.
+        """
+        if max_fps > 0:
+            self._wait_until(self.last_tick + 1.0 / max_fps)
+
+        now = time.perf_counter()
+        frame_time = (now - self.last_tick) * 1000.0
+        self.last_tick = now
+        self.frame_times.append(frame_time)
+        return frame_time
+
+    @abstractmethod
+    def _wait_until(self, deadline: float) -> None:
+        """Block until `time.perf_counter()` reaches `deadline`. Used internally.
+
+        Args:
+            deadline (float): Target time, in seconds.
+        """
+
+    def get_fps(self) -> float:
+        """Get the average frame rate over the recent frames.
+
+        Returns:
+            float: Frames per second.
+        """
+        if not self.frame_times:
+            return 0.0
+        return 1000.0 / statistics.fmean(self.frame_times)
+
+    def get_jitter(self) -> float:
+        """Get the frame time jitter over the recent frames.
+
+        Returns:
+            float: Standard deviation of the frame times, in milliseconds.
+        """
+        if len(self.frame_times) < 2:
+            return 0.0
+        return statistics.pstdev(self.frame_times)
+
+
+class SleepFramePacer(FramePacer):
+    """Sleeps for the remainder of the frame. Cheapest on the CPU, but precision
+    is bound by the OS scheduler.
+    """
+
+    def _wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+class HybridFramePacer(FramePacer):
+    """Sleeps for most of the frame, then spins for the last `spin_time` seconds
+    to hit the deadline precisely.
+    """
+
+    SPIN_TIME: float = 0.002
+
+    spin_time: float
+
+    def __init__(self, spin_time: float = SPIN_TIME) -> None:
+        super().__init__()
+        self.spin_time = spin_time
+
+    def _wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter() - self.spin_time
+        if remaining > 0:
+            time.sleep(remaining)
+
+        while time.perf_counter() < deadline:
+            pass
+
+
+class VsyncFramePacer(FramePacer):
+    """Doesn't wait at all, leaving the pacing to `pygame.display.flip()`
+    blocking on the display's vertical sync.
+    """
+
+    vsync: bool = True
+
+    def _wait_until(self, deadline: float) -> None:
+        _ = deadline
+
+
+FRAME_PACERS: Dict[FramePacingMode, Type[FramePacer]] = {
+    FramePacingMode.HYBRID: HybridFramePacer,
+    FramePacingMode.SLEEP: SleepFramePacer,
+    FramePacingMode.VSYNC: VsyncFramePacer,
+}
+
+
+def create_frame_pacer(mode: FramePacingMode) -> FramePacer:
+    """Create the frame pacer for the given mode.
+
+    Args:
+        mode (FramePacingMode): The pacing strategy.
+
+    Returns:
+        FramePacer: A new frame pacer.
+    """
+    return FRAME_PACERS[mode]()
@@ -0,0 +1,134 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import heapq
+import itertools
+import math
+
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Tuple
+
+
+TimerCallbackFn = Callable[[], None]
+
+
+@dataclass
+class Timer:
+    """Data structure for holding a scheduled callback."""
+
+    due: float
+    interval: float | None
+    callback: TimerCallbackFn
+    catch_up: bool = True
+    is_cancelled: bool = False
+
+    def cancel(self) -> None:
+        """Stop the timer from firing again."""
+        self.is_cancelled = True
+
+
+class Scheduler:
+    """Runs callbacks after a delay, once or repeatedly. Time only advances
+    through `update`, so timers follow the game's clock and never block it.
+    """
+
+    time: float
+    timers: List[Tuple[float, int, Timer]]
+    counter: Iterator[int]
+
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.timers = []
+        # breaks ties between timers due at the same time, in scheduling order
+        self.counter = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, timer in self.timers if not timer.is_cancelled)
+
+    def call_later(self, delay: float, callback: TimerCallbackFn) -> Timer:
+        """Call `callback` once, after `delay` seconds.
+
+        Args:
+            delay (float): Delay, in seconds.
+            callback (TimerCallbackFn): Function to call.
+
+        Returns:
+            Timer: The timer, which can be cancelled.
+        """
+        return self._schedule(Timer(self.time + delay, None, callback))
+
+    def call_every(
+        self, interval: float, callback: TimerCallbackFn, catch_up: bool = True
+    ) -> Timer:
+        """Call `callback` every `interval` seconds, until cancelled.
+
+        Args:
+            interval (float): Interval between calls, in seconds. Must be
+            positive.
+            callback (TimerCallbackFn): Function to call.
+            catch_up (bool, optional): Call once per interval missed during a
+            long frame. When False, missed intervals collapse into one call.
+            Defaults to True.
+
+        Returns:
+            Timer: The timer, which can be cancelled.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        return self._schedule(Timer(self.time + interval, interval, callback, catch_up))
+
+    def _schedule(self, timer: Timer) -> Timer:
+        """Queue a timer. Used internally.
+
+        Args:
+            timer (Timer): The timer.
+
+        Returns:
+            Timer: The same timer.
+        """
+        heapq.heappush(self.timers, (timer.due, next(self.counter), timer))
+        return timer
+
+    def update(self, delta_time: float) -> None:
+        """Advance time and fire the timers which are due. A repeating timer
+        fires once per interval elapsed, so it catches up after a long frame,
+        unless it was scheduled without `catch_up`.
+
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+        """
+        self.time += delta_time
+        while self.timers and self.timers[0][0] <= self.time:
+            _, _, timer = heapq.heappop(self.timers)
+            if timer.is_cancelled:
+                continue
+
+            timer.callback()
+            if timer.interval is not None and not timer.is_cancelled:
+                timer.due += timer.interval
+                if not timer.catch_up and timer.due <= self.time:
+                    # skip to the first interval after now
+                    missed = math.floor((self.time - timer.due) / timer.interval)
+                    timer.due += (missed + 1) * timer.interval
+                self._schedule(timer)
+
+    def clear(self) -> None:
+        """Cancel every timer."""
+        for _, _, timer in self.timers:
+            timer.cancel()
+        self.timers.clear()
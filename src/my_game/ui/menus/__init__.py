@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .loading_screen import LoadingScreen
 from .main_menu import MainMenu
 from .options_menu import OptionsMenu
 from .pause_menu import PauseMenu
@@ -0,0 +1,67 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable
+
+import pygame
+
+from ..widgets import UIProgressBar
+from ...events import LOADING_COMPLETE
+from ...game_objects.game_object import GameObject
+from ...rendering import LOGICAL_SIZE, DirtyGroup
+
+
+class LoadingScreen(DirtyGroup):
+    """Shows the splash screen and a progress bar while assets load. Posts
+    `LOADING_COMPLETE` once progress reaches 1.
+    """
+
+    get_progress: Callable[[], float]
+    progress_bar: UIProgressBar
+    is_complete: bool
+
+    def __init__(self, splash: pygame.Surface, get_progress: Callable[[], float]):
+        splash_screen = GameObject(splash)
+        self.progress_bar = UIProgressBar(
+            (splash.get_width() // 2, 8), bg_color="#465f50", fill_color="#66B083"
+        )
+        super().__init__(splash_screen, self.progress_bar)
+        self.get_progress = get_progress
+        self.is_complete = False
+
+        size = LOGICAL_SIZE
+        splash_screen.position = (
+            (size[0] - splash_screen.rect.width) // 2,
+            (size[1] - splash_screen.rect.height) // 2,
+        )
+        splash_screen.sync_rect()
+        self.progress_bar.rect.midbottom = (size[0] // 2, size[1] - 24)
+
+    def update(self, delta_time: float) -> None:
+        """Update the progress bar.
+
+        Args:
+            delta_time (float): Delta between frames, in seconds.
+        """
+        _ = delta_time
+        progress = self.get_progress()
+        self.progress_bar.set_progress(progress)
+
+        if progress >= 1.0 and not self.is_complete:
+            self.is_complete = True
+            pygame.event.post(pygame.event.Event(LOADING_COMPLETE))
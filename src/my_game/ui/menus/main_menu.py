@@ -18,6 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import pygame
 
+from ...timing import Scheduler
 from ..widgets.ui_button import UIButton, UIButtonStyle
 from ..widgets.ui_container import UIContainer
 from ...events import (
@@ -31,7 +32,7 @@ class MainMenu(UIContainer):
     hooks to UI widgets.
     """
 
-    def __init__(self, font: pygame.font.Font):
+    def __init__(self, font: pygame.font.Font, scheduler: Scheduler | None = None):
         super().__init__(
             [
                 UIButton(
@@ -45,6 +46,7 @@ class MainMenu(UIContainer):
                         padding=(40, 20),
                     ),
                     on_pressed_callback=self.on_play_pressed,
+                    scheduler=scheduler,
                 ),
                 UIButton(
                     "Options",
@@ -57,6 +59,7 @@ class MainMenu(UIContainer):
                         padding=(40, 20),
                     ),
                     on_pressed_callback=self.on_options_pressed,
+                    scheduler=scheduler,
                 ),
                 UIButton(
                     "Quit",
@@ -69,6 +72,7 @@ class MainMenu(UIContainer):
                         padding=(40, 20),
                     ),
                     on_pressed_callback=self.on_quit_pressed,
+                    scheduler=scheduler,
                 ),
             ]
         )
@@ -18,6 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import pygame
 
+from ...timing import Scheduler
 from ..widgets import UIButton, UIButtonStyle
 from ..widgets import UIContainer
 from ...events import (
@@ -31,7 +32,7 @@ class OptionsMenu(UIContainer):
     hooks to UI widgets.
     """
 
-    def __init__(self, font: pygame.font.Font):
+    def __init__(self, font: pygame.font.Font, scheduler: Scheduler | None = None):
         super().__init__(
             [
                 UIButton(
@@ -45,6 +46,7 @@ class OptionsMenu(UIContainer):
                         padding=(40, 20),
                     ),
                     on_pressed_callback=self.on_toggle_fullscreen_pressed,
+                    scheduler=scheduler,
                 ),
                 UIButton(
                     "Go Back",
@@ -57,6 +59,7 @@ class OptionsMenu(UIContainer):
                         padding=(40, 20),
                     ),
                     on_pressed_callback=self.on_go_back_pressed,
+                    scheduler=scheduler,
                 ),
             ]
         )
@@ -20,5 +20,8 @@ from .ui_button import (
     UIButton,
     UIButtonState,
     UIButtonStyle,
+    clear_render_cache,
+    render_button,
 )
 from .ui_container import UIContainer
+from .ui_progress_bar import UIProgressBar
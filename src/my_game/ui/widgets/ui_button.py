@@ -16,16 +16,21 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Callable, Tuple
 
 import pygame
 
+from ...timing import Scheduler, Timer
 
-@dataclass
+
+@dataclass(frozen=True)
 class UIButtonStyle:
-    """Data structure for holding properties related to button styling."""
+    """Data structure for holding properties related to button styling. Frozen,
+    as rendered buttons are cached by style.
+    """
 
     font: pygame.font.Font
     font_color: pygame.Color
@@ -50,10 +55,90 @@ OnPressedCallbackFn = Callable[
     None,
 ]
 
+# image of each UIButtonState, indexed by state
+UIButtonImages = Tuple[pygame.Surface, pygame.Surface, pygame.Surface]
+
+# rendered buttons kept before the least recently used is evicted
+RENDER_CACHE_SIZE: int = 64
+
+_render_cache: "OrderedDict[tuple, UIButtonImages]" = OrderedDict()
+
+
+def clear_render_cache(font: pygame.font.Font | None = None) -> None:
+    """Drop rendered button images, e.g. once their font is evicted, so the
+    cache doesn't keep the font alive.
+
+    Args:
+        font (pygame.font.Font | None, optional): Only drop images rendered
+        with this font. Defaults to None, dropping every image.
+    """
+    if font is None:
+        _render_cache.clear()
+        return
+
+    for key in [key for key in _render_cache if key[1] is font]:
+        del _render_cache[key]
+
+
+def render_button(text: str, style: UIButtonStyle) -> UIButtonImages:
+    """Render the image of each button state. Images are kept in a least
+    recently used cache, so buttons with the same text and style share them.
+
+    Args:
+        text (str): Text of the button.
+        style (UIButtonStyle): Style of the button.
+
+    Returns:
+        UIButtonImages: The image of each state, indexed by `UIButtonState`.
+    """
+    # colors may be given as unhashable pygame.Color, so key on their values
+    key = (
+        text,
+        style.font,
+        tuple(pygame.Color(style.font_color)),
+        tuple(pygame.Color(style.bg_color)),
+        tuple(pygame.Color(style.hover_color)),
+        tuple(pygame.Color(style.press_color)),
+        tuple(style.padding),
+    )
+    images = _render_cache.get(key)
+    if images is not None:
+        _render_cache.move_to_end(key)
+        return images
+
+    text_surface = style.font.render(text, 0, style.font_color)
+    text_size = text_surface.get_size()
+    button_size = (
+        text_size[0] + (2 * style.padding[0]),
+        text_size[1] + (2 * style.padding[1]),
+    )
+    text_offset = (
+        (button_size[0] - text_size[0]) / 2,
+        (button_size[1] - text_size[1]) / 2,
+    )
+
+    rendered = []
+    for color in (style.bg_color, style.hover_color, style.press_color):
+        image = pygame.Surface(button_size)
+        image.fill(color)
+        image.blit(text_surface, text_offset)
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        rendered.append(image)
+
+    images = tuple(rendered)
+    _render_cache[key] = images
+    if len(_render_cache) > RENDER_CACHE_SIZE:
+        _render_cache.popitem(last=False)
+    return images
+
 
 class UIButton(pygame.sprite.Sprite):  # pylint: disable=R0902
-    """A button with text. Provides a callback for `on_pressed` events."""
+    """A button with text. Provides a callback for `on_pressed` events. Driven
+    by the mouse events its `UIContainer` dispatches.
+    """
 
+    # how long the pressed state shows after a click, in milliseconds
     CLICK_DELAY: int = 20
 
     state: UIButtonState
@@ -61,46 +146,30 @@ class UIButton(pygame.sprite.Sprite):  # pylint: disable=R0902
     rect: pygame.Rect
     text: str
     stlye: UIButtonStyle
-    button_surface: pygame.Surface
-    text_surface: pygame.Surface
+    images: UIButtonImages
     on_pressed_callback: OnPressedCallbackFn | None
-    was_pressed: bool
+    scheduler: Scheduler | None
+    release_timer: Timer | None
+    dirty: bool
 
     def __init__(
         self,
         text: str,
         style: UIButtonStyle,
         on_pressed_callback: OnPressedCallbackFn | None = None,
+        scheduler: Scheduler | None = None,
     ):
         super().__init__()
+        self.scheduler = scheduler
+        self.release_timer = None
         self.state = UIButtonState.DEFAULT
-        self.was_pressed = False
         self.on_pressed_callback = on_pressed_callback
         self.style = style
         self.text = text
-        self.text_surface = style.font.render(text, 0, style.font_color)
-
-        text_size = self.text_surface.get_size()
-        button_size = (
-            text_size[0] + (2 * style.padding[0]),
-            text_size[1] + (2 * style.padding[1]),
-        )
-        self.button_surface = pygame.Surface(button_size)
-        self.button_surface.fill(style.bg_color)
-
-        text_offset = (
-            (button_size[0] - text_size[0]) / 2,
-            (button_size[1] - text_size[1]) / 2,
-        )
-
-        self.image = pygame.Surface(button_size)
-        self.image.blits(
-            [
-                (self.button_surface, (0, 0)),
-                (self.text_surface, text_offset),
-            ]
-        )
+        self.images = render_button(text, style)
+        self.image = self.images[self.state]
         self.rect = self.image.get_rect()
+        self.dirty = True
 
     @property
     def position(self) -> Tuple[int, int]:
@@ -119,6 +188,7 @@ class UIButton(pygame.sprite.Sprite):  # pylint: disable=R0902
             position (Tuple[int, int]): New position to set to.
         """
         self.rect = pygame.Rect(position, self.rect.size)
+        self.dirty = True
 
     @property
     def size(self) -> Tuple[int, int]:
@@ -137,80 +207,64 @@ class UIButton(pygame.sprite.Sprite):  # pylint: disable=R0902
             size (Tuple[int, int]): New size to set to.
         """
         self.rect.size = size
-
-    def is_hovered(self) -> bool:
-        """Returns whether this element is being hovered over by the user's mouse.
-
-        Returns:
-            bool: Whether the element is being hovered over.
-        """
-        mouse_pos = pygame.mouse.get_pos()
-        return (
-            self.rect.left <= mouse_pos[0] <= self.rect.right
-            and self.rect.top <= mouse_pos[1] <= self.rect.bottom
-        )
+        self.dirty = True
 
     def _set_state(self, state: UIButtonState) -> None:
-        """Set the state of the button. Used internally.
+        """Set the state of the button. Used internally. Only swaps to the
+        pre-rendered image of the state.
 
         Args:
             state (UIButtonState): Next state.
         """
         self.state = state
-        match self.state:
-            case UIButtonState.DEFAULT:
-                self.button_surface.fill(self.style.bg_color)
-
-            case UIButtonState.HOVERED:
-                self.button_surface.fill(self.style.hover_color)
-
-            case UIButtonState.PRESSED:
-                self.button_surface.fill(self.style.press_color)
-
-            case _:
-                pass
-
-        text_size = self.text_surface.get_size()
-        button_size = (
-            text_size[0] + (2 * self.style.padding[0]),
-            text_size[1] + (2 * self.style.padding[1]),
-        )
-        text_offset = (
-            (button_size[0] - text_size[0]) / 2,
-            (button_size[1] - text_size[1]) / 2,
-        )
-        self.image.blits(
-            [
-                (self.button_surface, (0, 0)),
-                (self.text_surface, text_offset),
-            ]
-        )
-
-    def update(self, delta_time: float) -> None:
-        """Updates the state of the UIButton."""
-        _ = delta_time
-        is_mouse_pressed: bool = pygame.mouse.get_pressed()[0] is True
-
-        # ignore input if not hovered
-        hovered = self.is_hovered()
-        if hovered:
-            if (
-                not self.was_pressed
-                and self.state != UIButtonState.PRESSED
-                and is_mouse_pressed
-            ):
-                self._set_state(UIButtonState.PRESSED)
-
-            elif self.state == UIButtonState.PRESSED and not is_mouse_pressed:
-                if self.on_pressed_callback:
-                    self.on_pressed_callback()
-                pygame.time.wait(UIButton.CLICK_DELAY)
-                self._set_state(UIButtonState.HOVERED)
-
-            elif self.state != UIButtonState.HOVERED and not is_mouse_pressed:
-                self._set_state(UIButtonState.HOVERED)
-
-        elif self.state != UIButtonState.DEFAULT:
+        self.image = self.images[state]
+        self.dirty = True
+
+    def on_mouse_enter(self) -> None:
+        """Called when the mouse moves over the button."""
+        if self.state == UIButtonState.DEFAULT:
+            self._set_state(UIButtonState.HOVERED)
+
+    def on_mouse_leave(self) -> None:
+        """Called when the mouse moves off the button. Cancels a press."""
+        self._cancel_release()
+        if self.state != UIButtonState.DEFAULT:
             self._set_state(UIButtonState.DEFAULT)
 
-        self.was_pressed = is_mouse_pressed
+    def on_mouse_down(self) -> None:
+        """Called when the left mouse button is pressed over the button."""
+        self._cancel_release()
+        self._set_state(UIButtonState.PRESSED)
+
+    def on_mouse_up(self, is_over: bool) -> None:
+        """Called when the left mouse button is released after pressing the
+        button. Calls `on_pressed_callback` if the press wasn't cancelled.
+
+        Args:
+            is_over (bool): Whether the mouse is still over the button.
+        """
+        if not is_over or self.state != UIButtonState.PRESSED:
+            return
+
+        if self.on_pressed_callback:
+            self.on_pressed_callback()
+
+        # keep showing the pressed state for a moment, without blocking
+        if self.scheduler is None:
+            self._release()
+        else:
+            self.release_timer = self.scheduler.call_later(
+                UIButton.CLICK_DELAY / 1000.0, self._release
+            )
+
+    def _release(self) -> None:
+        """Go back from the pressed to the hovered state. Used internally."""
+        self.release_timer = None
+        if self.state == UIButtonState.PRESSED:
+            self._set_state(UIButtonState.HOVERED)
+
+    def _cancel_release(self) -> None:
+        """Cancel a pending `_release`. Used internally."""
+        if self.release_timer is not None:
+            self.release_timer.cancel()
+            self.release_timer = None
@@ -16,20 +16,121 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from typing import Tuple
+
 import pygame
 
+from ...rendering import LOGICAL_SIZE, DirtyGroup
+from ...spatial_hash import SpatialHash
+
 
-class UIContainer(pygame.sprite.Group):
+class UIContainer(DirtyGroup):
     """A container for UI widgets which automatically centers them and provides
     Y-padding to items.
+
+    Widgets are driven by mouse events passed to `handle_event` rather than by
+    polling the mouse every frame. The widget under the mouse is found through
+    a spatial hash, and only widgets the mouse enters, leaves or presses are
+    notified, through their `on_mouse_enter`, `on_mouse_leave`,
+    `on_mouse_down` and `on_mouse_up` methods.
     """
 
+    spatial_hash: SpatialHash
+    hovered_widget: pygame.sprite.Sprite | None
+    pressed_widget: pygame.sprite.Sprite | None
+
     def __init__(self, *widgets, y_padding: int = 10):
+        self.spatial_hash = SpatialHash()
+        self.hovered_widget = None
+        self.pressed_widget = None
         super().__init__(*widgets)
         self._position_items(y_padding=y_padding)
 
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: None = None) -> None:
+        """Add a widget to the container and to the spatial hash."""
+        super().add_internal(sprite, layer)
+        self.spatial_hash.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a widget from the container and from the spatial hash."""
+        super().remove_internal(sprite)
+        self.spatial_hash.remove(sprite)
+        if sprite is self.hovered_widget:
+            self.hovered_widget = None
+        if sprite is self.pressed_widget:
+            self.pressed_widget = None
+
+    def update(self, *args, **kwargs) -> None:
+        """Widgets only change in response to `handle_event`, so there's nothing
+        to do per frame.
+        """
+
+    def on_suspend(self) -> None:
+        """Reset widgets the mouse was over, since the container stops getting
+        mouse events until resumed.
+        """
+        self._set_hovered(None)
+        self.pressed_widget = None
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Dispatch a mouse event to the widgets it affects.
+
+        Args:
+            event (pygame.event.Event): A `MOUSEMOTION`, `MOUSEBUTTONDOWN` or
+            `MOUSEBUTTONUP` event. Other events are ignored.
+        """
+        match event.type:
+            case pygame.MOUSEMOTION:
+                self._set_hovered(self.get_widget_at(event.pos))
+
+            case pygame.MOUSEBUTTONDOWN if event.button == pygame.BUTTON_LEFT:
+                widget = self.get_widget_at(event.pos)
+                self._set_hovered(widget)
+                if widget is not None:
+                    self.pressed_widget = widget
+                    widget.on_mouse_down()
+
+            case pygame.MOUSEBUTTONUP if event.button == pygame.BUTTON_LEFT:
+                widget = self.get_widget_at(event.pos)
+                self._set_hovered(widget)
+                if self.pressed_widget is not None:
+                    pressed_widget = self.pressed_widget
+                    self.pressed_widget = None
+                    pressed_widget.on_mouse_up(pressed_widget is widget)
+
+            case _:
+                pass
+
+    def get_widget_at(self, position: Tuple[int, int]) -> pygame.sprite.Sprite | None:
+        """Get the widget at a position.
+
+        Args:
+            position (Tuple[int, int]): The position, e.g. of the mouse.
+
+        Returns:
+            pygame.sprite.Sprite | None: A widget containing `position`, None if
+            there's none.
+        """
+        widgets = self.spatial_hash.query_point(position)
+        return next(iter(widgets), None)
+
+    def _set_hovered(self, widget: pygame.sprite.Sprite | None) -> None:
+        """Notify widgets the mouse left or entered. Used internally.
+
+        Args:
+            widget (pygame.sprite.Sprite | None): Widget now under the mouse.
+        """
+        if widget is self.hovered_widget:
+            return
+
+        if self.hovered_widget is not None:
+            self.hovered_widget.on_mouse_leave()
+        self.hovered_widget = widget
+        if widget is not None:
+            widget.on_mouse_enter()
+
     def _position_items(self, y_padding: int) -> None:
-        size = pygame.display.get_window_size()
+        size = LOGICAL_SIZE
         center = (size[0] / 2, size[1] / 2)
 
         sprites = self.sprites()
@@ -41,3 +142,4 @@ class UIContainer(pygame.sprite.Group):
             x_offset = item.size[0] / 2
             y_offset = i * (item.size[1] + y_padding) - (y_height / 2)
             item.position = (center[0] - x_offset, center[1] + y_offset)
+            self.spatial_hash.move(item, item.rect)
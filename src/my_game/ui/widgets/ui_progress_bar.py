@@ -0,0 +1,64 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Tuple
+
+import pygame
+
+
+class UIProgressBar(pygame.sprite.Sprite):
+    """A horizontal bar filling up from left to right."""
+
+    image: pygame.Surface
+    rect: pygame.Rect
+    progress: float
+    bg_color: pygame.Color
+    fill_color: pygame.Color
+    dirty: bool
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        bg_color: pygame.Color,
+        fill_color: pygame.Color,
+    ):
+        super().__init__()
+        self.bg_color = bg_color
+        self.fill_color = fill_color
+        self.image = pygame.Surface(size)
+        self.rect = self.image.get_rect()
+        self.progress = -1.0
+        self.set_progress(0.0)
+
+    def set_progress(self, progress: float) -> None:
+        """Update how full the bar is. Only redrawn when it changed.
+
+        Args:
+            progress (float): Progress from 0 to 1.
+        """
+        progress = min(max(progress, 0.0), 1.0)
+        if progress == self.progress:
+            return
+
+        self.progress = progress
+        self.image.fill(self.bg_color)
+        self.image.fill(
+            self.fill_color,
+            (0, 0, round(self.rect.width * progress), self.rect.height),
+        )
+        self.dirty = True
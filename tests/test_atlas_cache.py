@@ -0,0 +1,126 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+from unittest import mock
+
+import pygame
+
+from src.my_game.managers import atlas_cache
+
+SPRITESHEET: str = """<TextureAtlas imagePath="sheet.png">
+    <SubTexture name="left" x="0" y="0" width="4" height="8" />
+    <SubTexture name="right" x="4" y="0" width="4" height="8" />
+</TextureAtlas>
+"""
+
+
+class TestAtlasCache(unittest.TestCase):
+    """Tests for building and loading atlas caches."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        root = pathlib.Path(self.directory)
+        self.cache_dir = str(root / "cache")
+        self.path = str(root / "sheet.xml")
+        self.image_path = root / "sheet.png"
+
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(SPRITESHEET)
+        image = pygame.Surface((8, 8), pygame.SRCALPHA)
+        image.fill("red", (0, 0, 4, 8))
+        image.fill("blue", (4, 0, 4, 8))
+        pygame.image.save(image, str(self.image_path))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def get_cache_path(self) -> pathlib.Path:
+        """Get the path of the spritesheet's cache file.
+
+        Returns:
+            pathlib.Path: The path.
+        """
+        return atlas_cache.get_cache_path(self.path, self.cache_dir)
+
+    def test_round_trip(self) -> None:
+        """A built cache loads the same atlas and rects."""
+        _, rects = atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        loaded = atlas_cache.load_atlas_cache(self.path, self.cache_dir)
+
+        self.assertIsNotNone(loaded)
+        surface, loaded_rects = loaded
+        self.assertEqual(loaded_rects, rects)
+        self.assertEqual(loaded_rects["right"], pygame.Rect(4, 0, 4, 8))
+        self.assertEqual(surface.get_at((1, 1)), pygame.Color("red"))
+        self.assertEqual(surface.get_at((6, 1)), pygame.Color("blue"))
+
+    def test_missing_cache(self) -> None:
+        """Without a cache file, there's nothing to load."""
+        self.assertIsNone(atlas_cache.load_atlas_cache(self.path, self.cache_dir))
+
+    def test_stale_cache(self) -> None:
+        """A cache is out of date once its image changes."""
+        atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        image = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.image.save(image, str(self.image_path))
+
+        self.assertIsNone(atlas_cache.load_atlas_cache(self.path, self.cache_dir))
+
+    def test_truncated_cache(self) -> None:
+        """A cache cut short isn't loaded."""
+        atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        data = self.get_cache_path().read_bytes()
+        for length in (len(data) // 2, atlas_cache.HEADER.size - 1, 0):
+            self.get_cache_path().write_bytes(data[:length])
+            self.assertIsNone(atlas_cache.load_atlas_cache(self.path, self.cache_dir))
+
+    def test_corrupt_cache(self) -> None:
+        """A cache with a corrupt header or index isn't loaded."""
+        atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        data = self.get_cache_path().read_bytes()
+        header_size = atlas_cache.HEADER.size
+        for start, end in ((0, 4), (header_size, len(data) - 8 * 8 * 4)):
+            corrupt = bytearray(data)
+            corrupt[start:end] = b"\xff" * (end - start)
+            self.get_cache_path().write_bytes(bytes(corrupt))
+            self.assertIsNone(atlas_cache.load_atlas_cache(self.path, self.cache_dir))
+
+    def test_rebuild_replaces_corrupt_cache(self) -> None:
+        """Building again replaces a cache which failed to load."""
+        atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        data = self.get_cache_path().read_bytes()
+        self.get_cache_path().write_bytes(data[: len(data) // 2])
+
+        atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+        self.assertIsNotNone(atlas_cache.load_atlas_cache(self.path, self.cache_dir))
+
+    def test_failed_write_leaves_no_temp_file(self) -> None:
+        """Writing the cache may fail, without leaving files behind."""
+        with mock.patch("pygame.image.tobytes", side_effect=OSError("disk full")):
+            atlas_cache.build_atlas_cache(self.path, self.cache_dir)
+
+        self.assertEqual(list(pathlib.Path(self.cache_dir).iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import pygame
+
+from src.my_game.rendering import BatchRenderer
+
+
+def make_texture(color: str) -> pygame.Surface:
+    """Create a texture filled with a color, cut from its own atlas.
+
+    Args:
+        color (str): The color.
+
+    Returns:
+        pygame.Surface: The texture.
+    """
+    atlas = pygame.Surface((16, 16))
+    atlas.fill(color)
+    return atlas.subsurface((0, 0, 8, 8))
+
+
+class TestBatchRenderer(unittest.TestCase):
+    """Tests for `BatchRenderer`."""
+
+    def setUp(self) -> None:
+        self.surface = pygame.Surface((32, 32))
+        self.red = make_texture("red")
+        self.blue = make_texture("blue")
+
+    def test_overlapping_blits_keep_their_order(self) -> None:
+        """Overlapping blits from different textures are drawn as queued."""
+        renderer = BatchRenderer()
+        for first, second in ((self.red, self.blue), (self.blue, self.red)):
+            renderer.add(first, (0, 0))
+            renderer.add(second, (4, 4))
+            renderer.add(first, (8, 8))
+            renderer.flush(self.surface)
+
+            self.assertEqual(self.surface.get_at((6, 6)), second.get_at((0, 0)))
+            self.assertEqual(self.surface.get_at((10, 10)), first.get_at((0, 0)))
+
+    def test_layers_draw_from_lowest(self) -> None:
+        """Higher layers are drawn over lower ones, whatever the queue order."""
+        renderer = BatchRenderer()
+        renderer.add(self.red, (0, 0), layer=2)
+        renderer.add(self.blue, (0, 0), layer=-1)
+        renderer.flush(self.surface)
+
+        self.assertEqual(self.surface.get_at((0, 0)), pygame.Color("red"))
+
+    def test_sorted_layers_group_textures(self) -> None:
+        """Blits on sorted layers are grouped by texture."""
+        renderer = BatchRenderer(sorted_layers=[0])
+        blits = [(self.red, (0, 0)), (self.blue, (8, 0)), (self.red, (16, 0))]
+        renderer.add_many(blits)
+        buffer = renderer.layers[0]
+        renderer.flush(self.surface)
+
+        self.assertEqual(buffer, [])
+        self.assertEqual(self.surface.get_at((16, 0)), pygame.Color("red"))
+        self.assertEqual(self.surface.get_at((8, 0)), pygame.Color("blue"))
+
+    def test_flush_empties_the_queues(self) -> None:
+        """Queued blits are only drawn once."""
+        renderer = BatchRenderer()
+        renderer.add(self.red, (0, 0))
+        renderer.flush(self.surface)
+        self.surface.fill("black")
+        renderer.flush(self.surface)
+
+        self.assertEqual(self.surface.get_at((0, 0)), pygame.Color("black"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import pygame
+
+from src.my_game.rendering import DirtyGroup
+
+
+BACKGROUND: pygame.Color = pygame.Color("black")
+
+
+class Block(pygame.sprite.Sprite):
+    """Sprite filled with one color."""
+
+    def __init__(self, color: str, position: tuple) -> None:
+        super().__init__()
+        self.image = pygame.Surface((10, 10))
+        self.image.fill(color)
+        self.rect = self.image.get_rect(topleft=position)
+        self.dirty = True
+
+
+class TestDirtyGroup(unittest.TestCase):
+    """Tests for `DirtyGroup.draw_dirty`."""
+
+    def setUp(self) -> None:
+        self.surface = pygame.Surface((50, 50))
+        self.red = Block("red", (0, 0))
+        self.blue = Block("blue", (5, 5))
+        self.group = DirtyGroup(self.red, self.blue)
+        self.bounds = self.surface.get_rect()
+
+    def draw(self) -> list:
+        """Draw the changes of the group.
+
+        Returns:
+            list: Regions redrawn.
+        """
+        return self.group.draw_dirty(self.surface, BACKGROUND)
+
+    def test_first_draw_is_full(self) -> None:
+        """The first draw redraws the whole surface."""
+        self.assertEqual(self.draw(), [self.bounds])
+        self.assertEqual(self.surface.get_at((2, 2)), pygame.Color("red"))
+        self.assertEqual(self.surface.get_at((7, 7)), pygame.Color("blue"))
+
+    def test_unchanged_frame_draws_nothing(self) -> None:
+        """Nothing is redrawn when no sprite changed."""
+        self.draw()
+        self.assertEqual(self.draw(), [])
+
+    def test_moved_sprite_redraws_both_areas(self) -> None:
+        """Moving a sprite clears where it was and draws where it is."""
+        self.draw()
+        self.blue.rect.topleft = (30, 30)
+
+        regions = self.draw()
+        self.assertEqual(
+            regions, [pygame.Rect(5, 5, 10, 10), pygame.Rect(30, 30, 10, 10)]
+        )
+        self.assertEqual(self.surface.get_at((12, 12)), BACKGROUND)
+        self.assertEqual(self.surface.get_at((35, 35)), pygame.Color("blue"))
+
+    def test_neighbours_keep_their_order(self) -> None:
+        """Sprites overlapping a redrawn region are restored in draw order."""
+        self.draw()
+        self.red.image.fill("green")
+        self.red.dirty = True
+
+        self.assertEqual(self.draw(), [pygame.Rect(0, 0, 10, 10)])
+        self.assertEqual(self.surface.get_at((2, 2)), pygame.Color("green"))
+        # blue was added last, so it stays over red where they overlap
+        self.assertEqual(self.surface.get_at((7, 7)), pygame.Color("blue"))
+
+    def test_removed_sprite_is_cleared(self) -> None:
+        """Removing a sprite clears the area it was drawn at."""
+        self.draw()
+        self.blue.kill()
+
+        self.assertEqual(self.draw(), [pygame.Rect(5, 5, 10, 10)])
+        self.assertEqual(self.surface.get_at((12, 12)), BACKGROUND)
+        self.assertEqual(self.surface.get_at((2, 2)), pygame.Color("red"))
+
+    def test_offscreen_areas_are_clipped(self) -> None:
+        """Regions are clipped to the surface."""
+        self.draw()
+        self.blue.rect.topleft = (45, 45)
+
+        self.assertEqual(self.draw()[-1], pygame.Rect(45, 45, 5, 5))
+
+    def test_invalidate_forces_full_redraw(self) -> None:
+        """After `invalidate`, the whole surface is redrawn."""
+        self.draw()
+        self.group.invalidate()
+        self.surface.fill("white")
+
+        self.assertEqual(self.draw(), [self.bounds])
+        self.assertEqual(self.surface.get_at((40, 40)), BACKGROUND)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import unittest
+
+from typing import List
+
+import pygame
+
+from src.my_game.event_bus import WINDOW_EVENT_TYPES, EventBus
+from src.my_game.game_states import GameStates
+
+
+class TestEventBus(unittest.TestCase):
+    """Tests for `EventBus`."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+
+    def setUp(self) -> None:
+        self.state: GameStates | None = GameStates.MAIN_MENU
+        self.bus = EventBus(lambda: self.state)
+        self.calls: List[str] = []
+
+    def tearDown(self) -> None:
+        pygame.event.set_allowed(None)
+
+    def test_dispatch_state_handlers_before_global(self) -> None:
+        """State handlers run before the global ones."""
+        self.bus.subscribe(pygame.KEYDOWN, lambda _: self.calls.append("global"))
+        self.bus.subscribe(
+            pygame.KEYDOWN, lambda _: self.calls.append("menu"), GameStates.MAIN_MENU
+        )
+        self.bus.dispatch(pygame.event.Event(pygame.KEYDOWN))
+        self.assertEqual(self.calls, ["menu", "global"])
+
+    def test_dispatch_skips_other_states(self) -> None:
+        """Handlers of other states aren't called."""
+        self.bus.subscribe(
+            pygame.KEYDOWN, lambda _: self.calls.append("play"), GameStates.GAMEPLAY
+        )
+        self.bus.dispatch(pygame.event.Event(pygame.KEYDOWN))
+        self.assertEqual(self.calls, [])
+        self.state = GameStates.GAMEPLAY
+        self.bus.dispatch(pygame.event.Event(pygame.KEYDOWN))
+        self.assertEqual(self.calls, ["play"])
+
+    def test_unsubscribe(self) -> None:
+        """Unsubscribed handlers aren't called and their types are dropped."""
+
+        def handler(_: pygame.event.Event) -> None:
+            self.calls.append("menu")
+
+        self.bus.subscribe(pygame.KEYDOWN, handler, GameStates.MAIN_MENU)
+        self.bus.unsubscribe(pygame.KEYDOWN, handler, GameStates.MAIN_MENU)
+        self.bus.dispatch(pygame.event.Event(pygame.KEYDOWN))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.bus.get_event_types(), set())
+
+    def test_get_event_types(self) -> None:
+        """Types of global and state handlers are both included."""
+        self.bus.subscribe(pygame.QUIT, self.calls.append)
+        self.bus.subscribe(pygame.KEYDOWN, self.calls.append, GameStates.GAMEPLAY)
+        self.assertEqual(self.bus.get_event_types(), {pygame.QUIT, pygame.KEYDOWN})
+
+    def test_filter_events(self) -> None:
+        """Types without subscribers are blocked, window events never are."""
+        self.bus.subscribe(pygame.QUIT, self.calls.append)
+        self.bus.filter_events()
+        self.assertFalse(pygame.event.get_blocked(pygame.QUIT))
+        self.assertTrue(pygame.event.get_blocked(pygame.KEYDOWN))
+        for event_type in WINDOW_EVENT_TYPES:
+            self.assertFalse(pygame.event.get_blocked(event_type))
+
+    def test_filter_events_follows_subscriptions(self) -> None:
+        """Types are allowed on subscribe and blocked on their last unsubscribe."""
+        self.bus.filter_events()
+        self.bus.subscribe(pygame.KEYDOWN, self.calls.append)
+        self.assertFalse(pygame.event.get_blocked(pygame.KEYDOWN))
+        self.bus.unsubscribe(pygame.KEYDOWN, self.calls.append)
+        self.assertTrue(pygame.event.get_blocked(pygame.KEYDOWN))
+
+    def test_window_events_never_blocked(self) -> None:
+        """Unsubscribing from a window event keeps it allowed."""
+        self.bus.filter_events()
+        self.bus.subscribe(pygame.WINDOWEXPOSED, self.calls.append)
+        self.bus.unsubscribe(pygame.WINDOWEXPOSED, self.calls.append)
+        self.assertFalse(pygame.event.get_blocked(pygame.WINDOWEXPOSED))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pathlib
+import unittest
+
+from typing import List
+
+import pygame
+
+from src.my_game.managers import FontManager, TextStyle
+
+FONT_PATH: str = str(
+    pathlib.Path(__file__).parent.parent / "data/fonts/Rijusans-Regular.ttf"
+)
+
+
+class TestFontManagerText(unittest.TestCase):
+    """Tests for text rendering of `FontManager`."""
+
+    def setUp(self) -> None:
+        self.manager = FontManager(text_cache_size=2)
+        self.manager.add(FONT_PATH, size=16)
+
+    def test_render_cached(self) -> None:
+        """Rendering the same text in the same style reuses the surface."""
+        surface = self.manager.render("score", TextStyle("white"))
+        self.assertIs(self.manager.render("score", TextStyle("white")), surface)
+
+    def test_render_color_key(self) -> None:
+        """Equal colors given in different forms share a cache entry."""
+        surface = self.manager.render("score", TextStyle(pygame.Color("white")))
+        self.assertIs(
+            self.manager.render("score", TextStyle((255, 255, 255, 255))), surface
+        )
+        self.assertIsNot(self.manager.render("score", TextStyle("red")), surface)
+
+    def test_render_evicts_least_recently_used(self) -> None:
+        """The least recently used text is rendered again once evicted."""
+        style = TextStyle("white")
+        first = self.manager.render("a", style)
+        second = self.manager.render("b", style)
+        self.manager.render("a", style)
+        self.manager.render("c", style)
+        self.assertIs(self.manager.render("a", style), first)
+        self.assertIsNot(self.manager.render("b", style), second)
+
+    def test_render_missing_font(self) -> None:
+        """Nothing is rendered with a font which isn't loaded."""
+        self.assertIsNone(self.manager.render("a", TextStyle("white", name="none")))
+        self.assertIsNone(self.manager.get_glyph_atlas(TextStyle("white", name="none")))
+
+    def test_glyph_atlas_per_style(self) -> None:
+        """Equal styles share a glyph atlas, other sizes get their own."""
+        atlas = self.manager.get_glyph_atlas(TextStyle("white"))
+        self.assertIs(self.manager.get_glyph_atlas(TextStyle("white", size=16)), atlas)
+        other = self.manager.get_glyph_atlas(TextStyle("white", size=20))
+        self.assertIsNot(other, atlas)
+        self.assertEqual(other.height, self.manager.get(size=20).get_height())
+
+
+class TestFontManagerSizes(unittest.TestCase):
+    """Tests for fonts of other sizes than they were added with."""
+
+    def setUp(self) -> None:
+        self.manager = FontManager(font_cache_size=1)
+        self.manager.add(FONT_PATH, size=16)
+        self.evicted: List[pygame.font.Font] = []
+        self.manager.on_evict = self.evicted.append
+
+    def test_get_added_size(self) -> None:
+        """Without a size, or with the added one, the added font is returned."""
+        font = self.manager.get()
+        self.assertIs(self.manager.get(size=16), font)
+        self.assertEqual(
+            font.get_height(), pygame.font.Font(FONT_PATH, 16).get_height()
+        )
+
+    def test_get_missing(self) -> None:
+        """Fonts which aren't loaded aren't found at any size."""
+        self.assertIsNone(self.manager.get("none"))
+        self.assertIsNone(self.manager.get("none", 20))
+
+    def test_get_other_size_cached(self) -> None:
+        """Other sizes are created once."""
+        font = self.manager.get(size=20)
+        self.assertIs(self.manager.get(size=20), font)
+        self.assertEqual(
+            font.get_height(), pygame.font.Font(FONT_PATH, 20).get_height()
+        )
+
+    def test_file_read_once(self) -> None:
+        """Fonts added from the same file share its contents."""
+        self.manager.add(FONT_PATH, "title", 32)
+        self.assertEqual(list(self.manager.font_files), [FONT_PATH])
+        self.assertEqual(self.manager.font_keys["title"], (FONT_PATH, 32))
+
+    def test_eviction(self) -> None:
+        """The least recently used size is evicted with its glyph atlases."""
+        font = self.manager.get(size=20)
+        self.manager.get_glyph_atlas(TextStyle("white", size=20))
+        self.manager.get(size=24)
+        self.assertEqual(self.evicted, [font])
+        self.assertEqual(self.manager.glyph_atlases, {})
+        self.assertIsNot(self.manager.get(size=20), font)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from src.my_game.game import Game, GameConfig
+
+
+class TestGameConfig(unittest.TestCase):
+    """Tests for `GameConfig`."""
+
+    def test_rejects_non_positive_simulation_rate(self) -> None:
+        """A simulation rate must be positive."""
+        for rate in (0, -60):
+            with self.assertRaises(ValueError):
+                GameConfig(simulation_rate=rate)
+
+    def test_rejects_no_updates_per_frame(self) -> None:
+        """At least one update must be allowed per frame."""
+        with self.assertRaises(ValueError):
+            GameConfig(simulation_rate=60, max_updates_per_frame=0)
+
+    def test_variable_step_is_allowed(self) -> None:
+        """Without a simulation rate, the game updates once per frame."""
+        self.assertIsNone(GameConfig().simulation_rate)
+
+
+class TestStepSimulation(unittest.TestCase):
+    """Tests for `Game.step_simulation`."""
+
+    def setUp(self) -> None:
+        self.game = Game()
+        self.game.config = GameConfig(simulation_rate=100, max_updates_per_frame=3)
+        self.game.accumulator = 0.0
+        self.steps = []
+        self.game.update = self.steps.append
+
+    def test_runs_fixed_steps_and_returns_alpha(self) -> None:
+        """Frame time is consumed in fixed steps, the remainder giving alpha."""
+        alpha = self.game.step_simulation(0.025)
+
+        self.assertEqual(self.steps, [0.01, 0.01])
+        self.assertAlmostEqual(alpha, 0.5)
+
+    def test_accumulates_short_frames(self) -> None:
+        """Frames shorter than a step carry over to the next frame."""
+        self.assertAlmostEqual(self.game.step_simulation(0.006), 0.6)
+        self.assertEqual(self.steps, [])
+
+        self.assertAlmostEqual(self.game.step_simulation(0.006), 0.2)
+        self.assertEqual(self.steps, [0.01])
+
+    def test_clamps_updates_per_frame(self) -> None:
+        """A long frame runs at most `max_updates_per_frame` steps and drops
+        the rest of the backlog.
+        """
+        alpha = self.game.step_simulation(1.0045)
+
+        self.assertEqual(len(self.steps), 3)
+        self.assertAlmostEqual(alpha, 0.45)
+        self.assertLess(self.game.accumulator, 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
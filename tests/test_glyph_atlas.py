@@ -0,0 +1,90 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pathlib
+import unittest
+
+import pygame
+
+from src.my_game.rendering import GlyphAtlas
+
+FONT_PATH: str = str(
+    pathlib.Path(__file__).parent.parent / "data/fonts/Rijusans-Regular.ttf"
+)
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Tests for `GlyphAtlas`."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        pygame.font.init()
+
+    def setUp(self) -> None:
+        self.font = pygame.font.Font(FONT_PATH, 16)
+        self.atlas = GlyphAtlas(self.font, "white")
+
+    def test_glyph_cached(self) -> None:
+        """Each glyph is rendered once."""
+        glyph = self.atlas.get_glyph("a")
+        self.assertIs(self.atlas.get_glyph("a"), glyph)
+        self.atlas.get_blits("aaa", (0, 0))
+        self.assertEqual(list(self.atlas.glyphs), ["a"])
+
+    def test_get_size(self) -> None:
+        """Strings are as wide as their glyphs and as high as the font."""
+        width = self.atlas.get_glyph("1").get_width()
+        self.assertEqual(
+            self.atlas.get_size("111"), (3 * width, self.font.get_height())
+        )
+        self.assertEqual(self.atlas.get_size(""), (0, self.font.get_height()))
+
+    def test_get_blits(self) -> None:
+        """Glyphs are placed one after another from the position."""
+        blits, width = self.atlas.get_blits("ab", (10, 20))
+        a_width = self.atlas.get_glyph("a").get_width()
+        self.assertEqual(
+            [position for _, position in blits], [(10, 20), (10 + a_width, 20)]
+        )
+        self.assertEqual(width, self.atlas.get_size("ab")[0])
+
+    def test_draw(self) -> None:
+        """Drawing returns the area drawn to and changes pixels in it."""
+        surface = pygame.Surface((100, 40))
+        rect = self.atlas.draw(surface, "W", (5, 5))
+        self.assertEqual(rect, pygame.Rect((5, 5), self.atlas.get_size("W")))
+        black = (0, 0, 0)
+        self.assertNotEqual(pygame.transform.average_color(surface, rect)[:3], black)
+        outside = pygame.Rect(rect.right, 0, 100 - rect.right, 40)
+        self.assertEqual(pygame.transform.average_color(surface, outside)[:3], black)
+
+    def test_render(self) -> None:
+        """Rendered strings are transparent without a background."""
+        surface = self.atlas.render("hi")
+        self.assertEqual(surface.get_size(), self.atlas.get_size("hi"))
+        self.assertTrue(surface.get_flags() & pygame.SRCALPHA)
+
+    def test_render_background(self) -> None:
+        """Rendered strings are filled with the background."""
+        atlas = GlyphAtlas(self.font, "white", background="blue")
+        surface = atlas.render("  ")
+        self.assertEqual(surface.get_at((0, 0)), pygame.Color("blue"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.my_game.events import GAMEPLAY_PAUSE
+from src.my_game.input_log import InputRecorder, InputReplay
+
+
+class TestInputLog(unittest.TestCase):
+    """Tests for recording input with `InputRecorder` and playing it back with
+    `InputReplay`.
+    """
+
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_round_trip(self) -> None:
+        """Recorded input events and delta times are played back."""
+        recorder = InputRecorder(self.path)
+        recorder.record_frame(
+            0.016,
+            [
+                pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=1),
+                pygame.event.Event(
+                    pygame.MOUSEMOTION,
+                    pos=(-3, 400),
+                    rel=(1, 1),
+                    buttons=(True, False, True),
+                ),
+                pygame.event.Event(pygame.ACTIVEEVENT, gain=1, state=1),
+            ],
+        )
+        recorder.record_frame(0.0, [])
+        recorder.record_frame(
+            0.02,
+            [
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 20), button=3),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(11, 21), button=3),
+                pygame.event.Event(pygame.KEYUP, key=pygame.K_a, mod=0),
+                pygame.event.Event(pygame.QUIT),
+            ],
+        )
+        recorder.write()
+
+        replay = InputReplay(self.path)
+        self.assertEqual(len(replay), 3)
+
+        self.assertEqual(replay.next_frame(), 0.016)
+        events = replay.get_events([])
+        self.assertEqual(len(events), 2)
+        key_down, motion = events[0], events[1]
+        self.assertEqual(key_down.type, pygame.KEYDOWN)
+        self.assertEqual((key_down.key, key_down.mod), (pygame.K_ESCAPE, 1))
+        self.assertEqual(motion.pos, (-3, 400))
+        self.assertEqual(motion.buttons, (True, False, True))
+
+        self.assertEqual(replay.next_frame(), 0.0)
+        self.assertEqual(replay.get_events([]), [])
+
+        self.assertEqual(replay.next_frame(), 0.02)
+        events = replay.get_events([])
+        self.assertEqual(
+            [event.type for event in events],
+            [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYUP, pygame.QUIT],
+        )
+        self.assertEqual((events[0].pos, events[0].button), ((10, 20), 3))
+        self.assertEqual((events[1].pos, events[1].button), ((11, 21), 3))
+        self.assertEqual(events[2].key, pygame.K_a)
+
+        self.assertIsNone(replay.next_frame())
+
+    def test_internal_events_keep_their_place(self) -> None:
+        """The game's own events are replayed where they were handled."""
+        recorder = InputRecorder(self.path)
+        key_down = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0)
+        recorder.record_frame(0.016, [pygame.event.Event(GAMEPLAY_PAUSE), key_down])
+        recorder.write()
+
+        replay = InputReplay(self.path)
+        replay.next_frame()
+        pause = pygame.event.Event(GAMEPLAY_PAUSE)
+        extra = pygame.event.Event(GAMEPLAY_PAUSE, extra=True)
+        events = replay.get_events([key_down, pause, extra])
+
+        self.assertIs(events[0], pause)
+        self.assertEqual(events[1].type, pygame.KEYDOWN)
+        self.assertIs(events[2], extra)
+        self.assertEqual(len(events), 3)
+
+    def test_missing_internal_events_are_skipped(self) -> None:
+        """Internal events the game didn't post again are skipped."""
+        recorder = InputRecorder(self.path)
+        recorder.record_frame(0.016, [pygame.event.Event(GAMEPLAY_PAUSE)])
+        recorder.write()
+
+        replay = InputReplay(self.path)
+        replay.next_frame()
+        self.assertEqual(replay.get_events([]), [])
+
+    def test_rejects_other_files(self) -> None:
+        """Files which aren't input logs are rejected."""
+        with open(self.path, "wb") as file:
+            file.write(b"NOPE\x01\x00")
+
+        with self.assertRaises(ValueError):
+            InputReplay(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import pygame
+
+from src.my_game.game_objects import Ball, ObjectPool
+from src.my_game.rendering import DirtyGroup
+from src.my_game.spatial_hash import SpatialHash
+
+
+class SpatialGroup(DirtyGroup):
+    """Group keeping its active sprites in a spatial hash, like `Gameplay`."""
+
+    def __init__(self) -> None:
+        self.spatial_hash = SpatialHash()
+        super().__init__()
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: None = None) -> None:
+        """Add a sprite to the group and to the spatial hash."""
+        super().add_internal(sprite, layer)
+        self.spatial_hash.insert(sprite, sprite.rect)
+
+    def set_active(self, sprite: pygame.sprite.Sprite, active: bool) -> None:
+        """Show or hide a sprite, taking it out of the spatial hash while it's
+        hidden.
+        """
+        super().set_active(sprite, active)
+        if active and sprite not in self.spatial_hash:
+            self.spatial_hash.insert(sprite, sprite.rect)
+        elif not active and sprite in self.spatial_hash:
+            self.spatial_hash.remove(sprite)
+
+
+class TestObjectPool(unittest.TestCase):
+    """Tests for `ObjectPool`."""
+
+    def test_preallocated_objects_are_inactive(self) -> None:
+        """Preallocated objects are in the group, but inactive."""
+        group = SpatialGroup()
+        pool = ObjectPool(Ball, preallocate=3, group=group)
+
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(len(group.spritedict), 3)
+        self.assertEqual(group.sprites(), [])
+        self.assertEqual(len(group.spatial_hash), 0)
+
+    def test_acquire_reuses_released_objects(self) -> None:
+        """Released objects are handed out again, counting hits."""
+        pool = ObjectPool(Ball, preallocate=1)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        third = pool.acquire()
+
+        self.assertIs(third, first)
+        self.assertIsNot(second, first)
+        self.assertTrue(third.active)
+        self.assertEqual((pool.hits, pool.misses, pool.size), (2, 1, 2))
+        self.assertAlmostEqual(pool.get_hit_rate(), 2 / 3)
+
+    def test_hit_rate_without_acquisitions(self) -> None:
+        """The hit rate is 0 before any acquisition."""
+        self.assertEqual(ObjectPool(Ball).get_hit_rate(), 0.0)
+
+    def test_group_membership_is_toggled(self) -> None:
+        """Pooled objects stay in their group, toggled active."""
+        group = SpatialGroup()
+        pool = ObjectPool(Ball, group=group)
+
+        ball = pool.acquire()
+        self.assertEqual(group.sprites(), [ball])
+        self.assertIn(ball, group.spatial_hash)
+
+        pool.release(ball)
+        self.assertIn(ball, group.spritedict)
+        self.assertEqual(group.sprites(), [])
+        self.assertNotIn(ball, group.spatial_hash)
+
+        pool.acquire()
+        self.assertEqual(group.sprites(), [ball])
+        self.assertEqual(len(group.spritedict), 1)
+
+    def test_double_release_raises(self) -> None:
+        """Releasing an object twice raises."""
+        pool = ObjectPool(Ball)
+        ball = pool.acquire()
+        pool.release(ball)
+
+        with self.assertRaises(ValueError):
+            pool.release(ball)
+        self.assertEqual(len(pool), 1)
+
+    def test_stats(self) -> None:
+        """Statistics report the pool's usage."""
+        pool = ObjectPool(Ball, preallocate=2)
+        pool.acquire()
+
+        self.assertEqual(
+            pool.get_stats(),
+            {"size": 2, "free": 1, "hits": 1, "misses": 0, "hit_rate": 1.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from typing import Tuple
+
+import pygame
+
+from src.my_game.rendering import RenderTarget, ScaleMode
+
+SIZE: Tuple[int, int] = (80, 60)
+
+
+class TestRenderTarget(unittest.TestCase):
+    """Tests for `RenderTarget`."""
+
+    def test_scale_to_fill(self) -> None:
+        """Windows of the same aspect ratio are filled without bars."""
+        target = RenderTarget(SIZE)
+        window = pygame.Surface((160, 120))
+        target.surface.fill("red")
+        self.assertIsNone(target.present(window))
+        self.assertEqual(target.scale, 2)
+        self.assertEqual(target.bars, [])
+        self.assertEqual(window.get_at((159, 119)), pygame.Color("red"))
+        self.assertEqual(target.to_logical((30, 51)), (15, 25))
+
+    def test_letterbox(self) -> None:
+        """Wider windows get bars left and right, outside the logical frame."""
+        target = RenderTarget(SIZE)
+        window = pygame.Surface((200, 120))
+        target.surface.fill("red")
+        target.present(window)
+        self.assertEqual(target.dest_rect, pygame.Rect(20, 0, 160, 120))
+        self.assertEqual(
+            target.bars, [pygame.Rect(0, 0, 20, 120), pygame.Rect(180, 0, 20, 120)]
+        )
+        self.assertEqual(window.get_at((10, 60)), pygame.Color(RenderTarget.BAR_COLOR))
+        self.assertEqual(target.to_logical((20, 0)), (0, 0))
+        self.assertEqual(target.to_logical((179, 119)), (79, 59))
+        self.assertLess(target.to_logical((10, 0))[0], 0)
+
+    def test_integer_scale(self) -> None:
+        """Integer scaling rounds the scale down and centers the frame."""
+        target = RenderTarget(SIZE, ScaleMode.INTEGER)
+        target.present(pygame.Surface((250, 190)))
+        self.assertEqual(target.scale, 3)
+        self.assertEqual(target.dest_rect, pygame.Rect(5, 5, 240, 180))
+        self.assertEqual(target.to_logical((35, 65)), (10, 20))
+
+    def test_integer_scale_down(self) -> None:
+        """Windows smaller than the logical size are still scaled down."""
+        target = RenderTarget(SIZE, ScaleMode.INTEGER)
+        target.present(pygame.Surface((40, 30)))
+        self.assertEqual(target.scale, 0.5)
+        self.assertEqual(target.to_logical((20, 15)), (40, 30))
+
+    def test_same_size_draws_into_window(self) -> None:
+        """At the logical size, the window itself is drawn into."""
+        target = RenderTarget(SIZE)
+        window = pygame.Surface(SIZE)
+        target.present(window)
+        self.assertIs(target.surface, window)
+        self.assertEqual(target.to_logical((12, 34)), (12, 34))
+        target.invalidate()
+        self.assertIsNot(target.surface, window)
+
+    def test_present_regions(self) -> None:
+        """Changed regions are mapped to the window after the first frame."""
+        target = RenderTarget(SIZE)
+        window = pygame.Surface((160, 120))
+        rects = [pygame.Rect(10, 10, 5, 5)]
+        self.assertIsNone(target.present(window, rects))
+        presented = target.present(window, rects)
+        self.assertEqual(presented, [target.to_window(rects[0])])
+        self.assertTrue(presented[0].contains(pygame.Rect(20, 20, 10, 10)))
+        target.invalidate()
+        self.assertIsNone(target.present(window, rects))
+
+
+if __name__ == "__main__":
+    unittest.main()
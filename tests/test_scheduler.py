@@ -0,0 +1,120 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from src.my_game.timing import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    """Tests for `Scheduler`."""
+
+    def setUp(self) -> None:
+        self.scheduler = Scheduler()
+        self.calls = []
+
+    def record(self, name: str):
+        """Get a callback recording its calls under a name.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            Callable[[], None]: The callback.
+        """
+        return lambda: self.calls.append((name, self.scheduler.time))
+
+    def test_call_later_fires_once_when_due(self) -> None:
+        """A delayed call fires once, when due."""
+        self.scheduler.call_later(1.0, self.record("a"))
+
+        self.scheduler.update(0.5)
+        self.assertEqual(self.calls, [])
+        self.scheduler.update(0.5)
+        self.assertEqual(self.calls, [("a", 1.0)])
+        self.scheduler.update(5.0)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_due_timers_fire_in_order(self) -> None:
+        """Timers fire by due time, then scheduling order."""
+        self.scheduler.call_later(2.0, self.record("c"))
+        self.scheduler.call_later(1.0, self.record("a"))
+        self.scheduler.call_later(1.0, self.record("b"))
+        self.scheduler.update(3.0)
+
+        self.assertEqual([name for name, _ in self.calls], ["a", "b", "c"])
+
+    def test_cancelled_timer_never_fires(self) -> None:
+        """Cancelled timers don't fire."""
+        timer = self.scheduler.call_later(1.0, self.record("a"))
+        timer.cancel()
+        self.scheduler.update(2.0)
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_call_every_catches_up(self) -> None:
+        """Repeating timers fire once per interval missed."""
+        self.scheduler.call_every(0.25, self.record("a"))
+        self.scheduler.update(1.1)
+
+        self.assertEqual(len(self.calls), 4)
+
+    def test_call_every_without_catch_up(self) -> None:
+        """Without catch up, missed intervals collapse into one call."""
+        self.scheduler.call_every(0.25, self.record("a"), catch_up=False)
+        self.scheduler.update(1.1)
+        self.assertEqual(len(self.calls), 1)
+
+        # the next call is on the first interval after the long frame
+        self.scheduler.update(0.1)
+        self.assertEqual(len(self.calls), 1)
+        self.scheduler.update(0.05)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_repeating_timer_cancelled_from_its_callback(self) -> None:
+        """A repeating timer cancelled by its callback stops."""
+        timers = []
+
+        def callback() -> None:
+            self.calls.append(self.scheduler.time)
+            timers[0].cancel()
+
+        timers.append(self.scheduler.call_every(0.25, callback))
+        self.scheduler.update(1.0)
+
+        self.assertEqual(len(self.calls), 1)
+
+    def test_call_every_rejects_non_positive_interval(self) -> None:
+        """Repeating timers need a positive interval."""
+        with self.assertRaises(ValueError):
+            self.scheduler.call_every(0.0, self.record("a"))
+
+    def test_clear(self) -> None:
+        """Clearing cancels every timer."""
+        self.scheduler.call_later(1.0, self.record("a"))
+        self.scheduler.call_every(1.0, self.record("b"))
+        self.scheduler.clear()
+        self.scheduler.update(2.0)
+
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import pygame
+
+from src.my_game.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Tests for `SpatialHash`."""
+
+    def setUp(self) -> None:
+        self.spatial_hash = SpatialHash(cell_size=10)
+
+    def test_insert_spans_overlapped_cells(self) -> None:
+        """Items are stored in every cell their rect overlaps."""
+        self.spatial_hash.insert("a", pygame.Rect(5, 5, 10, 10))
+
+        self.assertIn("a", self.spatial_hash)
+        self.assertEqual(len(self.spatial_hash), 1)
+        self.assertEqual(set(self.spatial_hash.cells), {(0, 0), (0, 1), (1, 0), (1, 1)})
+
+    def test_rect_ending_on_cell_edge_stays_in_cell(self) -> None:
+        """A rect ending on a cell's edge doesn't spill into the next."""
+        self.spatial_hash.insert("a", pygame.Rect(0, 0, 10, 10))
+
+        self.assertEqual(set(self.spatial_hash.cells), {(0, 0)})
+
+    def test_remove_drops_empty_cells(self) -> None:
+        """Removing an item drops the cells left empty."""
+        self.spatial_hash.insert("a", pygame.Rect(0, 0, 20, 5))
+        self.spatial_hash.insert("b", pygame.Rect(0, 0, 5, 5))
+        self.spatial_hash.remove("a")
+
+        self.assertNotIn("a", self.spatial_hash)
+        self.assertEqual(set(self.spatial_hash.cells), {(0, 0)})
+
+    def test_move_updates_cells_and_rect(self) -> None:
+        """Moving an item updates its cells and rect."""
+        rect = pygame.Rect(0, 0, 5, 5)
+        self.spatial_hash.insert("a", rect)
+        rect.topleft = (32, 41)
+        self.spatial_hash.move("a", rect)
+
+        self.assertEqual(set(self.spatial_hash.cells), {(3, 4)})
+        self.assertEqual(self.spatial_hash.query_point((34, 43)), {"a"})
+        self.assertEqual(self.spatial_hash.query_point((2, 2)), set())
+
+    def test_insert_copies_rect(self) -> None:
+        """Changing a rect after inserting it doesn't move the item."""
+        rect = pygame.Rect(0, 0, 5, 5)
+        self.spatial_hash.insert("a", rect)
+        rect.topleft = (50, 50)
+
+        self.assertEqual(self.spatial_hash.query_point((2, 2)), {"a"})
+
+    def test_query_rect(self) -> None:
+        """Only items overlapping the rect are found."""
+        self.spatial_hash.insert("a", pygame.Rect(0, 0, 5, 5))
+        self.spatial_hash.insert("b", pygame.Rect(8, 0, 5, 5))
+        self.spatial_hash.insert("c", pygame.Rect(40, 40, 5, 5))
+
+        self.assertEqual(
+            self.spatial_hash.query_rect(pygame.Rect(3, 3, 6, 1)), {"a", "b"}
+        )
+        self.assertEqual(self.spatial_hash.query_rect((20, 20, 5, 5)), set())
+
+    def test_pairs_reports_each_overlap_once(self) -> None:
+        """Items overlapping in several cells are paired once."""
+        self.spatial_hash.insert("a", pygame.Rect(0, 0, 15, 15))
+        self.spatial_hash.insert("b", pygame.Rect(5, 5, 15, 15))
+        self.spatial_hash.insert("c", pygame.Rect(50, 50, 5, 5))
+
+        pairs = self.spatial_hash.pairs()
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(set(next(iter(pairs))), {"a", "b"})
+
+    def test_clear(self) -> None:
+        """Clearing removes every item."""
+        self.spatial_hash.insert("a", pygame.Rect(0, 0, 5, 5))
+        self.spatial_hash.clear()
+
+        self.assertEqual(len(self.spatial_hash), 0)
+        self.assertEqual(self.spatial_hash.cells, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
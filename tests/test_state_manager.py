@@ -0,0 +1,245 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pygame
+
+from src.my_game.game_states import GameStates
+from src.my_game.managers import StateManager
+
+
+class FakeState:
+    """State recording its calls, filling the surface when drawn."""
+
+    color: pygame.Color
+    calls: List[str]
+
+    def __init__(self, color: pygame.Color, calls: List[str]) -> None:
+        self.color = color
+        self.calls = calls
+
+    def on_suspend(self) -> None:
+        """Record the suspension."""
+        self.calls.append(f"suspend {self.color}")
+
+    def on_resume(self) -> None:
+        """Record the resumption."""
+        self.calls.append(f"resume {self.color}")
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Fill the surface.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+            alpha (float, optional): Unused. Defaults to 1.0.
+        """
+        _ = alpha
+        self.calls.append(f"draw {self.color}")
+        surface.fill(self.color)
+
+    def invalidate(self) -> None:
+        """Record the invalidation."""
+        self.calls.append(f"invalidate {self.color}")
+
+    def draw_dirty(
+        self,
+        surface: pygame.Surface,
+        background: pygame.Color | pygame.Surface,
+        alpha: float = 1.0,
+    ) -> List[pygame.Rect]:
+        """Restore the whole surface from the background.
+
+        Args:
+            surface (pygame.Surface): Surface to draw onto.
+            background (pygame.Color | pygame.Surface): Background to restore.
+            alpha (float, optional): Unused. Defaults to 1.0.
+
+        Returns:
+            List[pygame.Rect]: The whole surface.
+        """
+        _ = alpha
+        if isinstance(background, pygame.Surface):
+            surface.blit(background, (0, 0))
+        else:
+            surface.fill(background)
+        return [surface.get_rect()]
+
+
+RED: pygame.Color = pygame.Color("red")
+BLUE: pygame.Color = pygame.Color("blue")
+
+
+class TestStateManager(unittest.TestCase):
+    """Tests for `StateManager`."""
+
+    def setUp(self) -> None:
+        self.calls: List[str] = []
+        self.menu = FakeState(RED, self.calls)
+        self.pause = FakeState(BLUE, self.calls)
+        self.manager = StateManager()
+        self.manager.add(GameStates.MAIN_MENU, self.menu)
+
+    def test_first_added_is_current(self) -> None:
+        """The first state added becomes the current state."""
+        self.manager.add(GameStates.PAUSE_MENU, self.pause)
+        self.assertEqual(self.manager.get_state(), GameStates.MAIN_MENU)
+        self.assertEqual(self.calls, [f"resume {RED}"])
+
+    def test_push_and_pop(self) -> None:
+        """Pushing suspends the current state, popping resumes it."""
+        self.manager.add(GameStates.PAUSE_MENU, self.pause)
+        self.calls.clear()
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.assertEqual(self.manager.get_state(), GameStates.PAUSE_MENU)
+        self.assertEqual(self.manager.previous_state, GameStates.MAIN_MENU)
+        self.manager.pop()
+        self.assertEqual(self.manager.get_state(), GameStates.MAIN_MENU)
+        self.assertEqual(
+            self.calls,
+            [f"suspend {RED}", f"resume {BLUE}", f"suspend {BLUE}", f"resume {RED}"],
+        )
+
+    def test_pop_keeps_last_state(self) -> None:
+        """The bottom state of the stack is never popped."""
+        self.manager.pop()
+        self.assertEqual(self.manager.stack, [GameStates.MAIN_MENU])
+
+    def test_go_back_pops(self) -> None:
+        """Going back from a pushed state pops it."""
+        self.manager.add(GameStates.PAUSE_MENU, self.pause)
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.manager.go_back()
+        self.assertEqual(self.manager.stack, [GameStates.MAIN_MENU])
+
+    def test_change_state_leaves_stack(self) -> None:
+        """Changing state replaces the whole stack."""
+        self.manager.add(GameStates.PAUSE_MENU, self.pause)
+        self.manager.add(GameStates.GAMEPLAY, FakeState(RED, []))
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.manager.change_state(GameStates.GAMEPLAY)
+        self.assertEqual(self.manager.stack, [GameStates.GAMEPLAY])
+
+    def test_register_constructs_lazily(self) -> None:
+        """Registered states are constructed once, when first entered."""
+        constructed: List[FakeState] = []
+
+        def factory() -> FakeState:
+            constructed.append(self.pause)
+            return self.pause
+
+        self.manager.register(GameStates.PAUSE_MENU, factory)
+        self.assertEqual(constructed, [])
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.manager.pop()
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.assertEqual(constructed, [self.pause])
+
+    def test_preload(self) -> None:
+        """Preloaded states are constructed on the executor and reused."""
+        constructed: List[FakeState] = []
+
+        def factory() -> FakeState:
+            constructed.append(self.pause)
+            return self.pause
+
+        self.manager.register(GameStates.PAUSE_MENU, factory)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.manager.preload(GameStates.PAUSE_MENU, executor)
+            self.manager.preload(GameStates.PAUSE_MENU, executor)
+        self.assertEqual(constructed, [self.pause])
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.assertIs(self.manager.get(GameStates.PAUSE_MENU), self.pause)
+        self.assertEqual(constructed, [self.pause])
+
+    def test_unload(self) -> None:
+        """States on the stack aren't unloaded, others are reconstructed."""
+        constructed: List[FakeState] = []
+
+        def factory() -> FakeState:
+            constructed.append(self.pause)
+            return self.pause
+
+        self.manager.register(GameStates.PAUSE_MENU, factory)
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.manager.unload(GameStates.PAUSE_MENU)
+        self.assertIn(GameStates.PAUSE_MENU, self.manager.states)
+        self.manager.pop()
+        self.manager.unload(GameStates.PAUSE_MENU)
+        self.assertNotIn(GameStates.PAUSE_MENU, self.manager.states)
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.assertEqual(len(constructed), 2)
+
+
+class TestStateManagerOverlay(unittest.TestCase):
+    """Tests for overlay states of `StateManager`."""
+
+    def setUp(self) -> None:
+        self.calls: List[str] = []
+        self.menu = FakeState(RED, self.calls)
+        self.pause = FakeState(BLUE, self.calls)
+        self.manager = StateManager()
+        self.manager.add(GameStates.MAIN_MENU, self.menu)
+        self.manager.add(GameStates.PAUSE_MENU, self.pause, is_overlay=True)
+        self.surface = pygame.Surface((8, 8))
+
+    def test_underlay(self) -> None:
+        """Only overlays with a state below them have an underlay."""
+        self.assertIsNone(self.manager.get_underlay())
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.assertEqual(self.manager.get_underlay(), GameStates.MAIN_MENU)
+        self.manager.change_state(GameStates.PAUSE_MENU)
+        self.assertIsNone(self.manager.get_underlay())
+
+    def test_draw_snapshots_underlay_once(self) -> None:
+        """The state under an overlay is drawn once into the snapshot."""
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.calls.clear()
+        self.manager.draw(self.surface)
+        self.manager.draw(self.surface)
+        self.assertEqual(self.calls, [f"draw {RED}", f"draw {BLUE}", f"draw {BLUE}"])
+        self.assertEqual(self.manager.snapshot.get_at((0, 0)), RED)
+
+    def test_snapshot_dropped(self) -> None:
+        """The snapshot is dropped on transitions and invalidation."""
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.manager.draw(self.surface)
+        self.manager.invalidate()
+        self.assertIsNone(self.manager.snapshot)
+        self.manager.draw(self.surface)
+        self.manager.pop()
+        self.assertIsNone(self.manager.snapshot)
+
+    def test_draw_dirty_restores_from_snapshot(self) -> None:
+        """Overlays restore changed regions from the snapshot."""
+        self.manager.push(GameStates.PAUSE_MENU)
+        self.calls.clear()
+        rects = self.manager.draw_dirty(self.surface, pygame.Color("black"))
+        self.assertEqual(rects, [self.surface.get_rect()])
+        self.assertEqual(self.surface.get_at((0, 0)), RED)
+        self.assertEqual(self.calls, [f"invalidate {BLUE}", f"draw {RED}"])
+        self.calls.clear()
+        self.manager.draw_dirty(self.surface, pygame.Color("black"))
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
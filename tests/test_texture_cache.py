@@ -0,0 +1,130 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import pygame
+
+from src.my_game.managers import TextureCache
+
+# a 32x32 surface of 4 bytes per pixel
+ATLAS_SIZE: int = 32 * 32 * 4
+
+
+def make_atlas() -> pygame.Surface:
+    """Create an atlas surface of `ATLAS_SIZE` bytes.
+
+    Returns:
+        pygame.Surface: The surface.
+    """
+    return pygame.Surface((32, 32), depth=32)
+
+
+class TestTextureCache(unittest.TestCase):
+    """Tests for `TextureCache`."""
+
+    def setUp(self) -> None:
+        self.cache = TextureCache(budget=2 * ATLAS_SIZE)
+
+    def add(self, key: str) -> pygame.Surface:
+        """Add an atlas holding a texture named "texture".
+
+        Args:
+            key (str): Key of the atlas.
+
+        Returns:
+            pygame.Surface: The texture.
+        """
+        surface = make_atlas()
+        texture = surface.subsurface((0, 0, 8, 8))
+        self.cache.add(key, surface, {"texture": texture})
+        return texture
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Over budget, the least recently used atlas is evicted."""
+        self.add("a")
+        self.add("b")
+        self.cache.get("a")
+        self.add("c")
+
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.cache.resident_bytes, 2 * ATLAS_SIZE)
+
+    def test_handles_keep_atlases_resident(self) -> None:
+        """Atlases with handles on them aren't evicted."""
+        texture = self.add("a")
+        handle = self.cache.acquire("a", "texture")
+        self.assertIs(handle.surface, texture)
+
+        self.add("b")
+        self.add("c")
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+
+    def test_release_evicts_when_over_budget(self) -> None:
+        """Releasing the last handle evicts the atlas if over budget."""
+        self.add("a")
+        self.add("b")
+        first = self.cache.acquire("a", "texture")
+        self.cache.acquire("b", "texture")
+        self.add("c")
+        self.assertEqual(self.cache.resident_bytes, 3 * ATLAS_SIZE)
+
+        first.release()
+        self.assertNotIn("a", self.cache)
+        self.assertEqual(self.cache.resident_bytes, 2 * ATLAS_SIZE)
+
+    def test_release_is_idempotent(self) -> None:
+        """Releasing a handle twice only releases one reference."""
+        self.add("a")
+        first = self.cache.acquire("a", "texture")
+        second = self.cache.acquire("a", "texture")
+
+        first.release()
+        first.release()
+        self.assertEqual(self.cache.get("a").ref_count, 1)
+
+        with second:
+            pass
+        self.assertTrue(second.is_released)
+        self.assertEqual(self.cache.get("a").ref_count, 0)
+
+    def test_replacing_an_atlas_keeps_references(self) -> None:
+        """Replacing an atlas keeps the handles taken on it."""
+        self.add("a")
+        self.cache.acquire("a", "texture")
+        self.add("a")
+
+        self.assertEqual(self.cache.get("a").ref_count, 1)
+        self.assertEqual(self.cache.resident_bytes, ATLAS_SIZE)
+
+    def test_transforms_count_toward_budget(self) -> None:
+        """Transformed textures count toward their atlas' size."""
+        self.add("a")
+        self.add("b")
+        self.cache.add_transform("b", ("texture", 2.0, 0.0, False, False), make_atlas())
+
+        self.assertNotIn("a", self.cache)
+        self.assertEqual(self.cache.get("b").size, 2 * ATLAS_SIZE)
+        self.assertEqual(self.cache.resident_bytes, 2 * ATLAS_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
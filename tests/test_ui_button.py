@@ -0,0 +1,107 @@
+"""
+My journey toward learning game development using Python. 
+Copyright (C) 2024  Ramon Meza
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pathlib
+import unittest
+
+from unittest import mock
+
+import pygame
+
+from src.my_game.managers import FontManager
+from src.my_game.ui.widgets import UIButtonStyle, clear_render_cache, render_button
+from src.my_game.ui.widgets import ui_button
+
+FONT_PATH: str = str(
+    pathlib.Path(__file__).parent.parent / "data/fonts/Rijusans-Regular.ttf"
+)
+
+
+def make_style(font: pygame.font.Font) -> UIButtonStyle:
+    """Create a button style.
+
+    Args:
+        font (pygame.font.Font): Font of the text.
+
+    Returns:
+        UIButtonStyle: The style.
+    """
+    return UIButtonStyle(
+        font=font,
+        font_color=pygame.Color("white"),
+        bg_color=pygame.Color("black"),
+        hover_color=pygame.Color("gray"),
+        press_color=pygame.Color("red"),
+        padding=(4, 2),
+    )
+
+
+class TestRenderButton(unittest.TestCase):
+    """Tests for the cache of `render_button`."""
+
+    def setUp(self) -> None:
+        pygame.font.init()
+        clear_render_cache()
+        self.font = pygame.font.Font(None, 12)
+        self.style = make_style(self.font)
+
+    def tearDown(self) -> None:
+        clear_render_cache()
+
+    def test_same_text_and_style_share_images(self) -> None:
+        """Rendering a button again reuses its images."""
+        images = render_button("Play", self.style)
+
+        self.assertIs(render_button("Play", make_style(self.font)), images)
+        self.assertIsNot(render_button("Quit", self.style), images)
+
+    def test_cache_is_bounded(self) -> None:
+        """The least recently used images are evicted."""
+        with mock.patch.object(ui_button, "RENDER_CACHE_SIZE", 2):
+            first = render_button("a", self.style)
+            second = render_button("b", self.style)
+            render_button("a", self.style)
+            render_button("c", self.style)
+
+            self.assertIs(render_button("a", self.style), first)
+            self.assertIsNot(render_button("b", self.style), second)
+
+    def test_clear_by_font(self) -> None:
+        """Clearing a font only drops the images rendered with it."""
+        other = make_style(pygame.font.Font(None, 20))
+        dropped = render_button("a", self.style)
+        kept = render_button("a", other)
+
+        clear_render_cache(self.font)
+        self.assertIs(render_button("a", other), kept)
+        self.assertIsNot(render_button("a", self.style), dropped)
+
+    def test_font_eviction_clears_images(self) -> None:
+        """Images go when `FontManager` evicts their font."""
+        font_manager = FontManager(font_cache_size=1)
+        font_manager.on_evict = clear_render_cache
+        font_manager.add(FONT_PATH)
+        style = make_style(font_manager.get(size=20))
+        images = render_button("a", style)
+        font_manager.get(size=30)
+
+        self.assertIsNot(render_button("a", style), images)
+
+
+if __name__ == "__main__":
+    unittest.main()